@@ -2,7 +2,7 @@
 import os
 from logging import INFO
 
-from lmpy.point import PointCsvWriter
+from lmpy.point import PointBatch, PointCsvWriter
 
 
 DEFAULT_MAX_WRITERS = 100
@@ -181,6 +181,8 @@ class OccurrenceSplitter:
 
         for points in reader:
             report['input_records'] += len(points)
+            # Build point columns once and carry them through the wrangler chain
+            points = PointBatch(points)
             for wrangler in wranglers:
                 if points:
                     in_count = len(points)
@@ -116,82 +116,68 @@ class TreeEncoder:
         return False
 
     # ..............................
-    def _build_p_branch_length_values(self, node):
-        """Recurse through the tree to get P matrix values for node / tips.
+    def _get_node_arrays(self):
+        """Get array representations of the tree used for encoding.
 
-        Args:
-            node (dendropy.Node): The current clade.
+        Note:
+            Tips are numbered in preorder so that the tips descending from any node
+                occupy a contiguous range.  This lets the encoding fill each node
+                column with array slices instead of recursing through the tree and
+                building per-tip lists.
 
         Returns:
-            tuple: A tuple of branch length dictionary, sum of branch lengths, and
-                p-values dictionary.
+            tuple: A tuple of a dictionary of node index by node, the tip range start
+                and stop arrays for each node, the depth of each node, the sum of
+                branch lengths in the clade of each node, the distance of each node
+                from the root with each branch length divided by the number of tips
+                sharing it, and an array of the PAM column index for each tip.
         """
-        # Dictionary of branch length lists, bottom-up from tip to current node
-        bl_dict = {}
-
-        clade_bl = node.edge_length  # To avoid lookups
-
-        # This is the sum of all branch lengths in the clade and will be used
-        #    as the denominator for the p value for each tip to this node.  See
-        #    the literature for more information.  We will initialize with the
-        #    branch length of this clade because it will always be added
-        #    whether we are at a tip or an internal node.
-        bl_sum = clade_bl
-
-        # Dictionary of dictionaries of p values, first key is node path id,
-        #    sub-keys are tip matrix indices for that node
-        p_vals_dict = {}
-
-        if node.num_child_nodes() > 0:  # Assume this is two since binary
-            clade_p_vals = {}
-            multipliers = [-1.0, 1.0]  # One positive, one negative
-            np.random.shuffle(multipliers)
-
-            for child in node.child_nodes():
-                (
-                    child_bl_dict,
-                    child_bl_sum,
-                    child_p_val_dict,
-                ) = self._build_p_branch_length_values(child)
-                multiplier = multipliers.pop(0)
-
-                # Extend the p values dictionary
-                p_vals_dict.update(child_p_val_dict)
-
-                # Add this child's branch length sum to the clade's branch
-                #    length sum
-                bl_sum += child_bl_sum
-                child_bl = child.edge_length
-
-                # We will add this value to the branch length list for all of
-                #    the tips in this clade.  It is the branch length of this
-                #    clade divided by the number of tips in the clade.
-                add_val = 1.0 * child_bl / len(child_bl_dict)
-
-                # Process eac of the tips in the child_bl_dict
-                for k, child_bl_k in child_bl_dict.items():
-                    # The formula for calculating the p value is:
-                    #    P(tip)(node) = (l1 + l2/2 + l3/3 + ... ln/n) / sum of
-                    #        branch lengths to node
-                    #    The value is arbitrarily set to be positive for one
-                    #        child and negative for the other
-                    #    The 'l' term is the length of a branch  and it is
-                    #        divided by the number of tips that share that
-                    #        branch.
-                    tip_bls = child_bl_k + [add_val]
-
-                    # Add the p value to p_vals_dict
-                    clade_p_vals[k] = multiplier * sum(tip_bls) / child_bl_sum
-
-                    # Add to bl_dict with this branch length
-                    bl_dict[k] = tip_bls
-
-            p_vals_dict[node.label] = clade_p_vals
-
-        else:  # We are at a tip
-            bl_dict = {self.labels.index(node.taxon.label): []}
-
-        return bl_dict, bl_sum, p_vals_dict
+        label_idx = {label: i for i, label in enumerate(self.labels)}
+        nodes = list(self.tree.preorder_node_iter())
+        node_idx = {node: i for i, node in enumerate(nodes)}
+        num_nodes = len(nodes)
+
+        edge_lengths = np.zeros(num_nodes, dtype=float)
+        parents = np.full(num_nodes, -1, dtype=int)
+        tip_start = np.zeros(num_nodes, dtype=int)
+        tip_stop = np.zeros(num_nodes, dtype=int)
+        tip_rows = []
+        for i, node in enumerate(nodes):
+            if node.parent_node is not None:
+                parents[i] = node_idx[node.parent_node]
+            if node.edge_length is not None:
+                edge_lengths[i] = node.edge_length
+            if node.is_leaf():
+                tip_start[i] = len(tip_rows)
+                tip_stop[i] = tip_start[i] + 1
+                tip_rows.append(label_idx[node.taxon.label])
+
+        # Postorder (reverse preorder) pass for tip ranges and clade branch sums
+        clade_bl_sums = edge_lengths.copy()
+        for i in range(num_nodes - 1, 0, -1):
+            parent = parents[i]
+            if nodes[parent].child_nodes()[0] is nodes[i]:
+                tip_start[parent] = tip_start[i]
+            tip_stop[parent] = max(tip_stop[parent], tip_stop[i])
+            clade_bl_sums[parent] += clade_bl_sums[i]
+
+        # Preorder pass for depths and distances from the root
+        num_tips = tip_stop - tip_start
+        depths = np.zeros(num_nodes, dtype=int)
+        distances = np.zeros(num_nodes, dtype=float)
+        for i in range(1, num_nodes):
+            depths[i] = depths[parents[i]] + 1
+            distances[i] = distances[parents[i]] + edge_lengths[i] / num_tips[i]
+
+        return (
+            node_idx,
+            tip_start,
+            tip_stop,
+            depths,
+            clade_bl_sums,
+            distances,
+            np.array(tip_rows, dtype=int),
+        )
 
     # ..............................
     def _build_p_matrix_no_branch_lengths(self):
@@ -261,72 +247,25 @@ class TreeEncoder:
         """
         # .......................
         # Initialize the matrix
-        internal_node_labels = [n.label for n in self.tree.nodes() if not n.is_leaf()]
-
-        # We need a mapping of node path id to matrix column.  I don't think
-        #     order matters
-        node_col_idx = dict(zip(internal_node_labels, range(len(internal_node_labels))))
+        internal_nodes = [n for n in self.tree.nodes() if not n.is_leaf()]
+        internal_node_labels = [n.label for n in internal_nodes]
+        p_mtx = np.zeros((len(self.labels), len(internal_nodes)), dtype=float)
 
-        mtx = Matrix(
-            np.zeros((len(self.labels), len(internal_node_labels)), dtype=float),
-            headers={'0': self.labels, '1': internal_node_labels},
-        )
-
-        # Get the list of tip proportion lists
-        # Note: Which tip each of the lists belongs to doesn't really matter
-        #    but recursion will start at the top and go to the bottom of the
-        #    tree tips.
         self.tree.seed_node._set_edge_length(0.0)
-        tip_props = self._build_p_matrix_tip_proportion_list(
-            self.tree.seed_node, visited=[]
-        )
-
-        # The matrix index of the tip in the PAM maps to the row index of P
-        for row_idx, tip_prop in tip_props:
-            for node_clade_id, val in tip_prop:
-                mtx[row_idx][node_col_idx[node_clade_id]] = val
-
-        return mtx
-
-    # ..............................
-    def _build_p_matrix_tip_proportion_list(self, node, visited=None):
-        """Builds a list of tip proportions for the p matrix w/o branch lengths.
-
-        Args:
-            node (dendropy.Node): The current clade.
-            visited (:obj:`None` or :obj:`list` of :obj:`tuple`): A list of
-                (node path id, proportion) tuples.
-
-        Note:
-            Proportion for each visited node is divided by two as we go
-                towards the tips at each hop.
-
-        Returns:
-            list: A list of tip proportions.
-        """
-        if visited is None:
-            visited = []  # pragma: no cover
-
-        tip_props = []
-        if node.num_child_nodes() > 0:  # Assume this is two since binary
-            # First divide all existing visited by two
-            new_visited = [(idx, val / 2) for idx, val in visited]
-            # Recurse.  Left is negative, right is positive
-            left_child, right_child = node.child_nodes()
-            tip_props.extend(
-                self._build_p_matrix_tip_proportion_list(
-                    left_child, visited=new_visited + [(node.label, -1.0)]
+        node_idx, tip_start, tip_stop, depths, _, _, tip_rows = self._get_node_arrays()
+        tip_depths = depths[[node_idx[n] for n in self.tree.leaf_node_iter()]]
+
+        # Each visited node proportion is halved for every hop towards the tips.
+        #     Left is negative, right is positive
+        for col_idx, node in enumerate(internal_nodes):
+            for multiplier, child in zip([-1.0, 1.0], node.child_nodes()):
+                start = tip_start[node_idx[child]]
+                stop = tip_stop[node_idx[child]]
+                p_mtx[tip_rows[start:stop], col_idx] = multiplier * 0.5 ** (
+                    tip_depths[start:stop] - depths[node_idx[node]] - 1
                 )
-            )
-            tip_props.extend(
-                self._build_p_matrix_tip_proportion_list(
-                    right_child, visited=new_visited + [(node.label, 1.0)]
-                )
-            )
-        else:
-            tip_props.append((self.labels.index(node.taxon.label), visited))
 
-        return tip_props
+        return Matrix(p_mtx, headers={'0': self.labels, '1': internal_node_labels})
 
     # ..............................
     def _build_p_matrix_with_branch_lengths(self):
@@ -384,26 +323,46 @@ class TreeEncoder:
         See:
             Literature supplemental material.
 
+        Raises:
+            ZeroDivisionError: Raised if the branch lengths of a clade sum to zero.
+
         Returns:
             Matrix: An encoded phylogeny matrix.
         """
-        # We only need the P-values dictionary
-        # TODO: Is there a better way to do this so the length of the r?
         self.tree.seed_node._set_edge_length(0.0)
-        _, _, p_val_dict = self._build_p_branch_length_values(self.tree.seed_node)
-
-        # Initialize the matrix
-        mtx = Matrix(
-            np.zeros((len(self.labels), len(p_val_dict)), dtype=float),
-            headers={'0': self.labels, '1': list(p_val_dict.keys())},
+        (
+            node_idx, tip_start, tip_stop, _, clade_bl_sums, distances, tip_rows
+        ) = self._get_node_arrays()
+        tip_distances = distances[[node_idx[n] for n in self.tree.leaf_node_iter()]]
+
+        # One child of each node is positive and the other negative, chosen randomly
+        node_multipliers = {}
+        for node in self.tree.preorder_internal_node_iter():
+            multipliers = [-1.0, 1.0]
+            np.random.shuffle(multipliers)
+            node_multipliers[node] = multipliers
+
+        # Columns are internal nodes in postorder
+        internal_nodes = list(self.tree.postorder_internal_node_iter())
+        p_mtx = np.zeros((len(self.labels), len(internal_nodes)), dtype=float)
+
+        for col_idx, node in enumerate(internal_nodes):
+            for multiplier, child in zip(node_multipliers[node], node.child_nodes()):
+                child_idx = node_idx[child]
+                if clade_bl_sums[child_idx] == 0:
+                    child_name = child.taxon.label if child.is_leaf() else child.label
+                    raise ZeroDivisionError(
+                        f'Clade {child_name} has a total branch length of zero'
+                    )
+                start = tip_start[child_idx]
+                stop = tip_stop[child_idx]
+                # The sum of (l1 + l2/2 + l3/3 + ... ln/n) from each tip to the child
+                #     is the difference of their distances from the root
+                p_mtx[tip_rows[start:stop], col_idx] = multiplier * (
+                    tip_distances[start:stop] - distances[node_idx[node]]
+                ) / clade_bl_sums[child_idx]
+
+        return Matrix(
+            p_mtx,
+            headers={'0': self.labels, '1': [n.label for n in internal_nodes]},
         )
-
-        # We need a mapping of node path id to matrix column.  I don't think
-        #     order matters
-        node_col_idx = dict(zip(p_val_dict.keys(), range(len(p_val_dict.keys()))))
-
-        for node_clade_id, p_val_node_val in p_val_dict.items():
-            for tip_mtx_idx, tip_p_vals in p_val_node_val.items():
-                mtx[int(tip_mtx_idx)][node_col_idx[node_clade_id]] = tip_p_vals
-
-        return mtx
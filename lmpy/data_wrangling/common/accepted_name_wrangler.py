@@ -1,12 +1,45 @@
 """Module containing a data wrangler base class for resolving taxon names."""
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
 from logging import DEBUG
+import mmap
+import os
+import re
 import requests
+import sys
+import threading
 import time
-import urllib
+import urllib.parse
 
 from lmpy.data_wrangling.base import _DataWrangler
 
+# Sentinel for names missing from the name map, which may map names to None
+_MISSING = object()
+# Name map files at least this many bytes are read through a memory map
+MMAP_MIN_SIZE = 1024 * 1024
+# GBIF requests are throttled across threads, this holds the last request time
+_GBIF_LOCK = threading.Lock()
+_last_gbif_request = [0.0]
+
+
+# .....................................................................................
+def _wait_for_gbif(wait_time):
+    """Wait until a GBIF request can be sent without exceeding the request rate.
+
+    Requests from all threads are spaced at least `wait_time` seconds apart.
+
+    Args:
+        wait_time (number or None): The minimum number of seconds between requests.
+    """
+    if wait_time is None:
+        return
+    with _GBIF_LOCK:
+        delay = _last_gbif_request[0] + wait_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        _last_gbif_request[0] = time.monotonic()
+
 
 # .....................................................................................
 def _resolve_gbif_synonym_match(match_response, wait_time=1):
@@ -14,18 +47,18 @@ def _resolve_gbif_synonym_match(match_response, wait_time=1):
 
     Args:
         match_response (urllib.Response): A response from a GBIF species match query.
-        wait_time (number): A number of seconds to before request to avoid server ire.
+        wait_time (number): The minimum number of seconds between requests to avoid
+            server ire.
 
     Returns:
         namestr: An accepted canonical name for the GBIF acceptedUsageKey.
     """
     sciname = canonical = None
-    if wait_time is not None:
-        time.sleep(wait_time)
     if 'acceptedUsageKey' in match_response.keys():
         taxon_key = match_response['acceptedUsageKey']
         # Get name
         url = f'http://api.gbif.org/v1/species/{taxon_key}'
+        _wait_for_gbif(wait_time)
         try:
             response = requests.get(url).json()
         except Exception as err:
@@ -42,53 +75,145 @@ def _resolve_gbif_synonym_match(match_response, wait_time=1):
 
 
 # .....................................................................................
-def resolve_names_gbif(names, wait_time=1):
+def _resolve_name_gbif(name_str, wait_time=1):
+    """Resolve a single name using GBIF's taxonomic name resolution service.
+
+    Args:
+        name_str (str): A name string to resolve.
+        wait_time (number): The minimum number of seconds between requests to avoid
+            server ire.
+
+    Returns:
+        str or None: The resolved canonical name or None if it could not be resolved.
+    """
+    # Get name
+    other_filters = {'name': name_str.strip(), 'verbose': 'true'}
+    url = 'http://api.gbif.org/v1/species/match?{}'.format(
+        urllib.parse.urlencode(other_filters))
+    _wait_for_gbif(wait_time)
+    try:
+        response = requests.get(url).json()
+    except Exception as err:
+        print(err)
+        print("Sleep and try again...")
+        time.sleep(60)
+        response = requests.get(url).json()
+
+    resolved_name = None
+    if 'status' in response.keys():
+        if response['status'].lower() == 'accepted':
+            canonical1 = response['canonicalName']
+            resolved_name = canonical1
+            print(
+                f"{name_str} resolved to accepted name " +
+                f"{response['scientificName']} with canonical {canonical1}")
+        # TODO: Discuss: query returned usageKey of synonym for accepted taxa
+        elif response['status'].lower() == 'synonym':
+            sciname2, canonical2 = _resolve_gbif_synonym_match(
+                response, wait_time=wait_time)
+            resolved_name = canonical2
+            print(
+                f"{name_str} resolved to synonym " +
+                f"{response['scientificName']} which resolved to accepted " +
+                f"name {sciname2} with canonical {canonical2}")
+
+    return resolved_name
+
+
+# .....................................................................................
+def resolve_names_gbif(names, wait_time=1, max_workers=1):
     """Resolve names using GBIF's taxonomic name resolution service.
 
     Args:
         names (list of str): A list of name strings to resolve.
-        wait_time (number): A number of seconds to wait after each request to avoid
-            server ire.
+        wait_time (number): The minimum number of seconds between requests to avoid
+            server ire.  This applies across all workers.
+        max_workers (int): The maximum number of names to resolve concurrently.  The
+            default of 1 sends one request at a time.
 
     Returns:
         dict: Input names are keys and resolved name or None are values.
     """
-    resolved_names = {}
-    for name_str in names:
-        # Get name
-        other_filters = {'name': name_str.strip(), 'verbose': 'true'}
-        url = 'http://api.gbif.org/v1/species/match?{}'.format(
-            urllib.parse.urlencode(other_filters))
-        try:
-            response = requests.get(url).json()
-        except Exception as err:
-            print(err)
-            print("Sleep and try again...")
-            time.sleep(60)
-            response = requests.get(url).json()
+    names = list(names)
+    if max_workers > 1 and len(names) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            resolved = executor.map(
+                lambda name_str: _resolve_name_gbif(name_str, wait_time=wait_time),
+                names
+            )
+            return dict(zip(names, resolved))
+    return {
+        name_str: _resolve_name_gbif(name_str, wait_time=wait_time)
+        for name_str in names
+    }
 
-        resolved_names[name_str] = None
-        if 'status' in response.keys():
-            if response['status'].lower() == 'accepted':
-                canonical1 = response['canonicalName']
-                resolved_names[name_str] = canonical1
-                print(
-                    f"{name_str} resolved to accepted name " +
-                    f"{response['scientificName']} with canonical {canonical1}")
-            # TODO: Discuss: query returned usageKey of synonym for accepted taxa
-            elif response['status'].lower() == 'synonym':
-                sciname2, canonical2 = _resolve_gbif_synonym_match(
-                    response, wait_time=wait_time)
-                resolved_names[name_str] = canonical2
-                print(
-                    f"{name_str} resolved to synonym " +
-                    f"{response['scientificName']} which resolved to accepted " +
-                    f"name {sciname2} with canonical {canonical2}")
 
-        if wait_time is not None:
-            time.sleep(wait_time)
+# .....................................................................................
+def _read_large_name_map_file(filename):
+    """Read a large name map file through a memory map.
 
-    return resolved_names
+    Args:
+        filename (str): The path of a JSON or CSV name map file.
+
+    Returns:
+        dict: A mapping of original names to accepted names.
+    """
+    name_map = {}
+    with open(filename, mode='rb') as in_file:
+        with mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ) as map_file:
+            # JSON name maps are objects, anything else is treated as CSV
+            first_char = re.search(rb'\S', map_file)
+            is_json = first_char is not None and first_char.group() == b'{'
+            if not is_json:
+                for line in iter(map_file.readline, b''):
+                    # Split on bytes, accepted names may contain commas
+                    in_name, out_name = line.strip().split(b',', 1)
+                    name_map[in_name.decode()] = out_name.decode()
+        if is_json:
+            # Parse from the file, the memory map would only add a copy of the data
+            in_file.seek(0)
+            name_map = json.load(in_file)
+    return name_map
+
+
+# .....................................................................................
+@lru_cache(maxsize=64)
+def _read_name_map_file(filename, mtime, size):
+    """Read a name map file, caching the result for unchanged files.
+
+    Args:
+        filename (str): The absolute path of a JSON or CSV name map file.
+        mtime (int): The modification time of the file, in nanoseconds.
+        size (int): The size of the file in bytes.
+
+    Note:
+        The modification time and size are only used as part of the cache key so that
+            a changed file is read again.
+
+    Returns:
+        dict: A mapping of original names to accepted names.  This dictionary is
+            shared by the cache and should not be modified.
+    """
+    name_map = {}
+    if size >= MMAP_MIN_SIZE:
+        name_map = _read_large_name_map_file(filename)
+    else:
+        try:
+            # Try to load JSON names
+            with open(filename, mode='rt') as in_json:
+                name_map = json.load(in_json)
+        except json.JSONDecodeError:  # Not a valid json file, try csv
+            with open(filename, mode='rt') as in_csv:
+                for line in in_csv:
+                    in_name, out_name = line.strip().split(',', 1)
+                    name_map[in_name] = out_name
+    # Intern names so lookups of point species names can match by identity
+    return {
+        sys.intern(in_name): (
+            sys.intern(out_name) if isinstance(out_name, str) else out_name
+        )
+        for in_name, out_name in name_map.items()
+    }
 
 
 # .....................................................................................
@@ -119,6 +244,9 @@ class _AcceptedNameWrangler(_DataWrangler):
         self.out_name_map_filename = out_map_filename
         self.map_write_interval = map_write_interval
         self._updated_since_write = 0
+        # Names resolved since the output map file was last written
+        self._unwritten_names = []
+        self._map_file_written = False
         self.out_map_format = out_map_format
         if name_map is not None:
             self._load_name_map(name_map)
@@ -135,11 +263,11 @@ class _AcceptedNameWrangler(_DataWrangler):
         if all(
             [
                 self.out_name_map_filename is not None,
-                self._updated_since_write >= 0
+                not self._map_file_written or len(self._unwritten_names) > 0
             ]
         ):
             try:
-                self.write_map_to_file(self.out_name_map_filename, self.out_map_format)
+                self._sync_map_file()
             except Exception as err:
                 print(f'Failed to write names map on destruction: {err}.')
                 print(
@@ -161,18 +289,16 @@ class _AcceptedNameWrangler(_DataWrangler):
         if isinstance(name_map, dict):
             self.name_map = name_map
         else:
-            self.name_map = {}
             try:
-                # Try to load JSON names
-                with open(name_map, mode='rt') as in_json:
-                    self.name_map = json.load(in_json)
-            except json.JSONDecodeError:  # Not a valid json file, try csv
-                with open(name_map, mode='rt') as in_csv:
-                    for line in in_csv:
-                        in_name, out_name = line.strip().split(',')
-                        self.name_map[in_name] = out_name
+                file_stat = os.stat(name_map)
             except FileNotFoundError:
                 raise
+            # Copy the cached map so that resolved names are not shared
+            self.name_map = dict(
+                _read_name_map_file(
+                    os.path.abspath(name_map), file_stat.st_mtime_ns, file_stat.st_size
+                )
+            )
 
     # .......................
     def resolve_names(self, names):
@@ -189,13 +315,13 @@ class _AcceptedNameWrangler(_DataWrangler):
         resolved_names = {}
         unmatched_names = set()
         for name in names:
-            if name in self.name_map.keys():
-                # Use previously resolved name if present
-                resolved_names[name] = self.name_map[name]
-            else:
+            # Use previously resolved name if present
+            resolved = self.name_map.get(name, _MISSING)
+            if resolved is _MISSING:
                 # Save all unmatched names
                 unmatched_names.add(name)
-                resolved_names[name] = None
+                resolved = None
+            resolved_names[name] = resolved
 
         # If we have a name resolver and unmatched names, resolve them
         if self._name_resolver is not None and len(unmatched_names) > 0:
@@ -213,17 +339,38 @@ class _AcceptedNameWrangler(_DataWrangler):
             self.name_map.update(new_names)
             resolved_names.update(new_names)
             self._updated_since_write += len(new_names.keys())
+            self._unwritten_names.extend(new_names.keys())
             if all(
                 [
                     self.out_name_map_filename is not None,
                     self._updated_since_write >= self.map_write_interval
                 ]
             ):
-                self.write_map_to_file(self.out_name_map_filename, self.out_map_format)
-                self._updated_since_write = 0
+                self._sync_map_file()
 
         return resolved_names
 
+    # .......................
+    def _sync_map_file(self):
+        """Update the output name map file with newly resolved names.
+
+        Once a CSV map file has been written, new names are appended to it rather than
+        rewriting the entire map.  JSON map files are always rewritten.
+        """
+        if self._map_file_written and self.out_map_format.lower() == 'csv':
+            with open(self.out_name_map_filename, mode='at') as out_csv:
+                for in_name in self._unwritten_names:
+                    out_csv.write(f'{in_name},{self.name_map[in_name]}\n')
+            self.logger.log(
+                f'Appended {len(self._unwritten_names)} names to '
+                f'{self.out_name_map_filename} as CSV',
+                refname=self.__class__.__name__, log_level=DEBUG)
+        else:
+            self.write_map_to_file(self.out_name_map_filename, self.out_map_format)
+            self._map_file_written = len(self.name_map) > 0
+        self._unwritten_names = []
+        self._updated_since_write = 0
+
     # .......................
     def write_map_to_file(self, filename, output_format, mode='wt'):
         """Write the name map to a file so it can be reused.
@@ -1,8 +1,73 @@
 """Data wrangler factory."""
+import functools
 import importlib
 import inspect
+from logging import WARNING
+
+try:
+    from importlib.metadata import entry_points
+except ImportError:  # pragma: no cover
+    # importlib.metadata is not available before Python 3.8
+    entry_points = None
 
 from lmpy.data_wrangling.base import _DataWrangler
+from lmpy.log import logit
+
+
+WRANGLER_ENTRY_POINT_GROUP = 'lmpy.wranglers'
+
+
+# .....................................................................................
+@functools.lru_cache(maxsize=256)
+def _resolve_wrangler(module_name, wrangler_type):
+    """Get a data wrangler class from a module, caching the lookup.
+
+    Args:
+        module_name (str): The module path (with periods) containing the wrangler.
+        wrangler_type (str): The name of the wrangler class in the module.
+
+    Returns:
+        type: The data wrangler class.
+    """
+    return getattr(importlib.import_module(module_name), wrangler_type)
+
+
+# .....................................................................................
+def _get_wrangler_entry_points():
+    """Get the entry points registered by installed packages for data wranglers.
+
+    Returns:
+        list of EntryPoint: Entry points in the lmpy.wranglers group.
+    """
+    if entry_points is None:  # pragma: no cover
+        return []
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, 'select'):
+        return list(all_entry_points.select(group=WRANGLER_ENTRY_POINT_GROUP))
+    # Python < 3.10 returns a dictionary of groups
+    return list(all_entry_points.get(WRANGLER_ENTRY_POINT_GROUP, []))
+
+
+# .....................................................................................
+@functools.lru_cache(maxsize=None)
+def _load_plugin_wranglers():
+    """Load the data wranglers registered by installed packages, once per process.
+
+    Note:
+        An entry point that fails to load is recorded with its error rather than
+            raising, so one broken package does not break every wrangler config.
+
+    Returns:
+        tuple of tuple: (entry point name, loaded object or None, exception or None)
+            for each entry point in the lmpy.wranglers group.
+    """
+    plugins = []
+    for entry_point in _get_wrangler_entry_points():
+        try:
+            plugins.append((entry_point.name, entry_point.load(), None))
+        except Exception as err:
+            plugins.append((entry_point.name, None, err))
+    return tuple(plugins)
 
 
 # .....................................................................................
@@ -23,7 +88,12 @@ class WranglerFactory:
 
     # .......................
     def _load_wranglers(self):
-        """Load possible data wrangler types."""
+        """Load possible data wrangler types.
+
+        Wranglers are found in the lmpy.data_wrangling package and in any installed
+        package that registers them under the "lmpy.wranglers" entry point group.
+        Entry points are only loaded the first time a factory is created.
+        """
 
         def _find_data_wranglers(base_module, base_class):
             """Recursive function for finding data wranglers for factory.
@@ -52,6 +122,29 @@ class WranglerFactory:
             importlib.import_module("lmpy.data_wrangling"), _DataWrangler
         )
 
+        # Register data wranglers provided by plugins, without replacing any
+        #     data wrangler that is already registered
+        for entry_point_name, element, err in _load_plugin_wranglers():
+            if err is not None:
+                logit(
+                    self.default_logger,
+                    f'Skipping data wrangler entry point {entry_point_name}, '
+                    f'failed to load: {err}',
+                    refname=self.__class__.__name__,
+                    log_level=WARNING,
+                )
+            elif inspect.isclass(element) and issubclass(element, _DataWrangler):
+                if element.name in self.wrangler_types:
+                    logit(
+                        self.default_logger,
+                        f'Skipping data wrangler entry point {entry_point_name}, '
+                        f'{element.name} is already a data wrangler',
+                        refname=self.__class__.__name__,
+                        log_level=WARNING,
+                    )
+                else:
+                    self.wrangler_types[element.name] = element
+
     # .......................
     def get_wranglers(self, wrangler_configs):
         """Get configured data wranglers.
@@ -71,8 +164,9 @@ class WranglerFactory:
             if 'module' in config.keys():
                 # If 'module' is specified, look in that module for the specified
                 #     data wrangler
-                m = importlib.import_module(config['module'])
-                wrangler = getattr(m, config['wrangler_type']).from_config(config)
+                wrangler = _resolve_wrangler(
+                    config['module'], config['wrangler_type']
+                ).from_config(config)
             else:
                 wrangler = self.wrangler_types[
                     config['wrangler_type']
@@ -1,4 +1,6 @@
 """Module containing occurrence data wranglers for modifying matrices."""
+from functools import partial
+
 import numpy as np
 
 from lmpy.data_wrangling.common.accepted_name_wrangler import (
@@ -24,6 +26,7 @@ class AcceptedNameMatrixWrangler(_MatrixDataWrangler, _AcceptedNameWrangler):
         out_map_filename=None,
         map_write_interval=100,
         out_map_format='json',
+        max_workers=1,
         **params
     ):
         """Constructor for AcceptedNameMatrixModifier class.
@@ -38,11 +41,13 @@ class AcceptedNameMatrixWrangler(_MatrixDataWrangler, _AcceptedNameWrangler):
             map_write_interval (int): Update the name map output file after each set of
                 this many iterations.
             out_map_format (str): The format to write the names map (csv or json).
+            max_workers (int): The maximum number of names to resolve concurrently
+                when using GBIF name resolution.
             **params (dict): Keyword parameters to pass to _MatrixDataWrangler.
         """
         _MatrixDataWrangler.__init__(self, **params)
         if isinstance(name_resolver, str) and name_resolver.lower() == 'gbif':
-            name_resolver = resolve_names_gbif
+            name_resolver = partial(resolve_names_gbif, max_workers=max_workers)
         _AcceptedNameWrangler.__init__(
             self,
             name_map=name_map,
@@ -27,17 +27,21 @@ class _MatrixDataWrangler(_DataWrangler):
             modified (bool): Was the slice modified.
             purged (bool): Was the slice purged.
         """
-        if str(axis) not in self.report['changes']:
-            self.report['changes'][str(axis)] = {
+        axis_key = str(axis)
+        changes = self.report['changes']
+        if axis_key not in changes:
+            changes[axis_key] = {
                 'axis': axis,
                 'modified': 0,
                 'purged': 0
             }
+        # Look up the axis report once rather than walking the nested dicts per field
+        axis_changes = changes[axis_key]
         if modified:
-            self.report['changes'][str(axis)]['modified'] += 1
+            axis_changes['modified'] += 1
 
         if purged:
-            self.report['changes'][str(axis)]['purged'] += 1
+            axis_changes['purged'] += 1
 
     # .......................
     def wrangle_matrix(self, matrix):
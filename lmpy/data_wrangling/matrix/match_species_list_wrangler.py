@@ -59,11 +59,10 @@ class MatchSpeciesListMatrixWrangler(_MatrixDataWrangler):
                 unmatched_matrix_taxa = set(axis_headers).difference(
                     set(self.species_list))
 
-                if str(axis) not in self.report['changes'].keys():
-                    self.report['changes'][str(axis)] = {'purged': 0}
-                self.report[
-                    'changes'
-                ][str(axis)]['purged'] += (len(axis_headers) - len(axis_slice))
+                axis_changes = self.report['changes'].setdefault(
+                    str(axis), {'purged': 0}
+                )
+                axis_changes['purged'] += (len(axis_headers) - len(axis_slice))
                 self.logger.log(
                     f"Species list names {unmatched_list_taxa} not present in matrix",
                     refname=self.__class__.__name__, log_level=DEBUG)
@@ -71,7 +70,7 @@ class MatchSpeciesListMatrixWrangler(_MatrixDataWrangler):
                     f"Matrix columns {unmatched_matrix_taxa} not present in tree",
                     refname=self.__class__.__name__, log_level=DEBUG)
                 self.logger.log(
-                    f"Purged {self.report['changes'][str(axis)]['purged']} species.",
+                    f"Purged {axis_changes['purged']} species.",
                     refname=self.__class__.__name__, log_level=DEBUG)
             else:
                 axis_slice = list(range(matrix.shape[axis]))
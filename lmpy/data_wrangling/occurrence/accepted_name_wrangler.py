@@ -1,6 +1,9 @@
 """Module containing occurrence data wranglers for modifying point data."""
+from functools import partial
 from logging import INFO
 
+import numpy as np
+
 from lmpy.point import Point
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
 from lmpy.data_wrangling.common.accepted_name_wrangler import (
@@ -22,6 +25,7 @@ class AcceptedNameOccurrenceWrangler(_OccurrenceDataWrangler, _AcceptedNameWrang
         out_map_filename=None,
         map_write_interval=100,
         out_map_format='json',
+        max_workers=1,
         **params
     ):
         """Constructor for AcceptedNameModifier class.
@@ -36,12 +40,14 @@ class AcceptedNameOccurrenceWrangler(_OccurrenceDataWrangler, _AcceptedNameWrang
             map_write_interval (int): Update the name map output file after each set of
                 this many iterations.
             out_map_format (str): The format to write the names map (csv or json).
+            max_workers (int): The maximum number of names to resolve concurrently
+                when using GBIF name resolution.
             **params (dict): Keyword parameters to pass to _OccurrenceDataWrangler.
         """
         _OccurrenceDataWrangler.__init__(self, **params)
 
         if isinstance(name_resolver, str) and name_resolver.lower() == 'gbif':
-            name_resolver = resolve_names_gbif
+            name_resolver = partial(resolve_names_gbif, max_workers=max_workers)
         _AcceptedNameWrangler.__init__(
             self,
             name_map=name_map,
@@ -70,6 +76,65 @@ class AcceptedNameOccurrenceWrangler(_OccurrenceDataWrangler, _AcceptedNameWrang
             return False
         return True
 
+    # .......................
+    def _get_pass_mask(self, batch):
+        """Determine which points in a batch have an accepted name.
+
+        Args:
+            batch (PointBatch): A batch of points to assess.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points passed.
+        """
+        names = batch.species_name
+        passed = np.array([bool(name) for name in names], dtype=bool)
+        for name in set(names[~passed]):
+            self.logger.log(
+                f"Point with {name} fails with no accepted name.",
+                refname=self.__class__.__name__, log_level=INFO)
+        return passed
+
+    # .......................
+    def _modify_points(self, batch):
+        """Update the taxon names of a batch of points, resolving each name once.
+
+        Args:
+            batch (PointBatch): A batch of points to modify.
+
+        Returns:
+            PointBatch, numpy.ndarray: The modified points and a boolean array
+                indicating which points were modified.
+        """
+        names = batch.species_name
+        # Index each point by the first occurrence of its name
+        name_lookup = {}
+        name_idxs = np.fromiter(
+            (name_lookup.setdefault(name, len(name_lookup)) for name in names),
+            dtype=int, count=len(names)
+        )
+        unique_names = list(name_lookup.keys())
+        resolved = self.resolve_names(list(unique_names))
+        unique_acc_names = np.empty(len(unique_names), dtype=object)
+        unique_acc_names[:] = [resolved[name] for name in unique_names]
+        acc_names = unique_acc_names[name_idxs]
+
+        # If we should keep original value, store in the provided new
+        # fieldname (store_original_attribute)
+        if self.store_original_attribute is not None:
+            batch.set_attribute(self.store_original_attribute, names)
+            is_modified = np.ones(len(batch), dtype=bool)
+        else:
+            is_modified = names != acc_names
+
+        for old_name, acc_name in zip(unique_names, unique_acc_names):
+            if old_name != acc_name:
+                self.logger.log(
+                    f"{old_name} updated to accepted name {acc_name}.",
+                    refname=self.__class__.__name__, log_level=INFO)
+        batch.species_name = acc_names
+
+        return batch, np.asarray(is_modified, dtype=bool)
+
     # .......................
     def _modify_point(self, point):
         """Update taxon name if necessary.
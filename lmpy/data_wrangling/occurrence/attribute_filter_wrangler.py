@@ -35,12 +35,27 @@ class AttributeFilterWrangler(_OccurrenceDataWrangler):
                 condition = filter_func['for-each']['condition']
                 if condition.lower() == 'not-in':
                     bad_values = filter_func['for-each']['values']
+                    try:
+                        # Constant time membership checks for each value
+                        bad_values = frozenset(bad_values)
+                    except TypeError:
+                        pass
 
                     def _each_value_not_in(point):
+                        values = point.get_attribute(self.attribute_name)
                         # TODO: None always passes??
-                        if point.get_attribute(self.attribute_name) is None:
+                        if values is None:
                             return True
-                        for val in point.get_attribute(self.attribute_name):
+                        if isinstance(values, str):
+                            # A single undelimited value, not a sequence of characters
+                            values = (values,)
+                        try:
+                            if bad_values.isdisjoint(values):
+                                return True
+                        except (AttributeError, TypeError):
+                            # Unhashable values, check each one below
+                            pass
+                        for val in values:
                             if val in bad_values:
                                 self.logger.log(
                                     f"{point.species_name} with " +
@@ -1,7 +1,29 @@
 """Module containing attribute modifier occurrence data wrangler."""
 from logging import INFO
 
+import numpy as np
+
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
+from lmpy.point import PointBatch
+
+
+# .....................................................................................
+def distance_from_origin(batch):
+    """Get the Euclidean distance from the origin (0, 0) for each point in a batch.
+
+    Args:
+        batch (PointBatch): A batch of points.
+
+    Returns:
+        numpy.ndarray: The distance from the origin for each point.
+    """
+    return np.hypot(batch.x, batch.y)
+
+
+# .....................................................................................
+ARRAY_FUNCS = {
+    'distance_from_origin': distance_from_origin,
+}
 
 
 # .....................................................................................
@@ -11,16 +33,33 @@ class AttributeModifierWrangler(_OccurrenceDataWrangler):
     version = '1.0'
 
     # .......................
-    def __init__(self, attribute_name, attribute_func, **params):
+    def __init__(self, attribute_name, attribute_func=None, array_func=None, **params):
         """Constructor for AttributeModifierWrangler class.
 
         Args:
             attribute_name (str): The name of the attribute to modify.
             attribute_func (Method): A function to generate values for a point.
+            array_func (Method or str): A function that takes a PointBatch and returns
+                an array of values, one for each point, computed for the whole batch at
+                once.  May also be the name of one of the functions in ARRAY_FUNCS.
             **params (dict): Extra parameters to be sent to the base class.
+
+        Raises:
+            ValueError: Raised if neither attribute_func nor array_func is provided.
+            ValueError: Raised if array_func is a string that is not in ARRAY_FUNCS.
         """
+        if attribute_func is None and array_func is None:
+            raise ValueError('Either attribute_func or array_func must be provided')
         self.attribute_name = attribute_name
         self.attribute_func = self._get_attribute_func(attribute_func)
+        if isinstance(array_func, str):
+            if array_func not in ARRAY_FUNCS:
+                raise ValueError(
+                    f'Unknown array_func {array_func}, must be one of: '
+                    f'{", ".join(sorted(ARRAY_FUNCS.keys()))}'
+                )
+            array_func = ARRAY_FUNCS[array_func]
+        self.array_func = array_func
         _OccurrenceDataWrangler.__init__(self, **params)
 
     # .......................
@@ -59,6 +98,28 @@ class AttributeModifierWrangler(_OccurrenceDataWrangler):
             return self._get_constant_func(attribute_func['constant'])
         return attribute_func
 
+    # .......................
+    def _modify_points(self, batch):
+        """Update an attribute for a batch of points.
+
+        Args:
+            batch (PointBatch): A batch of points to modify.
+
+        Returns:
+            PointBatch, numpy.ndarray: The modified points and a boolean array
+                indicating that every point was modified.
+        """
+        if self.array_func is not None:
+            values = self.array_func(batch)
+        else:
+            values = [self.attribute_func(point) for point in batch]
+        batch.set_attribute(self.attribute_name, values)
+        self.logger.log(
+            f"{self.attribute_name} set for {len(batch)} points.",
+            refname=self.__class__.__name__, log_level=INFO)
+
+        return batch, np.ones(len(batch), dtype=bool)
+
     # .......................
     def _modify_point(self, point):
         """Update point attributes.
@@ -69,7 +130,10 @@ class AttributeModifierWrangler(_OccurrenceDataWrangler):
         Returns:
             Point, bool: Modified point and boolean if point was modified.
         """
-        new_val = self.attribute_func(point)
+        if self.attribute_func is not None:
+            new_val = self.attribute_func(point)
+        else:
+            new_val = self.array_func(PointBatch([point]))[0]
         point.set_attribute(self.attribute_name, new_val)
         self.logger.log(
             f"{self.attribute_name} set to {new_val}.",
@@ -1,7 +1,10 @@
 """Module containing Occurrence Data Wrangler base class."""
 from logging import DEBUG
 
+import numpy as np
+
 from lmpy.data_wrangling.base import _DataWrangler
+from lmpy.point import PointBatch
 
 
 # .....................................................................................
@@ -66,6 +69,49 @@ class _OccurrenceDataWrangler(_DataWrangler):
         """
         return True
 
+    # .......................
+    def _modify_points(self, batch):
+        """Modify a batch of points as needed.
+
+        The base class version calls `_modify_point` for each point.  Subclasses can
+        override this to modify the whole batch at once.
+
+        Args:
+            batch (PointBatch): A batch of points to modify.
+
+        Returns:
+            PointBatch, numpy.ndarray: The modified points and a boolean array
+                indicating which points were modified.
+        """
+        is_modified = np.zeros(len(batch), dtype=bool)
+        # Filters do not modify points, keep the batch and its cached columns
+        if type(self)._modify_point is _OccurrenceDataWrangler._modify_point:
+            return batch, is_modified
+
+        mod_points = []
+        for i, point in enumerate(batch):
+            mod_point, is_modified[i] = self._modify_point(point)
+            mod_points.append(mod_point)
+        return batch.replace_points(mod_points, is_modified), is_modified
+
+    # .......................
+    def _get_pass_mask(self, batch):
+        """Determine which points of a batch pass some criteria.
+
+        The base class version calls `_pass_condition` for each point.  Subclasses can
+        override this to assess the whole batch at once.
+
+        Args:
+            batch (PointBatch): A batch of points to assess.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points passed.
+        """
+        return np.fromiter(
+            (self._pass_condition(point) for point in batch), dtype=bool,
+            count=len(batch)
+        )
+
     # .......................
     def get_report(self):
         """Get a report of the wrangler's functioning.
@@ -98,21 +144,55 @@ class _OccurrenceDataWrangler(_DataWrangler):
         """Wrangle occurrence `Point` objects.
 
         Args:
-            points (list of Point): A list of points to wrangle.
+            points (list of Point or PointBatch): The points to wrangle.
 
         Returns:
-            list of point: A list of wrangled occurrnece points.
+            list of Point or PointBatch: The wrangled occurrence points, as a
+                PointBatch if one was provided.
         """
-        wrangled_points = []
-        for point in points:
-            pt = self.wrangle_single_point(point)
-            if pt is not None:
-                wrangled_points.append(pt)
+        # Empty and single point batches skip building batch arrays
+        if len(points) < 2:
+            wrangled_points = [
+                pt for pt in map(self.wrangle_single_point, points) if pt is not None
+            ]
+            if isinstance(points, PointBatch):
+                return PointBatch(wrangled_points)
+            return wrangled_points
+
+        if isinstance(points, PointBatch):
+            batch = points
+        else:
+            batch = PointBatch(points)
+        mod_batch, is_modified = self._modify_points(batch)
+        passed = self._get_pass_mask(mod_batch)
+
+        # TODO: Does store_attribute always mean do not filter??
+        # If we should just assess the points, set the attribute
+        if self.store_attribute is not None:
+            # Fill object arrays so values are stored as-is rather than coerced
+            pass_values = np.empty(len(passed), dtype=object)
+            pass_values.fill(self.pass_value)
+            fail_values = np.empty(len(passed), dtype=object)
+            fail_values.fill(self.fail_value)
+            mod_batch.set_attribute(
+                self.store_attribute, np.where(passed, pass_values, fail_values)
+            )
+            is_modified[:] = True
+            wrangled = mod_batch
+        else:
+            wrangled = mod_batch.subset(passed)
+
+        self.assessed += len(batch)
+        self.modified += int(is_modified.sum())
+        self.filtered += len(batch) - int(passed.sum())
+
         self.logger.log(
-            f"Return {len(wrangled_points)} of {len(points)} points, " +
+            f"Return {len(wrangled)} of {len(batch)} points, " +
             f"total of {self.modified} modified", refname=self.__class__.__name__,
             log_level=DEBUG)
-        return wrangled_points
+        if isinstance(points, PointBatch):
+            return wrangled
+        return wrangled.points
 
     # .......................
     def wrangle_single_point(self, point):
@@ -1,5 +1,8 @@
 """Module containing occurrence data wranglers for filtering points."""
 from logging import INFO
+
+import numpy as np
+
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
 
 
@@ -26,6 +29,24 @@ class BoundingBoxFilter(_OccurrenceDataWrangler):
         self.max_y = max_y
         _OccurrenceDataWrangler.__init__(self, **params)
 
+    # .......................
+    def _get_pass_mask(self, batch):
+        """Determine which points of a batch are within the bounding box.
+
+        Args:
+            batch (PointBatch): A batch of points to assess.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points passed.
+        """
+        passed = batch.get_bbox_mask(self.min_x, self.min_y, self.max_x, self.max_y)
+        for i in np.flatnonzero(~passed):
+            point = batch[i]
+            self.logger.log(
+                f"{point.species_name} {point.x}, {point.y} fails boundary test.",
+                refname=self.__class__.__name__, log_level=INFO)
+        return passed
+
     # .......................
     def _pass_condition(self, point):
         """Pass condition for a point.
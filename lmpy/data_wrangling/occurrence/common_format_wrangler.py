@@ -1,4 +1,6 @@
 """Module containing common format occurrence data wrangler."""
+import numpy as np
+
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
 from lmpy.point import Point
 
@@ -20,6 +22,24 @@ class CommonFormatWrangler(_OccurrenceDataWrangler):
         self.attribute_map = attribute_map
         _OccurrenceDataWrangler.__init__(self, **params)
 
+    # .......................
+    def _modify_points(self, batch):
+        """Update attributes for a batch of points.
+
+        Args:
+            batch (PointBatch): A batch of points to modify.
+
+        Returns:
+            PointBatch, numpy.ndarray: The modified points and a boolean array
+                indicating that every point was modified.
+        """
+        mod_points = [self._modify_point(point)[0] for point in batch]
+        # Species names and coordinates are unchanged, keep any cached columns
+        return (
+            batch.replace_points(mod_points, np.zeros(len(batch), dtype=bool)),
+            np.ones(len(batch), dtype=bool)
+        )
+
     # .......................
     def _modify_point(self, point):
         """Update point attributes.
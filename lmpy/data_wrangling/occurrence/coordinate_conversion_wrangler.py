@@ -1,5 +1,8 @@
 """Module containing a coordinate converter modifier."""
 from copy import deepcopy
+from functools import lru_cache
+
+import numpy as np
 from osgeo import osr
 
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
@@ -29,6 +32,24 @@ def get_srs_for_epsg(epsg):
     return srs
 
 
+# .....................................................................................
+@lru_cache(maxsize=64)
+def get_coordinate_transformation(source_epsg, target_epsg):
+    """Get a (cached) transformation between two EPSG codes.
+
+    Args:
+        source_epsg (int): The EPSG code of the source coordinates.
+        target_epsg (int): The EPSG code of the target coordinates.
+
+    Returns:
+        osr.CoordinateTransformation: A transformation to the target projection.  It
+            is shared by the cache and should not be modified.
+    """
+    return osr.CoordinateTransformation(
+        get_srs_for_epsg(source_epsg), get_srs_for_epsg(target_epsg)
+    )
+
+
 # .....................................................................................
 class CoordinateConverterWrangler(_OccurrenceDataWrangler):
     """Tool for converting fron one coordinate system to another via ESPG."""
@@ -63,8 +84,73 @@ class CoordinateConverterWrangler(_OccurrenceDataWrangler):
         self.original_y_attribute = original_y_attribute
 
         _OccurrenceDataWrangler.__init__(self, **params)
-        self.target_sr = get_srs_for_epsg(target_epsg)
-        self.transforms = {}
+        self.target_epsg = int(target_epsg)
+
+    # .......................
+    def _get_transform(self, epsg):
+        """Get a (cached) transformation from the EPSG code to the target.
+
+        Args:
+            epsg (int): The EPSG code of the source coordinates.
+
+        Returns:
+            osr.CoordinateTransformation: A transformation to the target projection.
+        """
+        return get_coordinate_transformation(int(epsg), self.target_epsg)
+
+    # .......................
+    def _modify_points(self, batch):
+        """Transform the coordinates of a batch of points.
+
+        Points sharing a source EPSG code are transformed with a single call.
+
+        Args:
+            batch (PointBatch): A batch of points to modify.
+
+        Returns:
+            PointBatch, numpy.ndarray: New, transformed, points and a boolean array
+                indicating that every point was modified.
+        """
+        if self.source_epsg is not None:
+            epsgs = np.full(len(batch), int(self.source_epsg))
+        else:
+            epsgs = np.array(
+                [int(point.get_attribute(self.epsg_attribute)) for point in batch]
+            )
+
+        new_xs = np.empty(len(batch))
+        new_ys = np.empty(len(batch))
+        for epsg in np.unique(epsgs):
+            idxs = np.flatnonzero(epsgs == epsg)
+            transformed = np.array(
+                self._get_transform(int(epsg)).TransformPoints(
+                    list(zip(batch.x[idxs].tolist(), batch.y[idxs].tolist()))
+                )
+            )
+            new_xs[idxs] = transformed[:, 0]
+            new_ys[idxs] = transformed[:, 1]
+
+        keep_original = all(
+            [
+                self.original_x_attribute is not None,
+                self.original_y_attribute is not None
+            ]
+        )
+        mod_points = []
+        for point, new_x, new_y in zip(batch, new_xs.tolist(), new_ys.tolist()):
+            pt = deepcopy(point)
+            pt.x = new_x
+            pt.y = new_y
+            # If we should keep the original values, do so
+            if keep_original:
+                pt.set_attribute(self.original_x_attribute, point.x)
+                pt.set_attribute(self.original_y_attribute, point.y)
+            mod_points.append(pt)
+
+        return (
+            batch.with_coordinates(mod_points, new_xs, new_ys),
+            np.ones(len(batch), dtype=bool)
+        )
 
     # .......................
     def _modify_point(self, point):
@@ -82,14 +168,7 @@ class CoordinateConverterWrangler(_OccurrenceDataWrangler):
         else:
             epsg = int(point.get_attribute(self.epsg_attribute))
 
-        if epsg in self.transforms.keys():
-            transform = self.transforms[epsg]
-        else:
-            source_sr = get_srs_for_epsg(epsg)
-            transform = osr.CoordinateTransformation(source_sr, self.target_sr)
-            self.transforms[epsg] = transform
-
-        new_x, new_y, _ = transform.TransformPoint(point.x, point.y)
+        new_x, new_y, _ = self._get_transform(epsg).TransformPoint(point.x, point.y)
         pt = deepcopy(point)
         pt.x = new_x
         pt.y = new_y
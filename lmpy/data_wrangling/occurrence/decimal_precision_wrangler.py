@@ -1,4 +1,6 @@
 """Module containing occurrence data wranglers for filtering points."""
+import numpy as np
+
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
 
 
@@ -20,6 +22,46 @@ class DecimalPrecisionFilter(_OccurrenceDataWrangler):
         self.decimal_places = decimal_places
         _OccurrenceDataWrangler.__init__(self, **params)
 
+    # .......................
+    @staticmethod
+    def _count_decimals(values):
+        """Count the decimal places of each value as written by str.
+
+        Args:
+            values (numpy.ndarray): An array of floats.
+
+        Returns:
+            numpy.ndarray: The number of characters after the decimal point in the
+                string form of each value, or -1 if there is no decimal point.
+        """
+        value_strs = values.astype(str)
+        dot_idxs = np.char.find(value_strs, '.')
+        decimals = np.char.str_len(value_strs) - dot_idxs - 1
+        decimals[dot_idxs < 0] = -1
+        return decimals
+
+    # .......................
+    def _get_pass_mask(self, batch):
+        """Determine which points of a batch have enough decimal precision.
+
+        Args:
+            batch (PointBatch): A batch of points to assess.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points passed.
+        """
+        lat_decimals = self._count_decimals(batch.y)
+        lon_decimals = self._count_decimals(batch.x)
+        # TODO: Handle numbers with 'e' example: 1e-05
+        has_decimals = (lat_decimals >= 0) & (lon_decimals >= 0)
+        passed = np.minimum(lat_decimals, lon_decimals) >= self.decimal_places
+        for i in np.flatnonzero(has_decimals & ~passed):
+            point = batch[i]
+            self.logger.log(
+                f"{point.species_name} {point.x}, {point.y} fails precision test.",
+                refname=self.__class__.__name__)
+        return passed
+
     # .......................
     def _pass_condition(self, point):
         """Assessment condition for a point.
@@ -1,6 +1,9 @@
 """Module containing occurrence data wranglers for filtering points."""
+import numpy as np
+
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
 from lmpy.spatial import SpatialIndex
+from lmpy.spatial.spatial_index import load_wkt_geometry
 
 
 # .....................................................................................
@@ -19,10 +22,42 @@ class DisjointGeometriesFilter(_OccurrenceDataWrangler):
         """
         _OccurrenceDataWrangler.__init__(self, **params)
         self.geom_index = SpatialIndex()
+        # Bounding box (min_x, min_y, max_x, max_y) of all of the geometries
+        self.bbox = None
+        features = []
         i = 0
         for wkt in geometry_wkts:
-            self.geom_index.add_feature(i, wkt, {"feature_id": i})
+            geom = load_wkt_geometry(wkt)
+            min_x, max_x, min_y, max_y = geom.GetEnvelope()
+            if self.bbox is not None:
+                min_x = min(min_x, self.bbox[0])
+                min_y = min(min_y, self.bbox[1])
+                max_x = max(max_x, self.bbox[2])
+                max_y = max(max_y, self.bbox[3])
+            self.bbox = (min_x, min_y, max_x, max_y)
+            features.append((i, geom, {"feature_id": i}))
             i += 1
+        # Add all of the geometries at once so the new index is bulk loaded
+        self.geom_index.add_features(features)
+
+    # .......................
+    def _get_pass_mask(self, batch):
+        """Determine which points of a batch are disjoint from the geometries.
+
+        Only points within the bounding box of the geometries are checked against the
+        spatial index, points outside of it pass without further checks.
+
+        Args:
+            batch (PointBatch): A batch of points to assess.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points passed.
+        """
+        passed = np.ones(len(batch), dtype=bool)
+        if self.bbox is not None:
+            for i in np.flatnonzero(batch.get_bbox_mask(*self.bbox)):
+                passed[i] = self._pass_condition(batch[i])
+        return passed
 
     # .......................
     def _pass_condition(self, point):
@@ -34,9 +69,9 @@ class DisjointGeometriesFilter(_OccurrenceDataWrangler):
         Returns:
             bool: Indication if the point passes assessment.
         """
-        hits = self.geom_index.search(point.x, point.y)
-        if bool(hits):
+        if self.geom_index.intersects(point.x, point.y):
             self.logger.log(
                 f"{point.species_name} {point.x}, {point.y} fails disjoint test.",
                 refname=self.__class__.__name__)
-        return not bool(hits)
+            return False
+        return True
@@ -1,6 +1,11 @@
 """Module containing occurrence data wranglers for filtering points."""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from osgeo import ogr
+
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
+from lmpy.spatial.spatial_index import load_wkt_geometry
 
 
 # .....................................................................................
@@ -10,17 +15,62 @@ class IntersectGeometriesFilter(_OccurrenceDataWrangler):
     version = '1.0'
 
     # .......................
-    def __init__(self, geometry_wkts, **params):
+    def __init__(self, geometry_wkts, max_workers=1, **params):
         """Get an occurrence data wrangler for filtering by intersecting geometries.
 
         Args:
             geometry_wkts (list of str): A list of WKT strings.
+            max_workers (int): The maximum number of threads used to test points
+                against the geometries.  The default of 1 tests points in order.
             **params (dict): Keyword parameters to pass to _OccurrenceDataWrangler.
         """
         _OccurrenceDataWrangler.__init__(self, **params)
+        self.max_workers = int(max_workers)
         self.geometries = []
+        # Envelopes (min_x, max_x, min_y, max_y) to skip geometries cheaply
+        self.envelopes = []
         for wkt in geometry_wkts:
-            self.geometries.append(ogr.CreateGeometryFromWkt(wkt))
+            geom = load_wkt_geometry(wkt)
+            self.geometries.append(geom)
+            self.envelopes.append(geom.GetEnvelope())
+
+    # .......................
+    def _get_pass_mask(self, batch):
+        """Determine which points of a batch intersect the geometries.
+
+        Points outside of the envelopes of all of the geometries fail without
+        building point geometries, the rest are checked individually.
+
+        Args:
+            batch (PointBatch): A batch of points to assess.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points passed.
+        """
+        candidates = np.zeros(len(batch), dtype=bool)
+        for min_x, max_x, min_y, max_y in self.envelopes:
+            candidates |= batch.get_bbox_mask(min_x, min_y, max_x, max_y)
+        passed = np.zeros(len(batch), dtype=bool)
+        candidate_idxs = np.flatnonzero(candidates)
+        if self.max_workers > 1 and len(candidate_idxs) > 1:
+            # OGR releases the GIL for geometry predicates, so threads run in parallel.
+            # Threads only read this wrangler's geometries, they are not modified.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                passed[candidate_idxs] = list(
+                    executor.map(
+                        lambda i: self._pass_condition(batch[i]),
+                        candidate_idxs.tolist()
+                    )
+                )
+        else:
+            for i in candidate_idxs:
+                passed[i] = self._pass_condition(batch[i])
+        for i in np.flatnonzero(~candidates):
+            point = batch[i]
+            self.logger.log(
+                f"{point.species_name} {point.x}, {point.y} fails intersect test.",
+                refname=self.__class__.__name__)
+        return passed
 
     # .......................
     def _pass_condition(self, point):
@@ -34,8 +84,11 @@ class IntersectGeometriesFilter(_OccurrenceDataWrangler):
         """
         point_geometry = ogr.Geometry(ogr.wkbPoint)
         point_geometry.AddPoint(point.x, point.y)
-        for geom in self.geometries:
-            if not geom.Intersection(point_geometry).IsEmpty():
+        for geom, (min_x, max_x, min_y, max_y) in zip(self.geometries, self.envelopes):
+            if (
+                min_x <= point.x <= max_x and min_y <= point.y <= max_y
+                and geom.Intersects(point_geometry)
+            ):
                 return True
         self.logger.log(
             f"{point.species_name} {point.x}, {point.y} fails intersect test.",
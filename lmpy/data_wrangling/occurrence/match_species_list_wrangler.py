@@ -1,4 +1,6 @@
 """Module containing occurrence data wranglers for matching a species list."""
+import numpy as np
+
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
 from lmpy.species_list import SpeciesList
 
@@ -20,8 +22,36 @@ class MatchSpeciesListWrangler(_OccurrenceDataWrangler):
         _OccurrenceDataWrangler.__init__(self, **params)
         if isinstance(species_list, str):
             species_list = SpeciesList.from_file(species_list)
+        elif not isinstance(species_list, (set, frozenset)):
+            # Hashed membership tests rather than scanning a list
+            species_list = SpeciesList(species_list)
         self.species_list = species_list
 
+    # .......................
+    def _get_pass_mask(self, batch):
+        """Determine which points of a batch are for species in the species list.
+
+        Each distinct species name is only checked once.
+
+        Args:
+            batch (PointBatch): A batch of points to assess.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points passed.
+        """
+        matches = {}
+        for species_name in batch.species_name:
+            if species_name not in matches:
+                matches[species_name] = species_name in self.species_list
+                if not matches[species_name]:
+                    self.logger.log(
+                        f"{species_name} fails to match species list.",
+                        refname=self.__class__.__name__)
+        return np.fromiter(
+            (matches[species_name] for species_name in batch.species_name),
+            dtype=bool, count=len(batch)
+        )
+
     # .......................
     def _pass_condition(self, point):
         """Pass condition for a point.
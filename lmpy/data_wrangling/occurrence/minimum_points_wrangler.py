@@ -2,6 +2,7 @@
 from logging import DEBUG
 
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
+from lmpy.point import PointBatch
 
 
 # .....................................................................................
@@ -38,17 +39,30 @@ class MinimumPointsFilter(_OccurrenceDataWrangler):
         """Wrangle points.  Return all or none based on how many are present.
 
         Args:
-            points (list of Point): A list of points to assess.
+            points (list of Point or PointBatch): The points to assess.
 
         Returns:
-            list of Point: Either an empty list or all of the points passed in.
+            list of Point or PointBatch: Either no points or all of the points passed
+                in.
         """
         try:
             spname = points[0].species_name
         except Exception:
             spname = "unable to retrieve species name"
 
-        if len(points) >= self.minimum_count:
+        passed = len(points) >= self.minimum_count
+        if self.store_attribute is None:
+            # Nothing to store, so the count alone decides without visiting points
+            self.assessed += len(points)
+            if passed:
+                return points if isinstance(points, PointBatch) else list(points)
+            self.filtered += len(points)
+            self.logger.log(
+                f"{spname} {len(points)} fails minimum {self.minimum_count} points.",
+                refname=self.__class__.__name__, log_level=DEBUG)
+            return PointBatch([]) if isinstance(points, PointBatch) else []
+
+        if passed:
             # Enough points, so all pass
             self._pass_condition = self._get_all_pass_condition()
         else:
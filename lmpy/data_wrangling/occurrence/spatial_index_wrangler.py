@@ -1,4 +1,6 @@
 """Module containing occurrence data wranglers for filtering points."""
+import numpy as np
+
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
 from lmpy.spatial import SpatialIndex
 
@@ -36,6 +38,47 @@ class SpatialIndexFilter(_OccurrenceDataWrangler):
 
         _OccurrenceDataWrangler.__init__(self, **params)
 
+    # .......................
+    def _get_pass_mask(self, batch):
+        """Determine which points of a batch pass the spatial index filter.
+
+        Points of species without valid intersections pass without searching the
+        index, points outside of the bounds of the index fail without searching it, and
+        each distinct coordinate is only searched once.
+
+        Args:
+            batch (PointBatch): A batch of points to assess.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points passed.
+        """
+        passed = np.ones(len(batch), dtype=bool)
+        # Coordinates outside of the index bounds can not have any hits
+        in_bounds = batch.get_bbox_mask(*self.spatial_index.index.bounds).tolist()
+        searches = {}
+        xs = batch.x.tolist()
+        ys = batch.y.tolist()
+        for i, species_name in enumerate(batch.species_name):
+            valid_intersections = self.intersections_map.get(species_name)
+            if not valid_intersections:
+                continue
+            coords = (xs[i], ys[i])
+            if coords not in searches:
+                searches[coords] = []
+                if in_bounds[i]:
+                    searches[coords] = list(
+                        self.spatial_index.search(*coords).values()
+                    )
+            if not any(
+                self.check_hit_func(hit, valid_intersections)
+                for hit in searches[coords]
+            ):
+                self.logger.log(
+                    f"{species_name} {coords[0]}, {coords[1]} fails spatial filter.",
+                    refname=self.__class__.__name__)
+                passed[i] = False
+        return passed
+
     # .......................
     def _pass_condition(self, point):
         """Assess a point to see if it passes the spatial index filter.
@@ -1,4 +1,6 @@
 """Module containing occurrence data wranglers for filtering points."""
+import numpy as np
+
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
 
 
@@ -9,18 +11,30 @@ class UniqueLocalitiesFilter(_OccurrenceDataWrangler):
     version = '1.0'
 
     # .......................
-    def __init__(self, do_reset=True, **params):
+    def __init__(self, do_reset=True, precision=None, **params):
         """Get an occurrence data wrangler unique localities for a group of points.
 
         Args:
-            do_reset (bool): Reset the list of seen localities after each group.
+            do_reset (bool): Reset the set of seen localities after each group.
+            precision (numeric or None): If provided, snap coordinates to a grid with
+                cells of this size, in map units, so that points of a species falling
+                in the same cell are treated as duplicates.
             **params (dict): Extra parameters to be sent to the base class.
+
+        Raises:
+            ValueError: Raised if precision is provided and is not a positive, finite
+                number.
         """
-        self.seen_localities = []
+        self.seen_localities = set()
         # JSON may make boolean into a string so handle that
         if isinstance(do_reset, str):
             do_reset = do_reset.lower() != 'false'
         self.do_reset = bool(do_reset)
+        self.precision = float(precision) if precision is not None else None
+        if self.precision is not None and not 0 < self.precision < np.inf:
+            raise ValueError(
+                f'precision must be a positive, finite number, got {precision}'
+            )
         _OccurrenceDataWrangler.__init__(self, **params)
 
     # .......................
@@ -34,14 +48,48 @@ class UniqueLocalitiesFilter(_OccurrenceDataWrangler):
             bool: An indication if the point is spatially unique.
         """
         test_val = (point.species_name, point.x, point.y)
+        if self.precision is not None:
+            test_val = (
+                point.species_name,
+                round(point.x / self.precision),
+                round(point.y / self.precision)
+            )
         if test_val in self.seen_localities:
             self.logger.log(
                 f"{point.species_name} {point.x}, {point.y} fails unique test.",
                 refname=self.__class__.__name__)
             return False
-        self.seen_localities.append(test_val)
+        self.seen_localities.add(test_val)
         return True
 
+    # .......................
+    def _get_pass_mask(self, batch):
+        """Determine which points of a batch are spatially unique.
+
+        Args:
+            batch (PointBatch): A batch of points to assess.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points passed.
+        """
+        passed = np.ones(len(batch), dtype=bool)
+        seen_localities = self.seen_localities
+        xs = batch.x
+        ys = batch.y
+        if self.precision is not None:
+            # Snap to grid cell indices, matching round() in _pass_condition
+            xs = np.round(xs / self.precision).astype(np.int64)
+            ys = np.round(ys / self.precision).astype(np.int64)
+        for i, test_val in enumerate(zip(batch.species_name, xs.tolist(), ys.tolist())):
+            if test_val in seen_localities:
+                self.logger.log(
+                    f"{test_val[0]} {batch.x[i]}, {batch.y[i]} fails unique test.",
+                    refname=self.__class__.__name__)
+                passed[i] = False
+            else:
+                seen_localities.add(test_val)
+        return passed
+
     # .......................
     def wrangle_points(self, points):
         """Wrangle points.
@@ -55,7 +103,7 @@ class UniqueLocalitiesFilter(_OccurrenceDataWrangler):
             list of Point: A list of points with unique localities.
         """
         if self.do_reset:
-            self.seen_localities = []
+            self.seen_localities = set()
 
         unique_points = _OccurrenceDataWrangler.wrangle_points(self, points)
         return unique_points
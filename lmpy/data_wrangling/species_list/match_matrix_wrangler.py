@@ -30,7 +30,7 @@ class MatchMatrixSpeciesListWrangler(_SpeciesListDataWrangler):
         _SpeciesListDataWrangler.__init__(self, **params)
         if isinstance(matrix, str):
             matrix = Matrix.load(matrix)
-        self.keep_names = matrix.get_headers(axis=str(species_axis))
+        self.keep_names = frozenset(matrix.get_headers(axis=str(species_axis)))
 
     # .......................
     def wrangle_species_list(self, species_list):
@@ -28,7 +28,7 @@ class MatchTreeSpeciesListWrangler(_SpeciesListDataWrangler):
         _SpeciesListDataWrangler.__init__(self, **params)
         if isinstance(tree, str):
             tree = TreeWrapper.from_filename(tree)
-        self.keep_names = [taxon.label for taxon in tree.taxon_namespace]
+        self.keep_names = frozenset(taxon.label for taxon in tree.taxon_namespace)
 
     # .......................
     def wrangle_species_list(self, species_list):
@@ -25,6 +25,8 @@ class UnionSpeciesListWrangler(_SpeciesListDataWrangler):
         """
         if isinstance(species_list, str):
             species_list = SpeciesList.from_file(species_list)
+        elif not isinstance(species_list, (set, frozenset)):
+            species_list = SpeciesList(species_list)
         self.other_species_list = species_list
         _SpeciesListDataWrangler.__init__(self, **params)
 
@@ -1,4 +1,6 @@
 """Module containing occurrence data wranglers for modifying tree tips."""
+from functools import partial
+
 from lmpy.data_wrangling.common.accepted_name_wrangler import (
     _AcceptedNameWrangler,
     resolve_names_gbif,
@@ -21,6 +23,7 @@ class AcceptedNameTreeWrangler(_TreeDataWrangler, _AcceptedNameWrangler):
         out_map_filename=None,
         map_write_interval=100,
         out_map_format='json',
+        max_workers=1,
         **params
     ):
         """Constructor for AcceptedNameTreeModifier class.
@@ -34,10 +37,12 @@ class AcceptedNameTreeWrangler(_TreeDataWrangler, _AcceptedNameWrangler):
             map_write_interval (int): Update the name map output file after each set of
                 this many iterations.
             out_map_format (str): The format to write the names map (csv or json).
+            max_workers (int): The maximum number of names to resolve concurrently
+                when using GBIF name resolution.
             **params (dict): Keyword parameters to pass to _TreeDataWrangler.
         """
         if isinstance(name_resolver, str) and name_resolver.lower() == 'gbif':
-            name_resolver = resolve_names_gbif
+            name_resolver = partial(resolve_names_gbif, max_workers=max_workers)
         _AcceptedNameWrangler.__init__(
             self,
             name_map=name_map,
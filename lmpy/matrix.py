@@ -146,29 +146,40 @@ class Matrix(np.ndarray):
         col_headers = []
         row_headers = []
         header_lines = []  # Leading rows that are headers
-        data = []
+        data_lines = []
         i = 0
         for line in flo:
-            items = line.strip().split(',')
+            line = line.strip()
             # If header row (identifying the columns), add to header rows for processing
             if i < num_header_rows:
                 # Add the headers to header lines for processing
-                header_lines.append(items[num_header_cols:])
-            # For each row of values
-            else:
+                header_lines.append(line.split(',')[num_header_cols:])
+            # For each row of values, skipping blank lines
+            elif line:
                 # First save values that are header columns (identifying the row)
                 if num_header_cols > 0:
+                    items = line.split(',', num_header_cols)
                     row_headers.append([q.strip() for q in items[:num_header_cols]])
-                # Next convert string data values in the row to numbers
-                # (without header columns/row identifiers)
-                data_row = [float(x) for x in items[num_header_cols:]]
-                # Finally, add to the data, as float or int
-                if dtype == float:
-                    data.append(data_row)
-                else:
-                    data.append([dtype(x) for x in data_row])
+                # Data values are converted to numbers all at once below
+                data_lines.append(line)
             i += 1
 
+        # Convert string data values to numbers in one pass (without header
+        #    columns/row identifiers)
+        data = []
+        if data_lines:
+            num_cols = data_lines[0].count(',') + 1
+            data = np.loadtxt(
+                data_lines,
+                delimiter=',',
+                comments=None,
+                usecols=range(num_header_cols, num_cols),
+                ndmin=2,
+            )
+            # Add to the data, as float or int
+            if dtype != float:
+                data = [[dtype(x) for x in data_row] for data_row in data.tolist()]
+
         # Process header columns from header rows
         # if num_header_rows == 1:
         #     col_headers = [q.strip() for q in header_lines[0]]
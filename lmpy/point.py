@@ -7,9 +7,11 @@ import csv
 import io
 import json
 import os
+import sys
 import zipfile
 
 import defusedxml.ElementTree as ET
+import numpy as np
 
 
 DEFAULT_META_FILENAME = 'meta.xml'
@@ -55,6 +57,9 @@ class Point:
     X_ATTRIBUTE = "x"
     Y_ATTRIBUTE = "y"
 
+    # Points are created in large numbers, avoid a per-instance __dict__
+    __slots__ = ('species_name', 'x', 'y', 'attributes')
+
     # .......................
     def __init__(self, species_name, x, y, attributes=None):
         """Constructor.
@@ -87,14 +92,44 @@ class Point:
             species_name (:obj:`str`): The species name for a point.
 
         Returns:
-            capitalized version of the species_name
+            capitalized version of the species_name, interned so that points of the
+                same species share a single string
 
         Raises:
             ValueError: Raised if the species name is omitted.
         """
         if species_name is None or len(species_name) < 1:
             raise ValueError('Species name must be provided')
-        return species_name.capitalize()
+        return sys.intern(species_name.capitalize())
+
+    # .......................
+    def __copy__(self):
+        """Get a copy of this point with its own attribute dictionary.
+
+        Returns:
+            Point: A copy of this point.
+        """
+        point = type(self).__new__(type(self))
+        point.species_name = self.species_name
+        point.x = self.x
+        point.y = self.y
+        point.attributes = dict(self.attributes)
+        return point
+
+    # .......................
+    def __deepcopy__(self, memo):
+        """Get a deep copy of this point.
+
+        Args:
+            memo (dict): The memo dictionary used by `copy.deepcopy`.
+
+        Returns:
+            Point: A copy of this point with deep copied attributes.
+        """
+        point = self.__copy__()
+        memo[id(self)] = point
+        point.attributes = copy.deepcopy(self.attributes, memo)
+        return point
 
     # .......................
     def __eq__(self, other):
@@ -178,6 +213,228 @@ class Point:
         self.attributes[attribute_name] = value
 
 
+# .....................................................................................
+class PointBatch:
+    """Class representing a batch of occurrence points as parallel columns.
+
+    The species name, x, and y columns are built from the points as NumPy arrays
+    the first time they are needed so that wranglers can assess a whole batch at
+    once.  Iterating over a batch yields the underlying Point objects.
+    """
+
+    # .......................
+    def __init__(self, points, species_name=None, x=None, y=None):
+        """Constructor.
+
+        Args:
+            points (:obj:`list` of :obj:`Point`): The points in this batch.
+            species_name (:obj:`numpy.ndarray`): An optional, already computed, array
+                of the species names of the points.
+            x (:obj:`numpy.ndarray`): An optional, already computed, array of the x
+                coordinates of the points.
+            y (:obj:`numpy.ndarray`): An optional, already computed, array of the y
+                coordinates of the points.
+        """
+        self.points = list(points)
+        self._species_name = species_name
+        self._x = x
+        self._y = y
+
+    # .......................
+    def __getitem__(self, index):
+        """Get the point at the provided index.
+
+        Args:
+            index (:obj:`int`): The index of the point to get.
+
+        Returns:
+            Point: The point at the index.
+        """
+        return self.points[index]
+
+    # .......................
+    def __iter__(self):
+        """Iterate over the points in the batch.
+
+        Returns:
+            iterator: An iterator of the Point objects in the batch.
+        """
+        return iter(self.points)
+
+    # .......................
+    def __len__(self):
+        """Get the number of points in the batch.
+
+        Returns:
+            int: The number of points in the batch.
+        """
+        return len(self.points)
+
+    # .......................
+    @property
+    def species_name(self):
+        """Get the species names of the points in the batch.
+
+        Returns:
+            numpy.ndarray: An object array of species names.
+        """
+        if self._species_name is None:
+            self._species_name = np.empty(len(self.points), dtype=object)
+            self._species_name[:] = [pt.species_name for pt in self.points]
+        return self._species_name
+
+    # .......................
+    @species_name.setter
+    def species_name(self, values):
+        """Set the species names of the points in the batch.
+
+        Args:
+            values (:obj:`list` or :obj:`numpy.ndarray`): New species names for each
+                point.
+        """
+        self._species_name = np.empty(len(self.points), dtype=object)
+        self._species_name[:] = values
+        for point, value in zip(self.points, self._species_name):
+            point.species_name = value
+            point.attributes[Point.SPECIES_ATTRIBUTE] = value
+
+    # .......................
+    @property
+    def x(self):
+        """Get the x coordinates of the points in the batch.
+
+        Returns:
+            numpy.ndarray: A float array of x coordinates.
+        """
+        if self._x is None:
+            self._x = np.fromiter(
+                (pt.x for pt in self.points), dtype=float, count=len(self.points)
+            )
+        return self._x
+
+    # .......................
+    @property
+    def y(self):
+        """Get the y coordinates of the points in the batch.
+
+        Returns:
+            numpy.ndarray: A float array of y coordinates.
+        """
+        if self._y is None:
+            self._y = np.fromiter(
+                (pt.y for pt in self.points), dtype=float, count=len(self.points)
+            )
+        return self._y
+
+    # .......................
+    def get_bbox_mask(self, min_x, min_y, max_x, max_y):
+        """Determine which points fall within a bounding box, edges included.
+
+        Args:
+            min_x (numeric): The minimum x value of the bounding box.
+            min_y (numeric): The minimum y value of the bounding box.
+            max_x (numeric): The maximum x value of the bounding box.
+            max_y (numeric): The maximum y value of the bounding box.
+
+        Returns:
+            numpy.ndarray: A boolean array indicating which points are in the box.
+        """
+        mask = self.x >= min_x
+        mask &= self.x <= max_x
+        mask &= self.y >= min_y
+        mask &= self.y <= max_y
+        return mask
+
+    # .......................
+    def get_attribute(self, attribute_name):
+        """Get the values of an attribute for each point in the batch.
+
+        Args:
+            attribute_name (:obj:`str`): The attribute to retrieve.
+
+        Returns:
+            numpy.ndarray: An object array of attribute values, None where a point does
+                not have the attribute.
+        """
+        values = np.empty(len(self.points), dtype=object)
+        values[:] = [pt.get_attribute(attribute_name) for pt in self.points]
+        return values
+
+    # .......................
+    def set_attribute(self, attribute_name, values):
+        """Set an attribute for each point in the batch.
+
+        Args:
+            attribute_name (:obj:`str`): The name of the attribute to set.
+            values (:obj:`list` or :obj:`numpy.ndarray`): A value for each point.
+        """
+        if isinstance(values, np.ndarray):
+            # Store Python objects rather than NumPy scalars
+            values = values.tolist()
+        for point, value in zip(self.points, values):
+            point.attributes[attribute_name] = value
+
+    # .......................
+    def replace_points(self, points, changed):
+        """Get a batch of replacement points, reusing cached columns where possible.
+
+        Args:
+            points (:obj:`list` of :obj:`Point`): A replacement point for each point in
+                this batch.
+            changed (:obj:`numpy.ndarray`): A boolean array indicating which points may
+                have a different species name or coordinates than the point they
+                replace.
+
+        Returns:
+            PointBatch: A new batch of the replacement points.
+        """
+        idxs = np.flatnonzero(np.asarray(changed, dtype=bool)).tolist()
+        columns = []
+        for column, attribute in [
+            (self._species_name, 'species_name'), (self._x, 'x'), (self._y, 'y')
+        ]:
+            # Only read the changed points for columns that have been built
+            if column is not None and idxs:
+                column = column.copy()
+                column[idxs] = [getattr(points[i], attribute) for i in idxs]
+            columns.append(column)
+        return PointBatch(points, *columns)
+
+    # .......................
+    def with_coordinates(self, points, x, y):
+        """Get a batch of points with new coordinates but the same species names.
+
+        Args:
+            points (:obj:`list` of :obj:`Point`): A replacement point for each point in
+                this batch, with the same species name.
+            x (:obj:`numpy.ndarray`): The x coordinates of the replacement points.
+            y (:obj:`numpy.ndarray`): The y coordinates of the replacement points.
+
+        Returns:
+            PointBatch: A new batch of the replacement points.
+        """
+        return PointBatch(points, self._species_name, x, y)
+
+    # .......................
+    def subset(self, mask):
+        """Get a batch containing the points selected by a boolean mask.
+
+        Args:
+            mask (:obj:`numpy.ndarray`): A boolean array indicating the points to keep.
+
+        Returns:
+            PointBatch: A new batch with the selected points.
+        """
+        idxs = np.flatnonzero(np.asarray(mask, dtype=bool))
+        columns = [
+            None if column is None else column[idxs]
+            for column in (self._species_name, self._x, self._y)
+        ]
+        # Only touch the Point objects that are kept
+        points = self.points
+        return PointBatch([points[i] for i in idxs.tolist()], *columns)
+
+
 # .....................................................................................
 class PointCsvReader:
     """Class for reading Points from a CSV file."""
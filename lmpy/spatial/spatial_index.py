@@ -2,6 +2,7 @@
 
 Version 1: Store geometries in memory in table.  Save as wkt.
 """
+from functools import lru_cache
 import json
 import os
 from osgeo import ogr
@@ -27,6 +28,63 @@ def create_geometry_from_bbox(min_x, min_y, max_x, max_y):
     return ogr.CreateGeometryFromWkt(wkt)
 
 
+# .............................................................................
+@lru_cache(maxsize=1024)
+def _parse_wkt_geometry(wkt):
+    """Parse a geometry from WKT, caching the result for repeated WKT strings.
+
+    Args:
+        wkt (str): The well-known text of a geometry.
+
+    Returns:
+        ogr.Geometry: The geometry.  It is shared by the cache and must not be
+            modified or returned to callers.
+    """
+    return ogr.CreateGeometryFromWkt(wkt)
+
+
+# .............................................................................
+def load_wkt_geometry(wkt):
+    """Create a geometry from WKT, only parsing repeated WKT strings once.
+
+    Args:
+        wkt (str): The well-known text of a geometry.
+
+    Returns:
+        ogr.Geometry: A copy of the parsed geometry owned by the caller.
+    """
+    return _parse_wkt_geometry(wkt).Clone()
+
+
+# .............................................................................
+def hilbert_index(x, y, order=16):
+    """Get the distance along a Hilbert curve for a grid cell.
+
+    Args:
+        x (int): The column of the cell, between 0 and 2**order - 1.
+        y (int): The row of the cell, between 0 and 2**order - 1.
+        order (int): The order of the curve, the grid has 2**order cells per side.
+
+    Returns:
+        int: The position of the cell along the Hilbert curve.
+    """
+    side = 1 << order
+    dist = 0
+    step = side >> 1
+    while step > 0:
+        rx = int((x & step) > 0)
+        ry = int((y & step) > 0)
+        dist += step * step * ((3 * rx) ^ ry)
+        # Rotate the quadrant so the curve is continuous
+        if ry == 0:
+            if rx == 1:
+                x = side - 1 - x
+                y = side - 1 - y
+            x, y = y, x
+        step >>= 1
+    return dist
+
+
 # .............................................................................
 def quadtree_index(geom, bbox, min_size, depth_left):
     """Use a quadtree approach to gather spatial index data.
@@ -91,28 +149,46 @@ class SpatialIndex:
         Args:
             index_name (str): A name to use for saving the index to a file.
         """
-        self.index = rtree.index.Index(index_name)
+        self.index_name = index_name
+        self._index = rtree.index.Index(index_name)
+        # Index entries waiting to be loaded, see `_load_pending_entries`
+        self._pending_entries = []
         self._att_filename = '{}.json'.format(index_name)
         self._geom_filename = '{}.geom_json'.format(index_name)
         self.att_lookup = {}
         if os.path.exists(self._att_filename):
             with open(self._att_filename) as in_file:
                 self.att_lookup = json.load(in_file)
+        # Saved geometries are kept as WKT until a search needs them
         self.geom_lookup = {}
         if os.path.exists(self._geom_filename):
             with open(self._geom_filename) as in_file:
                 tmp_geoms = json.load(in_file)
                 for k, wkt in tmp_geoms.items():
-                    self.geom_lookup[str(k)] = ogr.CreateGeometryFromWkt(wkt)
-                # self.geom_lookup = json.load(in_file)
+                    self.geom_lookup[str(k)] = wkt
         self.min_size = 0.01
         self.depth_left = 10
         self.next_geom = len(self.geom_lookup)
 
+    # ..........................
+    @property
+    def index(self):
+        """Get the R-tree index, loading any pending entries first.
+
+        Returns:
+            rtree.index.Index: The R-tree index.
+        """
+        self._load_pending_entries()
+        return self._index
+
     # ..........................
     def add_feature(self, identifier, geom, att_dict):
         """Add a feature to the index.
 
+        Note:
+            Index entries are held until the index is next used so that features
+                added one at a time are loaded together, see `add_features`.
+
         Args:
             identifier (str): An identifier for this feature in the lookup table.
             geom (ogr.Geometry): A geometry to spatially index.
@@ -120,28 +196,122 @@ class SpatialIndex:
         """
         try:
             self.att_lookup[str(identifier)] = att_dict
-            if isinstance(geom, str):
-                geom = ogr.CreateGeometryFromWkt(geom)
-            min_x, max_x, min_y, max_y = geom.GetEnvelope()
-            idx_entries = quadtree_index(
-                geom, (min_x, min_y, max_x, max_y), self.min_size, self.depth_left
+            self._pending_entries.extend(
+                (identifier, bbox, idx_geom)
+                for bbox, idx_geom in self._get_index_entries(geom)
             )
-            # print('{} - Num idx entries: {}'.format(
-            #     identifier, len(idx_entries)))
-            for bbox, idx_geom in idx_entries:
-                if isinstance(idx_geom, bool) and idx_geom:
-                    # Index as entire bbox
-                    self.index.insert(identifier, bbox, obj=True)
-                else:
-                    # Add geometry to lookup, increment counter
-                    self.index.insert(identifier, bbox, obj=self.next_geom)
-                    self.geom_lookup[str(self.next_geom)] = idx_geom
-                    self.next_geom += 1
         except Exception as err:  # pragma: no cover
             print(err)
             print(identifier)
             print(att_dict)
 
+    # ..........................
+    def add_features(self, features):
+        """Add many features to the index at once.
+
+        An empty in-memory index is bulk loaded, which packs the R-tree nodes more
+        tightly than inserting entries one at a time.  Otherwise entries are inserted
+        in Hilbert curve order so that spatially close entries are inserted together.
+        Entries of features added with `add_feature` that are not loaded yet are
+        loaded along with these.
+
+        Args:
+            features (list of tuple): A list of (identifier, geometry, attribute
+                dictionary) tuples, as would be passed to `add_feature`.
+        """
+        for identifier, geom, att_dict in features:
+            self.att_lookup[str(identifier)] = att_dict
+            self._pending_entries.extend(
+                (identifier, bbox, idx_geom)
+                for bbox, idx_geom in self._get_index_entries(geom)
+            )
+        self._load_pending_entries()
+
+    # ..........................
+    def _load_pending_entries(self):
+        """Load the pending index entries into the R-tree index."""
+        entries = self._pending_entries
+        if not entries:
+            return
+        self._pending_entries = []
+
+        if self.index_name is None and len(self._index) == 0:
+            self._index = rtree.index.Index(
+                (identifier, bbox, self._get_entry_object(idx_geom))
+                for identifier, bbox, idx_geom in entries
+            )
+            return
+
+        # Scale entry centroids to the Hilbert grid over the extent of all entries
+        min_x = min(entry[1][0] for entry in entries)
+        min_y = min(entry[1][1] for entry in entries)
+        max_x = max(entry[1][2] for entry in entries)
+        max_y = max(entry[1][3] for entry in entries)
+        max_cell = (1 << 16) - 1
+        x_scale = max_cell / (max_x - min_x) if max_x > min_x else 0.0
+        y_scale = max_cell / (max_y - min_y) if max_y > min_y else 0.0
+
+        # ..................
+        def _entry_hilbert_index(entry):
+            bbox = entry[1]
+            return hilbert_index(
+                int(((bbox[0] + bbox[2]) / 2.0 - min_x) * x_scale),
+                int(((bbox[1] + bbox[3]) / 2.0 - min_y) * y_scale)
+            )
+
+        for identifier, bbox, idx_geom in sorted(entries, key=_entry_hilbert_index):
+            self._insert_entry(identifier, bbox, idx_geom)
+
+    # ..........................
+    def _get_index_entries(self, geom):
+        """Get the quadtree index entries for a geometry.
+
+        Args:
+            geom (ogr.Geometry or str): A geometry, or its WKT, to spatially index.
+
+        Returns:
+            list of tuple: A list of (bounding box, geometry or True) tuples.
+        """
+        if isinstance(geom, str):
+            geom = load_wkt_geometry(geom)
+        min_x, max_x, min_y, max_y = geom.GetEnvelope()
+        return quadtree_index(
+            geom, (min_x, min_y, max_x, max_y), self.min_size, self.depth_left
+        )
+
+    # ..........................
+    def _insert_entry(self, identifier, bbox, idx_geom):
+        """Insert a quadtree index entry into the index.
+
+        Args:
+            identifier (str): An identifier for the feature in the lookup table.
+            bbox (tuple): The (min_x, min_y, max_x, max_y) bounding box of the entry.
+            idx_geom (ogr.Geometry or bool): The portion of the feature geometry
+                within the bounding box, or True if it covers the bounding box.
+        """
+        self._index.insert(identifier, bbox, obj=self._get_entry_object(idx_geom))
+
+    # ..........................
+    def _get_entry_object(self, idx_geom):
+        """Get the object to store with an index entry.
+
+        Args:
+            idx_geom (ogr.Geometry or bool): The portion of the feature geometry
+                within the bounding box of the entry, or True if it covers it.
+
+        Returns:
+            bool or int: True if the entry covers its entire bounding box, otherwise
+                the key of the geometry in the geometry lookup.
+        """
+        if isinstance(idx_geom, bool) and idx_geom:
+            # Index as entire bbox
+            return True
+        # Add geometry to lookup, increment counter
+        geom_key = self.next_geom
+        self.geom_lookup[str(geom_key)] = idx_geom
+        self.next_geom += 1
+        return geom_key
+
     # ..........................
     def close(self):
         """Close the index."""
@@ -150,10 +320,15 @@ class SpatialIndex:
     # ..........................
     def save(self):
         """Save the index attributes."""
+        # Loading pending entries adds their geometries to the geometry lookup
+        self._load_pending_entries()
         with open(self._att_filename, 'w') as out_file:
             json.dump(self.att_lookup, out_file)
         with open(self._geom_filename, 'w') as out_file:
-            out_geoms = {k: val.ExportToWkt() for k, val in self.geom_lookup.items()}
+            out_geoms = {
+                k: val if isinstance(val, str) else val.ExportToWkt()
+                for k, val in self.geom_lookup.items()
+            }
             json.dump(out_geoms, out_file)
             # json.dump(self.geom_lookup, out_file)
 
@@ -172,11 +347,47 @@ class SpatialIndex:
         for hit in self.index.intersection((x, y, x, y), objects=True):
             if hit.id not in hits.keys():
                 if isinstance(hit.object, bool) or self._point_intersect(
-                    x, y, self.geom_lookup[str(hit.object)]
+                    x, y, self._get_geometry(str(hit.object))
                 ):
                     hits[str(hit.id)] = self.att_lookup[str(hit.id)]
         return hits
 
+    # ..........................
+    def intersects(self, x, y):
+        """Determine if x, y falls within any indexed feature.
+
+        Unlike search, this stops at the first hit and does not gather attributes.
+
+        Args:
+            x (numeric): The x coordinate to search for.
+            y (numeric): The y coordinate to search for.
+
+        Returns:
+            bool: Indication if the point is within at least one feature.
+        """
+        for hit in self.index.intersection((x, y, x, y), objects=True):
+            if isinstance(hit.object, bool) or self._point_intersect(
+                x, y, self._get_geometry(str(hit.object))
+            ):
+                return True
+        return False
+
+    # ..........................
+    def _get_geometry(self, geom_key):
+        """Get an indexed geometry, creating it from WKT on first use.
+
+        Args:
+            geom_key (str): The key of the geometry in the geometry lookup.
+
+        Returns:
+            ogr.Geometry: The indexed geometry.
+        """
+        geom = self.geom_lookup[geom_key]
+        if isinstance(geom, str):
+            geom = ogr.CreateGeometryFromWkt(geom)
+            self.geom_lookup[geom_key] = geom
+        return geom
+
     # ..........................
     @staticmethod
     def _point_intersect(pt_x, pt_y, geom):
@@ -28,6 +28,7 @@ DWCA_DIR = 'dwcas'
 TREES_DIR = 'trees'
 LAYER_ENCODER_DIR = 'encoding_layers'
 OCCURRENCE_WRANGLER_DIR = 'data_wranglers/occurrence'
+TREE_ENCODER_DIR = 'tree_encoder'
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 SAMPLE_DATA_PATH = os.path.join(THIS_DIR, 'data_dir')
@@ -125,6 +126,19 @@ class SampleDataFiles:
         )
         return glob.glob(os.path.join(OCCURRENCE_WRANGLER_PATH, '*.json'))
 
+    # ...........................
+    def get_tree_encoder_filenames(self):
+        """Get a matching tree and PAM filename for tree encoding.
+
+        Returns:
+            tuple: A tree filename and a PAM filename.
+        """
+        TREE_ENCODER_PATH = os.path.join(SAMPLE_DATA_PATH, TREE_ENCODER_DIR)
+        return (
+            os.path.join(TREE_ENCODER_PATH, 'abc.tre'),
+            os.path.join(TREE_ENCODER_PATH, 'abc_pam.lmm'),
+        )
+
     # ...........................
     def get_trees(self, fmt, is_valid):
         """Gets an alignment file from the sample data.
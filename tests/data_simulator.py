@@ -19,7 +19,8 @@ from lmpy.point import (
     ID_TAG,
     LOCATION_TAG,
     OCCURRENCE_ROW_TYPE,
-    Point
+    Point,
+    PointBatch,
 )
 from lmpy.tree import TreeWrapper
 
@@ -94,6 +95,21 @@ def get_random_float_func(min_val, max_val, min_precision, max_precision):
             np.random.randint(min_precision, max_precision)
         )
 
+    # ..................
+    def get_random_floats(count):
+        """Get an array of random floats.
+
+        Args:
+            count (int): The number of floats to generate.
+
+        Returns:
+            numpy.ndarray: Random floats in the range specified in the outer function.
+        """
+        scales = 10.0 ** np.random.randint(min_precision, max_precision, size=count)
+        values = (max_val - min_val) * np.random.random(count) + min_val
+        return np.round(values * scales) / scales
+
+    get_random_float.vectorized = get_random_floats
     return get_random_float
 
 
@@ -154,6 +170,19 @@ def get_random_choice_func(choices):
         """
         return np.random.choice(choices)
 
+    # ..................
+    def get_random_choices(count):
+        """Get an array of random selections from the outer function choices.
+
+        Args:
+            count (int): The number of selections to make.
+
+        Returns:
+            numpy.ndarray: Selections of the provided choices.
+        """
+        return np.random.choice(choices, size=count)
+
+    get_random_choice.vectorized = get_random_choices
     return get_random_choice
 
 
@@ -242,7 +271,26 @@ def generate_csv(filename, count, fields):
 
 
 # .....................................................................................
-def generate_points(count, species_field, x_field, y_field, fields):
+def generate_column(field, count):
+    """Generate values for a simulated field.
+
+    Args:
+        field (SimulatedField): A simulated field to generate values for.
+        count (int): The number of values to generate.
+
+    Returns:
+        list or numpy.ndarray: The generated values.  If the field's create function
+            has a `vectorized` attribute, all values are generated with one call.
+    """
+    if hasattr(field.create, 'vectorized'):
+        return field.create.vectorized(count)
+    return [field.create() for _ in range(count)]
+
+
+# .....................................................................................
+def generate_points(
+    count, species_field, x_field, y_field, fields, return_batch=False
+):
     """Generate a list of Point objects for testing.
 
     Args:
@@ -251,27 +299,34 @@ def generate_points(count, species_field, x_field, y_field, fields):
         x_field (SimulatedField): A simulated field for the x coordiante.
         y_field (SimulatedField): A simulated field for the y coordinate.
         fields (list of SimulatedField): A list of simulated fields.
+        return_batch (bool): Should the points be returned as a PointBatch.
 
     Returns:
-        list of Point: A list of Point objects.
+        list of Point or PointBatch: The simulated points.
     """
-    points = []
-    for _ in range(count):
-        atts = {
-            fld.header: fld.create() for fld in fields
-        }
-        atts[species_field.header] = species_field.create()
-        atts[x_field.header] = x_field.create()
-        atts[y_field.header] = y_field.create()
-        points.append(
-            Point(
-                atts[species_field.header],
-                atts[x_field.header],
-                atts[y_field.header],
-                attributes=atts
-            )
-        )
-
+    # Generate each column into a preallocated array
+    species_names = np.empty(count, dtype=object)
+    species_names[:] = generate_column(species_field, count)
+    xs = np.asarray(generate_column(x_field, count), dtype=float)
+    ys = np.asarray(generate_column(y_field, count), dtype=float)
+    att_columns = {fld.header: generate_column(fld, count) for fld in fields}
+
+    # Convert columns to lists once rather than indexing arrays for every point
+    headers = list(att_columns.keys()) + [
+        species_field.header, x_field.header, y_field.header
+    ]
+    columns = [
+        column.tolist() if isinstance(column, np.ndarray) else column
+        for column in att_columns.values()
+    ] + [species_names.tolist(), xs.tolist(), ys.tolist()]
+
+    points = [
+        Point(row[-3], row[-2], row[-1], attributes=dict(zip(headers, row)))
+        for row in zip(*columns)
+    ]
+
+    if return_batch:
+        return PointBatch(points, x=xs, y=ys)
     return points
 
 
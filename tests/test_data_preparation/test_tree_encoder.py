@@ -35,18 +35,13 @@ class Test_TreeEncoder:
         _ = TreeEncoder(tree, pam)
 
     # ............................
-    def test_constructor_from_file(self, generate_temp_filename):
+    def test_constructor_from_file(self, data_files):
         """Test constructor from file.
 
         Args:
-            generate_temp_filename (pytest.fixture): Fixture to generate filenames.
+            data_files (pytest.fixture): Fixture to retrieve sample data files.
         """
-        tree = TreeWrapper.get(data='(A,(B,C));', schema='newick')
-        pam = Matrix(np.array([[1, 0, 1], [0, 1, 1], [1, 0, 0]]))
-        tree_filename = generate_temp_filename(suffix='.tre')
-        pam_filename = generate_temp_filename(suffix='.lmm')
-        tree.write(path=tree_filename, schema='newick')
-        pam.write(pam_filename)
+        tree_filename, pam_filename = data_files.get_tree_encoder_filenames()
         _ = TreeEncoder.from_file(tree_filename, pam_filename)
 
     # ............................
@@ -89,6 +84,18 @@ class Test_TreeEncoder:
             b = sorted(np.abs(test_tree_matrix[i]))
             assert np.all(np.isclose(a, b, atol=0.001))
 
+    # ............................
+    def test_encode_zero_length_clade(self):
+        """Test that encoding fails for a clade with zero total branch length."""
+        tree = TreeWrapper.get(data='((A:0.0,B:0.0):1.0,C:1.0);', schema='newick')
+        pam = Matrix(
+            np.ones((5, 3)),
+            headers={'0': [f'{i}' for i in range(5)], '1': ['A', 'B', 'C']}
+        )
+        encoder = TreeEncoder(tree, pam)
+        with pytest.raises(ZeroDivisionError):
+            encoder.encode_phylogeny()
+
     # ............................
     def test_encode_no_branch_lengths(self):
         """Test encoding a tree without branch lengths."""
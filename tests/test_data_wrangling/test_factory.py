@@ -1,7 +1,9 @@
 """Test the occurrence data wrangler factory module."""
+import functools
 import json
 import os
 
+from lmpy.data_wrangling import factory as factory_module
 from lmpy.data_wrangling.factory import WranglerFactory
 from lmpy.data_wrangling.base import _DataWrangler
 from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
@@ -10,6 +12,50 @@ from lmpy.data_wrangling.occurrence.unique_localities_wrangler import (
 )
 
 
+THIS_DIR_TAG = '$THIS_DIR$'
+
+
+# .....................................................................................
+def get_this_dir_hook(this_dir):
+    """Get a JSON object hook that substitutes the config directory into strings.
+
+    Args:
+        this_dir (str): The directory to substitute for `$THIS_DIR$`.
+
+    Returns:
+        Method: A function to use as the `object_hook` when loading JSON.
+    """
+    # ..................
+    def _substitute(value):
+        """Substitute the config directory into a string or list of strings.
+
+        Args:
+            value (object): A value parsed from JSON.
+
+        Returns:
+            object: The value with `$THIS_DIR$` replaced where present.
+        """
+        if isinstance(value, str):
+            return value.replace(THIS_DIR_TAG, this_dir)
+        if isinstance(value, list):
+            return [_substitute(val) for val in value]
+        return value
+
+    # ..................
+    def this_dir_hook(obj):
+        """Substitute the config directory into the values of a JSON object.
+
+        Args:
+            obj (dict): A JSON object as a dictionary.
+
+        Returns:
+            dict: The JSON object with `$THIS_DIR$` replaced in string values.
+        """
+        return {key: _substitute(val) for key, val in obj.items()}
+
+    return this_dir_hook
+
+
 # ............................................................................
 class Test_wrangler_factory:
     """Test the occurrence data wrangler factory."""
@@ -24,16 +70,11 @@ class Test_wrangler_factory:
         """
         factory = WranglerFactory()
 
+        this_dir = os.path.dirname(occurrence_wrangler_configuration).replace(
+            '\\', '/'
+        )
         with open(occurrence_wrangler_configuration) as in_file:
-            raw_string = in_file.read()
-            config = json.loads(
-                raw_string.replace(
-                    '$THIS_DIR$',
-                    os.path.dirname(occurrence_wrangler_configuration).replace(
-                        '\\', '/'
-                    ),
-                )
-            )
+            config = json.load(in_file, object_hook=get_this_dir_hook(this_dir))
         wranglers = factory.get_wranglers(config)
         assert wranglers[0]
 
@@ -55,3 +96,115 @@ def test_wrangler_from_config_with_module(generate_temp_filename):
     assert isinstance(wranglers[0], _DataWrangler)
     assert isinstance(wranglers[0], _OccurrenceDataWrangler)
     assert isinstance(wranglers[0], UniqueLocalitiesFilter)
+
+
+# .....................................................................................
+def _patch_entry_points(monkeypatch, fake_entry_points):
+    """Replace the installed entry points and clear the cached plugin wranglers.
+
+    Args:
+        monkeypatch (pytest.fixture): A fixture for monkeypatching code.
+        fake_entry_points (list): The entry points to use in place of installed ones.
+
+    Returns:
+        list: A list that records each scan for entry points.
+    """
+    scans = []
+
+    def get_fake_entry_points():
+        scans.append(True)
+        return fake_entry_points
+
+    monkeypatch.setattr(
+        factory_module, '_get_wrangler_entry_points', get_fake_entry_points
+    )
+    monkeypatch.setattr(
+        factory_module,
+        '_load_plugin_wranglers',
+        functools.lru_cache(maxsize=None)(
+            factory_module._load_plugin_wranglers.__wrapped__
+        ),
+    )
+    return scans
+
+
+# .....................................................................................
+def test_wrangler_from_entry_point(monkeypatch):
+    """Test that data wranglers registered by plugin entry points are loaded.
+
+    Args:
+        monkeypatch (pytest.fixture): A fixture for monkeypatching code.
+    """
+    class PluginLocalitiesFilter(UniqueLocalitiesFilter):
+        """A data wrangler provided by a plugin."""
+
+        name = 'PluginLocalitiesFilter'
+
+    class FakeEntryPoint:
+        """A stand-in for an installed package entry point."""
+
+        name = 'plugin_localities'
+
+        def load(self):
+            """Load the entry point.
+
+            Returns:
+                type: The plugin data wrangler class.
+            """
+            return PluginLocalitiesFilter
+
+    _patch_entry_points(monkeypatch, [FakeEntryPoint()])
+    factory = WranglerFactory()
+    wranglers = factory.get_wranglers({'wrangler_type': 'PluginLocalitiesFilter'})
+    assert len(wranglers) == 1
+    assert isinstance(wranglers[0], PluginLocalitiesFilter)
+
+
+# .....................................................................................
+def test_wrangler_entry_point_problems(monkeypatch):
+    """Test that broken or conflicting plugin entry points are skipped.
+
+    Args:
+        monkeypatch (pytest.fixture): A fixture for monkeypatching code.
+    """
+    class ConflictingFilter(UniqueLocalitiesFilter):
+        """A plugin data wrangler using the name of a built-in data wrangler."""
+
+        name = UniqueLocalitiesFilter.name
+
+    class BrokenEntryPoint:
+        """An entry point for a package that is not installed correctly."""
+
+        name = 'broken'
+
+        def load(self):
+            """Fail to load the entry point.
+
+            Raises:
+                ImportError: Always raised.
+            """
+            raise ImportError('No module named broken_plugin')
+
+    class ConflictingEntryPoint:
+        """An entry point for a data wrangler with a built-in name."""
+
+        name = 'conflicting'
+
+        def load(self):
+            """Load the entry point.
+
+            Returns:
+                type: The conflicting data wrangler class.
+            """
+            return ConflictingFilter
+
+    scans = _patch_entry_points(
+        monkeypatch, [BrokenEntryPoint(), ConflictingEntryPoint()]
+    )
+    factory = WranglerFactory()
+    wranglers = factory.get_wranglers({'wrangler_type': UniqueLocalitiesFilter.name})
+    assert type(wranglers[0]) is UniqueLocalitiesFilter
+
+    # Entry points are only scanned once
+    _ = WranglerFactory()
+    assert len(scans) == 1
@@ -12,7 +12,8 @@ def test_accepted_name_wrangler_matrix():
     """Test the accepted_name_wrangler."""
     # Name map
     name_map = {
-        f'Oldname {i}': 'Accepted {}'.format(np.random.randint(50)) for i in range(20)
+        f'Oldname {i}': f'Accepted {j}'
+        for i, j in enumerate(np.random.randint(50, size=20))
     }
     matrix = Matrix(
         np.random.randint(0, 100, size=(10, 20)),
@@ -24,7 +25,7 @@ def test_accepted_name_wrangler_matrix():
     wrangled_matrix = wrangler.wrangle_matrix(matrix)
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
 
     for hdr in wrangled_matrix.get_column_headers():
         assert hdr in accepted_names
@@ -40,7 +41,8 @@ def test_accepted_name_wrangler_unmatched_names_matrix():
     """Test the Accepted Name Wrangler with unmatched names."""
     # Name map
     name_map = {
-        f'Oldname {i}': 'Accepted {}'.format(np.random.randint(50)) for i in range(10)
+        f'Oldname {i}': f'Accepted {j}'
+        for i, j in enumerate(np.random.randint(50, size=10))
     }
     raw_names = list(name_map.keys())
     raw_names.extend([f'Unmatched {i}' for i in range(10)])
@@ -55,7 +57,7 @@ def test_accepted_name_wrangler_unmatched_names_matrix():
     wrangled_matrix = wrangler.wrangle_matrix(matrix)
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
 
     for hdr in wrangled_matrix.get_column_headers():
         assert hdr in accepted_names
@@ -1,7 +1,9 @@
 """Test the match_tree_wrangler module."""
+from collections import namedtuple
 from copy import deepcopy
 
 import numpy as np
+import pytest
 
 from lmpy.data_wrangling.matrix.match_species_list_wrangler import (
     MatchSpeciesListMatrixWrangler,
@@ -11,20 +13,47 @@ from lmpy.species_list import SpeciesList
 
 
 # .....................................................................................
-def test_match_species_list_wrangler_from_filename(generate_temp_filename):
-    """Test subsetting and reordering matrix slices to match a species list filename.
+SpeciesScenario = namedtuple(
+    'SpeciesScenario', ['all_species', 'matrix_species', 'species_list']
+)
 
-    Args:
-        generate_temp_filename (pytest.fixture): A fixture for generating filenames.
+
+# .....................................................................................
+@pytest.fixture(scope='session')
+def species_scenario():
+    """Get species for a matrix and a species list to match.
+
+    Both selections draw more than half of the species pool so they are guaranteed to
+    share at least one species.
+
+    Yields:
+        SpeciesScenario: All species, matrix species, and a species list.
     """
+    rng = np.random.default_rng(42)
     # All species
     all_species = [f'Species {i}' for i in range(100)]
     # Shuffle species for selection in matrix
-    np.random.shuffle(all_species)
-    matrix_species = all_species[:np.random.randint(51, 75)]
-    # Shuffle species for selection in tree
-    np.random.shuffle(all_species)
-    species_list = SpeciesList(all_species[:np.random.randint(51, 75)])
+    matrix_species = rng.permutation(all_species).tolist()[:rng.integers(51, 75)]
+    # Shuffle species for selection in species list
+    species_list = SpeciesList(
+        rng.permutation(all_species).tolist()[:rng.integers(51, 75)]
+    )
+    yield SpeciesScenario(all_species, matrix_species, species_list)
+
+
+# .....................................................................................
+def test_match_species_list_wrangler_from_filename(
+    generate_temp_filename,
+    species_scenario,
+):
+    """Test subsetting and reordering matrix slices to match a species list filename.
+
+    Args:
+        generate_temp_filename (pytest.fixture): A fixture for generating filenames.
+        species_scenario (pytest.fixture): A fixture providing test species.
+    """
+    matrix_species = species_scenario.matrix_species
+    species_list = species_scenario.species_list
 
     num_cols = 100
 
@@ -33,7 +62,7 @@ def test_match_species_list_wrangler_from_filename(generate_temp_filename):
         np.ones((len(matrix_species), num_cols)),
         headers={
             '1': [f'Col {i}' for i in range(num_cols)],
-            '0': matrix_species
+            '0': deepcopy(matrix_species)
         }
     )
 
@@ -43,7 +72,7 @@ def test_match_species_list_wrangler_from_filename(generate_temp_filename):
 
     # Wrangle
     wrangler = MatchSpeciesListMatrixWrangler(species_list_filename, 0)
-    wrangled_matrix = wrangler.wrangle_matrix(deepcopy(test_matrix))
+    wrangled_matrix = wrangler.wrangle_matrix(test_matrix)
 
     # Check that number of rows is less than or equal to len(matrix_species)
     assert wrangled_matrix.shape[0] <= len(matrix_species)
@@ -62,16 +91,14 @@ def test_match_species_list_wrangler_from_filename(generate_temp_filename):
 
 
 # .....................................................................................
-def test_match_species_list_wrangler_from_species_list():
-    """Test subsetting and reordering matrix slices to match a species list."""
-    # All species
-    all_species = [f'Species {i}' for i in range(100)]
-    # Shuffle species for selection in matrix
-    np.random.shuffle(all_species)
-    matrix_species = all_species[:np.random.randint(51, 75)]
-    # Shuffle species for selection in tree
-    np.random.shuffle(all_species)
-    species_list = SpeciesList(all_species[:np.random.randint(51, 75)])
+def test_match_species_list_wrangler_from_species_list(species_scenario):
+    """Test subsetting and reordering matrix slices to match a species list.
+
+    Args:
+        species_scenario (pytest.fixture): A fixture providing test species.
+    """
+    matrix_species = species_scenario.matrix_species
+    species_list = species_scenario.species_list
 
     num_cols = 100
 
@@ -80,13 +107,13 @@ def test_match_species_list_wrangler_from_species_list():
         np.ones((len(matrix_species), num_cols)),
         headers={
             '1': [f'Col {i}' for i in range(num_cols)],
-            '0': matrix_species
+            '0': deepcopy(matrix_species)
         }
     )
 
     # Wrangle
     wrangler = MatchSpeciesListMatrixWrangler(species_list, 0)
-    wrangled_matrix = wrangler.wrangle_matrix(deepcopy(test_matrix))
+    wrangled_matrix = wrangler.wrangle_matrix(test_matrix)
 
     # Check that number of rows is less than or equal to len(matrix_species)
     assert wrangled_matrix.shape[0] <= len(matrix_species)
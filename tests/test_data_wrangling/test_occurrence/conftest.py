@@ -0,0 +1,141 @@
+"""Shared simulated point fixtures for the occurrence wrangler tests."""
+import pytest
+
+from lmpy.point import Point
+
+from tests.data_simulator import (
+    generate_points,
+    get_random_choice_func,
+    get_random_float_func,
+    SimulatedField,
+)
+
+
+# .....................................................................................
+def _simulate_points(min_x, min_y, max_x, max_y, fields=None, count=1000):
+    """Simulate points for a single species within a bounding box.
+
+    Args:
+        min_x (float): The minimum x value to generate.
+        min_y (float): The minimum y value to generate.
+        max_x (float): The maximum x value to generate.
+        max_y (float): The maximum y value to generate.
+        fields (list of SimulatedField): Additional fields to generate.
+        count (int): The number of points to generate.
+
+    Returns:
+        list of Point: A list of simulated points.
+    """
+    return generate_points(
+        count,
+        SimulatedField(
+            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(['Species A']), 'str'
+        ),
+        SimulatedField(
+            Point.X_ATTRIBUTE, '', get_random_float_func(min_x, max_x, 2, 6), 'float'),
+        SimulatedField(
+            Point.Y_ATTRIBUTE, '', get_random_float_func(min_y, max_y, 2, 6), 'float'),
+        fields if fields is not None else []
+    )
+
+
+# .....................................................................................
+@pytest.fixture(scope='session')
+def global_points():
+    """Get 1000 points distributed across the globe.
+
+    Note:
+        * The points are shared across tests, deep copy them before mutating.
+
+    Returns:
+        list of Point: A list of simulated points.
+    """
+    return _simulate_points(-180.0, -90.0, 180.0, 90.0)
+
+
+# .....................................................................................
+@pytest.fixture(scope='session')
+def negative_quadrant_points():
+    """Get 1000 points with negative x and y values.
+
+    Note:
+        * The points are shared across tests, deep copy them before mutating.
+
+    Returns:
+        list of Point: A list of simulated points.
+    """
+    return _simulate_points(-180.0, -90.0, 0.0, 0.0)
+
+
+# .....................................................................................
+@pytest.fixture(scope='session')
+def common_format_attribute_map():
+    """Get an attribute map for testing the CommonFormatWrangler.
+
+    Returns:
+        dict: A mapping of input attribute names to output attribute names.
+    """
+    return {
+        'in_name_a': 'out_name_a',
+        'in_name_b': 'out_name_b',
+        'in_name_c': 'out_name_c',
+    }
+
+
+# .....................................................................................
+@pytest.fixture(scope='session')
+def common_format_points(common_format_attribute_map):
+    """Get 1000 global points with the input attributes of the attribute map.
+
+    Args:
+        common_format_attribute_map (pytest.fixture): A mapping of input attribute
+            names to output attribute names.
+
+    Returns:
+        list of Point: A list of simulated points.
+    """
+    return _simulate_points(
+        -180.0,
+        -90.0,
+        180.0,
+        90.0,
+        fields=[
+            SimulatedField(
+                fld_name,
+                '',
+                get_random_float_func(1, 100, 3, 5),
+                'float'
+            ) for fld_name in common_format_attribute_map.keys()
+        ]
+    )
+
+
+# .....................................................................................
+@pytest.fixture
+def x_reads(monkeypatch):
+    """Get a list recording each read of a Point x coordinate during a test.
+
+    Args:
+        monkeypatch (pytest.fixture): A fixture for patching class attributes.
+
+    Returns:
+        list: A list that gets an item appended each time a Point x value is read.
+    """
+    reads = []
+    x_slot = Point.x
+
+    # ..................
+    def get_x(point):
+        """Record the read and get the x coordinate of the point.
+
+        Args:
+            point (Point): The point being read.
+
+        Returns:
+            float: The x coordinate of the point.
+        """
+        reads.append(1)
+        return x_slot.__get__(point)
+
+    monkeypatch.setattr(Point, 'x', property(get_x, x_slot.__set__))
+    return reads
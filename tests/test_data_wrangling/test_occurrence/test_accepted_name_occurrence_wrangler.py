@@ -1,13 +1,19 @@
 """Test the accepted_name_wrangler module."""
+from functools import lru_cache
 import json
+import threading
+import time
+import urllib.parse
 
 import numpy as np
+import pytest
 
+from lmpy.data_wrangling.common import accepted_name_wrangler as accepted_name_module
 from lmpy.data_wrangling.occurrence.accepted_name_wrangler import (
     AcceptedNameOccurrenceWrangler,
 )
 
-from lmpy.point import Point
+from lmpy.point import Point, PointBatch
 
 from tests.data_simulator import (
     generate_points,
@@ -18,6 +24,91 @@ from tests.data_simulator import (
 )
 
 
+# .....................................................................................
+@pytest.fixture
+def name_map():
+    """Get a name map.
+
+    Wranglers add resolved names to the name map they are given, so a new name map is
+    created for each test.
+
+    Returns:
+        dict: A mapping of 10 original names to accepted names.
+    """
+    return {
+        f'Oldname {i}': f'Accepted {j}'
+        for i, j in enumerate(np.random.randint(50, size=10))
+    }
+
+
+# .....................................................................................
+@pytest.fixture
+def raw_names(name_map):
+    """Get the names in the name map along with names that are not in it.
+
+    Args:
+        name_map (pytest.fixture): A name map with 10 entries.
+
+    Returns:
+        list of str: The name map keys followed by 10 unmatched names.
+    """
+    return list(name_map.keys()) + [f'Unmatched {i}' for i in range(10)]
+
+
+# .....................................................................................
+@pytest.fixture
+def point_fields(raw_names):
+    """Get species, x, and y simulated fields for generating points.
+
+    Args:
+        raw_names (pytest.fixture): The names to choose species names from.
+
+    Returns:
+        tuple of SimulatedField: The species, x, and y fields.
+    """
+    return (
+        SimulatedField(
+            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(raw_names), 'str'
+        ),
+        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
+        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
+    )
+
+
+# .....................................................................................
+@pytest.fixture
+def unmatched_points(point_fields):
+    """Get 1000 points, some of which have names missing from the name map.
+
+    Wranglers modify points in place, so new points are generated for each test.
+
+    Args:
+        point_fields (pytest.fixture): Simulated fields for generating points.
+
+    Returns:
+        list of Point: The generated points.
+    """
+    return generate_points(1000, *point_fields, [])
+
+
+# .....................................................................................
+_random_accepted_name = get_random_string_func(8, 20, do_capitalize=True)
+
+
+# .....................................................................................
+@lru_cache(maxsize=None)
+def _dummy_resolve_name(name_str):
+    """Randomly generate an accepted name, always the same for a given name.
+
+    Args:
+        name_str (str): A name string to resolve.
+
+    Returns:
+        str: A random accepted name.
+    """
+    return _random_accepted_name()
+
+
 # .....................................................................................
 def dummy_name_resolver(names):
     """A dummy name resolver for testing.
@@ -28,11 +119,7 @@ def dummy_name_resolver(names):
     Returns:
         dict: Input names are keys and resolved name or None are values.
     """
-    resolved_names = {}
-    for name_str in names:
-        # Randomly generate an accepted name
-        resolved_names[name_str] = get_random_string_func(8, 20, do_capitalize=True)()
-    return resolved_names
+    return {name_str: _dummy_resolve_name(name_str) for name_str in names}
 
 
 # .....................................................................................
@@ -40,7 +127,8 @@ def test_accepted_name_wrangler():
     """Test the accepted_name_wrangler."""
     # Name map
     name_map = {
-        f'Oldname {i}': 'Accepted {}'.format(np.random.randint(50)) for i in range(20)
+        f'Oldname {i}': f'Accepted {j}'
+        for i, j in enumerate(np.random.randint(50, size=20))
     }
     # Generate points
     points = generate_points(
@@ -58,7 +146,7 @@ def test_accepted_name_wrangler():
     wrangled_points = wrangler.wrangle_points(points)
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
 
     for pt in wrangled_points:
         assert pt.species_name in accepted_names
@@ -71,24 +159,14 @@ def test_accepted_name_wrangler():
 
 
 # .....................................................................................
-def test_accepted_name_wrangler_unmatched_names():
-    """Test the Accepted Name Wrangler with unmatched names."""
-    # Name map
-    name_map = {
-        f'Oldname {i}': 'Accepted {}'.format(np.random.randint(50)) for i in range(10)
-    }
-    raw_names = list(name_map.keys())
-    raw_names.extend([f'Unmatched {i}' for i in range(10)])
-    # Generate points
-    points = generate_points(
-        1000,
-        SimulatedField(
-            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(raw_names), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
-    )
+def test_accepted_name_wrangler_unmatched_names(name_map, unmatched_points):
+    """Test the Accepted Name Wrangler with unmatched names.
+
+    Args:
+        name_map (pytest.fixture): A name map with 10 entries.
+        unmatched_points (pytest.fixture): Points that include unmatched names.
+    """
+    points = unmatched_points
 
     # Wrangle points
     wrangler = AcceptedNameOccurrenceWrangler(name_map)
@@ -98,7 +176,7 @@ def test_accepted_name_wrangler_unmatched_names():
     assert len(wrangled_points) < len(points)
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
 
     for pt in wrangled_points:
         assert pt.species_name in accepted_names
@@ -111,24 +189,87 @@ def test_accepted_name_wrangler_unmatched_names():
 
 
 # .....................................................................................
-def test_accepted_name_wrangler_store_original():
-    """Test the accepted_name_wrangler while storing original name values."""
-    # Name map
-    name_map = {
-        f'Oldname {i}': 'Accepted {}'.format(np.random.randint(50)) for i in range(10)
-    }
-    raw_names = list(name_map.keys())
-    raw_names.extend([f'Unmatched {i}' for i in range(10)])
-    # Generate points
-    points = generate_points(
-        1000,
-        SimulatedField(
-            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(raw_names), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
+def test_accepted_name_wrangler_point_batch(name_map, point_fields):
+    """Test the accepted_name_wrangler with a batch of points.
+
+    Args:
+        name_map (pytest.fixture): A name map with 10 entries.
+        point_fields (pytest.fixture): Simulated fields for generating points.
+    """
+    points = generate_points(1000, *point_fields, [], return_batch=True)
+
+    # Wrangle points
+    wrangler = AcceptedNameOccurrenceWrangler(name_map)
+    wrangled_points = wrangler.wrangle_points(points)
+    assert isinstance(wrangled_points, PointBatch)
+
+    # Test that names are correct for both the columns and the points
+    accepted_names = set(name_map.values())
+    for name, pt in zip(wrangled_points.species_name, wrangled_points):
+        assert name in accepted_names
+        assert pt.species_name == name
+
+    # Get the report
+    report = wrangler.get_report()
+    assert report['assessed'] == len(points)
+    assert report['modified'] == len(points)
+    assert report['filtered'] == len(points) - len(wrangled_points)
+
+
+# .....................................................................................
+def test_accepted_name_wrangler_unmatched_names_resolved_once(
+    name_map,
+    point_fields,
+):
+    """Test that unmatched names are only sent to the name resolver once.
+
+    Args:
+        name_map (pytest.fixture): A name map with 10 entries.
+        point_fields (pytest.fixture): Simulated fields for generating points.
+    """
+    resolver_calls = []
+
+    # .......................
+    def failing_name_resolver(names):
+        """Fail to resolve any of the names.
+
+        Args:
+            names (list of str): A list of name strings to resolve.
+
+        Returns:
+            dict: Input names are keys and None are values.
+        """
+        resolver_calls.append(sorted(names))
+        return {name: None for name in names}
+
+    wrangler = AcceptedNameOccurrenceWrangler(
+        name_map, name_resolver=failing_name_resolver
     )
+    for _ in range(2):
+        points = generate_points(1000, *point_fields, [])
+        wrangled_points = wrangler.wrangle_points(points)
+        for pt in wrangled_points:
+            assert pt.species_name in name_map.values()
+
+    # Misses are resolved in one call and remembered for the next batch
+    assert len(resolver_calls) == 1
+    assert all(name.startswith('Unmatched') for name in resolver_calls[0])
+
+
+# .....................................................................................
+def test_accepted_name_wrangler_store_original(
+    name_map,
+    raw_names,
+    unmatched_points,
+):
+    """Test the accepted_name_wrangler while storing original name values.
+
+    Args:
+        name_map (pytest.fixture): A name map with 10 entries.
+        raw_names (pytest.fixture): The name map keys and unmatched names.
+        unmatched_points (pytest.fixture): Points that include unmatched names.
+    """
+    points = unmatched_points
 
     # Wrangle points
     wrangler = AcceptedNameOccurrenceWrangler(
@@ -140,11 +281,12 @@ def test_accepted_name_wrangler_store_original():
     assert len(wrangled_points) < len(points)
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
+    original_names = set(raw_names)
 
     for pt in wrangled_points:
         assert pt.species_name in accepted_names
-        assert pt.get_attribute('original_name') in raw_names
+        assert pt.get_attribute('original_name') in original_names
 
     # Get the report
     report = wrangler.get_report()
@@ -154,24 +296,14 @@ def test_accepted_name_wrangler_store_original():
 
 
 # .....................................................................................
-def test_accepted_name_wrangler_unmatched_names_dont_remove():
-    """Test the accepted_name_wrangler with unmatched names, but don't remove them."""
-    # Name map
-    name_map = {
-        f'Oldname {i}': 'Accepted {}'.format(np.random.randint(50)) for i in range(10)
-    }
-    raw_names = list(name_map.keys())
-    raw_names.extend([f'Unmatched {i}' for i in range(10)])
-    # Generate points
-    points = generate_points(
-        1000,
-        SimulatedField(
-            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(raw_names), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
-    )
+def test_accepted_name_wrangler_unmatched_names_dont_remove(name_map, unmatched_points):
+    """Test the accepted_name_wrangler with unmatched names, but don't remove them.
+
+    Args:
+        name_map (pytest.fixture): A name map with 10 entries.
+        unmatched_points (pytest.fixture): Points that include unmatched names.
+    """
+    points = unmatched_points
 
     # Wrangle points
     wrangler = AcceptedNameOccurrenceWrangler(
@@ -183,7 +315,7 @@ def test_accepted_name_wrangler_unmatched_names_dont_remove():
     assert len(wrangled_points) == len(points)
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
 
     for pt in wrangled_points:
         # Check assessed value
@@ -214,7 +346,7 @@ def test_accepted_name_wrangler_from_config(generate_temp_filename):
         ('Newname a', 'Newname a')
     ]
     raw_names = [i for i, _ in name_pairs]
-    accepted_names = [j for _, j in name_pairs]
+    accepted_names = {j for _, j in name_pairs}
 
     temp_filename = generate_temp_filename(suffix='.csv')
     with open(temp_filename, mode='wt') as temp_out:
@@ -253,6 +385,65 @@ def test_accepted_name_wrangler_from_config(generate_temp_filename):
     assert report['filtered'] == 0
 
 
+# .....................................................................................
+def test_accepted_name_wrangler_shared_map_file(generate_temp_filename):
+    """Test that wranglers loading the same name map file do not share the map.
+
+    Args:
+        generate_temp_filename (pytest.fixture): Fixture to generate filenames.
+    """
+    temp_filename = generate_temp_filename(suffix='.json')
+    with open(temp_filename, mode='wt') as temp_out:
+        json.dump({'Oldname a1': 'Newname a'}, temp_out)
+
+    wrangler_1 = AcceptedNameOccurrenceWrangler(
+        name_map=temp_filename, name_resolver=dummy_name_resolver
+    )
+    wrangler_2 = AcceptedNameOccurrenceWrangler(name_map=temp_filename)
+    assert wrangler_1.name_map == wrangler_2.name_map
+
+    # Resolving new names in one wrangler should not change the other
+    wrangler_1.resolve_names(['Oldname b1'])
+    assert 'Oldname b1' in wrangler_1.name_map
+    assert 'Oldname b1' not in wrangler_2.name_map
+
+    # Changing the file should cause it to be read again
+    with open(temp_filename, mode='wt') as temp_out:
+        json.dump({'Oldname a1': 'Newname a', 'Oldname c1': 'Newname c'}, temp_out)
+    wrangler_3 = AcceptedNameOccurrenceWrangler(name_map=temp_filename)
+    assert wrangler_3.name_map['Oldname c1'] == 'Newname c'
+
+
+# .....................................................................................
+def test_accepted_name_wrangler_memory_mapped_map_files(
+    generate_temp_filename,
+    monkeypatch,
+):
+    """Test that name map files read through a memory map load correctly.
+
+    Args:
+        generate_temp_filename (pytest.fixture): Fixture to generate filenames.
+        monkeypatch (pytest.fixture): Fixture for patching module attributes.
+    """
+    monkeypatch.setattr(accepted_name_module, 'MMAP_MIN_SIZE', 0)
+    name_map = {f'Oldname {i}': f'Accepted {i}' for i in range(10)}
+    # Accepted names may include an authorship with a comma
+    name_map['Oldname 10'] = 'Accepted 10 Author, 1850'
+
+    json_filename = generate_temp_filename(suffix='.json')
+    with open(json_filename, mode='wt') as temp_out:
+        json.dump(name_map, temp_out)
+    wrangler = AcceptedNameOccurrenceWrangler(name_map=json_filename)
+    assert wrangler.name_map == name_map
+
+    csv_filename = generate_temp_filename(suffix='.csv')
+    with open(csv_filename, mode='wt') as temp_out:
+        for old_name, new_name in name_map.items():
+            temp_out.write(f'{old_name},{new_name}\n')
+    wrangler = AcceptedNameOccurrenceWrangler(name_map=csv_filename)
+    assert wrangler.name_map == name_map
+
+
 # .....................................................................................
 def test_accepted_name_wrangler_write_to_file_json(generate_temp_filename):
     """Test that writing updated name map to json file works correctly.
@@ -324,3 +515,146 @@ def test_accepted_name_wrangler_write_to_file_csv(generate_temp_filename):
             assert len(line.split(',')) == 2
             i += 1
         assert i > 0
+
+
+# .....................................................................................
+def test_accepted_name_wrangler_append_to_file_csv(generate_temp_filename):
+    """Test that names resolved in later batches are appended to a csv name map.
+
+    Args:
+        generate_temp_filename (pytest.Fixture): A fixture for generating filenames.
+    """
+    name_map_filename = generate_temp_filename(suffix='.csv')
+    wrangler = AcceptedNameOccurrenceWrangler(
+        name_resolver=dummy_name_resolver,
+        out_map_filename=name_map_filename,
+        map_write_interval=1,
+        out_map_format='csv',
+    )
+    for batch_prefix in ['First', 'Second']:
+        name_pool = [f'{batch_prefix} {i}' for i in range(10)]
+        points = generate_points(
+            100,
+            SimulatedField(
+                Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(name_pool), 'str'
+            ),
+            SimulatedField(
+                'x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'
+            ),
+            SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
+            []
+        )
+        _ = wrangler.wrangle_points(points)
+    resolved_names = set(wrangler.name_map.keys())
+    del wrangler
+
+    # Check that there is one header line and each resolved name is written once
+    with open(name_map_filename, mode='rt') as out_name_file:
+        lines = out_name_file.read().splitlines()
+    assert lines[0] == 'Name,Accepted'
+    written_names = [line.split(',')[0] for line in lines[1:]]
+    assert len(written_names) == len(resolved_names)
+    assert set(written_names) == resolved_names
+
+
+# .....................................................................................
+class _FakeGbifResponse:
+    """A stand-in for a GBIF species match response."""
+
+    def __init__(self, name_str):
+        """Constructor for a fake GBIF response.
+
+        Args:
+            name_str (str): The name string that was matched.
+        """
+        self.name_str = name_str
+
+    def json(self):
+        """Get the response content.
+
+        Returns:
+            dict: An accepted species match for the name.
+        """
+        return {
+            'status': 'ACCEPTED',
+            'scientificName': f'Accepted {self.name_str} Author',
+            'canonicalName': f'Accepted {self.name_str}',
+        }
+
+
+# .....................................................................................
+@pytest.fixture
+def fake_gbif(monkeypatch):
+    """Replace GBIF requests with a slow local fake.
+
+    Args:
+        monkeypatch (pytest.fixture): Fixture for patching module attributes.
+
+    Returns:
+        dict: Request start times and the most requests in flight at once.
+    """
+    lock = threading.Lock()
+    stats = {'starts': [], 'in_flight': 0, 'max_in_flight': 0}
+
+    def fake_get(url):
+        with lock:
+            stats['starts'].append(time.monotonic())
+            stats['in_flight'] += 1
+            stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+        time.sleep(0.1)
+        with lock:
+            stats['in_flight'] -= 1
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+        return _FakeGbifResponse(query['name'][0])
+
+    monkeypatch.setattr(accepted_name_module.requests, 'get', fake_get)
+    monkeypatch.setattr(accepted_name_module, '_last_gbif_request', [0.0])
+    return stats
+
+
+# .....................................................................................
+def test_resolve_names_gbif_threaded(fake_gbif):
+    """Test that threaded GBIF resolution matches serial and keeps the throttle.
+
+    Args:
+        fake_gbif (pytest.fixture): Fixture replacing GBIF requests.
+    """
+    names = [f'Name {i}' for i in range(8)]
+    wait_time = 0.02
+    serial = accepted_name_module.resolve_names_gbif(names, wait_time=wait_time)
+    assert fake_gbif['max_in_flight'] == 1
+
+    fake_gbif['starts'].clear()
+    start_time = time.monotonic()
+    threaded = accepted_name_module.resolve_names_gbif(
+        names, wait_time=wait_time, max_workers=4
+    )
+    assert threaded == serial
+    assert threaded['Name 3'] == 'Accepted Name 3'
+    assert fake_gbif['max_in_flight'] > 1
+    # Requests from all workers are still spaced by wait_time
+    assert fake_gbif['starts'][-1] - start_time >= (len(names) - 1) * wait_time
+
+
+# .....................................................................................
+def test_accepted_name_wrangler_gbif_max_workers(
+    fake_gbif,
+    point_fields,
+    monkeypatch,
+):
+    """Test that the wrangler resolves names with GBIF using multiple workers.
+
+    Args:
+        fake_gbif (pytest.fixture): Fixture replacing GBIF requests.
+        point_fields (pytest.fixture): Simulated fields for generating points.
+        monkeypatch (pytest.fixture): Fixture for patching module attributes.
+    """
+    # The default wait time is longer than a fake request, skip the throttle
+    monkeypatch.setattr(accepted_name_module, '_wait_for_gbif', lambda wait_time: None)
+    wrangler = AcceptedNameOccurrenceWrangler(name_resolver='gbif', max_workers=4)
+    assert wrangler._name_resolver.keywords == {'max_workers': 4}
+    points = generate_points(20, *point_fields, [])
+    wrangled_points = wrangler.wrangle_points(points)
+    assert fake_gbif['max_in_flight'] > 1
+    for point in wrangled_points:
+        assert point.species_name.startswith('Accepted ')
@@ -0,0 +1,62 @@
+"""Test the attribute_filter_wrangler module."""
+from lmpy.data_wrangling.occurrence.attribute_filter_wrangler import (
+    AttributeFilterWrangler,
+)
+
+from lmpy.point import Point
+
+
+# .....................................................................................
+def test_attribute_filter_for_each_not_in():
+    """Test the AttributeFilterWrangler with a for-each not-in filter."""
+    points = [
+        Point('Species A', 1, 1, attributes={'issue': ['GOOD']}),
+        Point('Species A', 2, 2, attributes={'issue': ['GOOD', 'BAD']}),
+        Point('Species A', 3, 3, attributes={'issue': []}),
+        Point('Species A', 4, 4),
+        Point('Species A', 5, 5, attributes={'issue': ['WORSE']}),
+    ]
+    wrangler = AttributeFilterWrangler.from_config(
+        {
+            'attribute_name': 'issue',
+            'filter_func': {
+                'for-each': {'condition': 'not-in', 'values': ['BAD', 'WORSE']}
+            },
+        }
+    )
+    wrangled_points = wrangler.wrangle_points(points)
+
+    assert wrangled_points == [points[0], points[2], points[3]]
+
+    report = wrangler.get_report()
+    assert report['assessed'] == len(points)
+    assert report['filtered'] == 2
+
+
+# .....................................................................................
+def test_attribute_filter_for_each_not_in_single_value():
+    """Test that a string attribute is checked as a single value."""
+    points = [
+        Point('Species A', 1, 1, attributes={'issue': 'BAD'}),
+        Point('Species A', 2, 2, attributes={'issue': 'GOOD'}),
+        Point('Species A', 3, 3, attributes={'issue': 'B'}),
+    ]
+    wrangler = AttributeFilterWrangler(
+        'issue', {'for-each': {'condition': 'not-in', 'values': ['BAD', 'B']}}
+    )
+    wrangled_points = wrangler.wrangle_points(points)
+
+    assert wrangled_points == [points[1]]
+
+
+# .....................................................................................
+def test_attribute_filter_func():
+    """Test the AttributeFilterWrangler with a filter function."""
+    points = [Point('Species A', i, i, attributes={'val': i}) for i in range(10)]
+    wrangler = AttributeFilterWrangler(
+        'val', lambda point: point.get_attribute('val') % 2 == 0
+    )
+    wrangled_points = wrangler.wrangle_points(points)
+
+    assert len(wrangled_points) == 5
+    assert all(pt.get_attribute('val') % 2 == 0 for pt in wrangled_points)
@@ -1,11 +1,12 @@
 """Test the attribute_modifier_wrangler module."""
 import numpy as np
+import pytest
 
 from lmpy.data_wrangling.occurrence.attribute_modifier_wrangler import (
     AttributeModifierWrangler,
 )
 
-from lmpy.point import Point
+from lmpy.point import Point, PointBatch
 
 from tests.data_simulator import (
     generate_points,
@@ -48,3 +49,85 @@ def test_attribute_modifier_wrangler():
     for pt in wrangled_points:
         dist = pt.get_attribute('distance')
         assert np.isclose(dist, np.sqrt(pt.x**2 + pt.y**2))
+
+
+# .....................................................................................
+def test_attribute_modifier_wrangler_array_func():
+    """Test the AttributeModifierWrangler class with a vectorized function."""
+    # Test points
+    points = generate_points(
+        1000,
+        SimulatedField(
+            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(['Species A']), 'str'
+        ),
+        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
+        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
+        []
+    )
+
+    wrangler = AttributeModifierWrangler(
+        'distance', array_func=lambda batch: np.hypot(batch.x, batch.y)
+    )
+    wrangled_points = wrangler.wrangle_points(points)
+    assert len(wrangled_points) == len(points)
+
+    # Check that each point has the distance attribute and that it is correct
+    for pt in wrangled_points:
+        dist = pt.get_attribute('distance')
+        assert np.isclose(dist, np.sqrt(pt.x**2 + pt.y**2))
+
+    # Check that a single point is wrangled the same way
+    pt = wrangler.wrangle_single_point(Point('Species A', 3.0, 4.0))
+    assert np.isclose(pt.get_attribute('distance'), 5.0)
+
+    report = wrangler.get_report()
+    assert report['assessed'] == len(points) + 1
+    assert report['modified'] == len(points) + 1
+
+
+# .....................................................................................
+def test_attribute_modifier_wrangler_from_config():
+    """Test the AttributeModifierWrangler with a named array function."""
+    points = generate_points(
+        100,
+        SimulatedField(
+            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(['Species A']), 'str'
+        ),
+        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
+        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
+        []
+    )
+
+    wrangler = AttributeModifierWrangler.from_config(
+        {'attribute_name': 'distance', 'array_func': 'distance_from_origin'}
+    )
+    for pt in wrangler.wrangle_points(points):
+        assert np.isclose(pt.get_attribute('distance'), np.hypot(pt.x, pt.y))
+
+
+# .....................................................................................
+def test_attribute_modifier_wrangler_small_batches():
+    """Test the AttributeModifierWrangler with empty and single point batches."""
+    wrangler = AttributeModifierWrangler(
+        'distance', array_func='distance_from_origin', store_attribute='assessed'
+    )
+    assert wrangler.wrangle_points([]) == []
+    assert len(wrangler.wrangle_points(PointBatch([]))) == 0
+
+    wrangled_points = wrangler.wrangle_points(PointBatch([Point('Species A', 3, 4)]))
+    assert isinstance(wrangled_points, PointBatch)
+    assert np.isclose(wrangled_points[0].get_attribute('distance'), 5.0)
+    assert wrangled_points[0].get_attribute('assessed') == 0
+
+    report = wrangler.get_report()
+    assert report['assessed'] == 1
+    assert report['modified'] == 1
+
+
+# .....................................................................................
+def test_attribute_modifier_invalid_functions():
+    """Test that the wrangler rejects missing or unknown functions."""
+    with pytest.raises(ValueError):
+        AttributeModifierWrangler('distance')
+    with pytest.raises(ValueError, match='distance_from_origin'):
+        AttributeModifierWrangler('distance', array_func='distance_from_orign')
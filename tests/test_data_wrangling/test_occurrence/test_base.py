@@ -0,0 +1,91 @@
+"""Test the occurrence data wrangler base module."""
+import numpy as np
+
+from lmpy.data_wrangling.occurrence.base import _OccurrenceDataWrangler
+from lmpy.data_wrangling.occurrence.bounding_box_wrangler import BoundingBoxFilter
+from lmpy.data_wrangling.occurrence.decimal_precision_wrangler import (
+    DecimalPrecisionFilter,
+)
+from lmpy.data_wrangling.occurrence.unique_localities_wrangler import (
+    UniqueLocalitiesFilter,
+)
+from lmpy.point import Point, PointBatch
+
+
+# .....................................................................................
+class _MoveSpeciesBWrangler(_OccurrenceDataWrangler):
+    """Test wrangler that moves the points of Species b."""
+
+    name = '_MoveSpeciesBWrangler'
+
+    # .......................
+    def _modify_point(self, point):
+        """Move Species b points to the origin.
+
+        Args:
+            point (Point): A point to modify.
+
+        Returns:
+            Point, bool: The point and if it was modified.
+        """
+        if point.species_name == 'Species b':
+            return Point(point.species_name, 0, 0), True
+        return point, False
+
+
+# .....................................................................................
+def test_filter_keeps_batch():
+    """Test that wranglers without point modifications keep the input batch."""
+    batch = PointBatch([Point('Species a', 1, 2), Point('Species b', 3, 4)])
+    _ = batch.x
+    mod_batch, is_modified = BoundingBoxFilter(0, 0, 10, 10)._modify_points(batch)
+    assert mod_batch is batch
+    assert not is_modified.any()
+
+
+# .....................................................................................
+def test_modify_points_reuses_columns():
+    """Test that modified batches reuse the cached columns of unmodified points."""
+    batch = PointBatch(
+        [Point('Species a', 1, 2), Point('Species b', 3, 4), Point('Species a', 5, 6)]
+    )
+    _ = batch.x
+    wrangler = _MoveSpeciesBWrangler()
+    mod_batch, is_modified = wrangler._modify_points(batch)
+    assert list(is_modified) == [False, True, False]
+    assert mod_batch[0] is batch[0]
+    assert mod_batch._x is not None
+    assert np.array_equal(mod_batch.x, [1.0, 0.0, 5.0])
+    assert np.array_equal(mod_batch.y, [2.0, 0.0, 6.0])
+
+    wrangled_points = wrangler.wrangle_points(list(batch))
+    assert [pt.x for pt in wrangled_points] == [1.0, 0.0, 5.0]
+    assert wrangler.get_report()['modified'] == 1
+
+
+# .....................................................................................
+def test_chain_reuses_columns(x_reads):
+    """Test that a chain of filters reads point coordinates once and skips failures.
+
+    Args:
+        x_reads (pytest.fixture): A list recording reads of point x coordinates.
+    """
+    points = [Point('Species a', i % 50 + 0.5, i % 50 + 0.25) for i in range(100)]
+    num_reads = len(x_reads)
+
+    batch = PointBatch(points)
+    wranglers = [
+        UniqueLocalitiesFilter(),
+        BoundingBoxFilter(0, 0, 100, 100),
+        DecimalPrecisionFilter(1),
+    ]
+    for wrangler in wranglers:
+        batch = wrangler.wrangle_points(batch)
+
+    assert len(batch) == 50
+    assert len(x_reads) - num_reads == len(points)
+
+    # Later wranglers only assess the points that passed the earlier ones
+    assert [wrangler.get_report()['assessed'] for wrangler in wranglers] == [
+        100, 50, 50
+    ]
@@ -1,30 +1,21 @@
 """Tests for the bounding_box_wrangler module."""
-from lmpy.data_wrangling.occurrence.bounding_box_wrangler import BoundingBoxFilter
+import copy
 
-from lmpy.point import Point
+import numpy as np
 
-from tests.data_simulator import (
-    generate_points,
-    get_random_choice_func,
-    get_random_float_func,
-    SimulatedField,
-)
+from lmpy.data_wrangling.occurrence.bounding_box_wrangler import BoundingBoxFilter
+from lmpy.point import PointBatch
 
 
 # .....................................................................................
-def test_everything_inside():
-    """Test the BoundingBoxFilter when all points should be within the bounds."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField(
-            Point.X_ATTRIBUTE, '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField(
-            Point.Y_ATTRIBUTE, '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
-    )
+def test_everything_inside(global_points):
+    """Test the BoundingBoxFilter when all points should be within the bounds.
+
+    Args:
+        global_points (pytest.fixture): 1000 points distributed across the
+            globe.
+    """
+    points = global_points
     # Wrangle points
     wrangler = BoundingBoxFilter(-180.0, -90.0, 180.0, 90.0)
     wrangled_points = wrangler.wrangle_points(points)
@@ -39,19 +30,14 @@ def test_everything_inside():
 
 
 # .....................................................................................
-def test_everything_outside():
-    """Test the BoundingBoxFilter when all points are outside of the bounds."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField(
-            Point.X_ATTRIBUTE, '', get_random_float_func(-180.0, 0.0, 2, 6), 'float'),
-        SimulatedField(
-            Point.Y_ATTRIBUTE, '', get_random_float_func(-90.0, 0.0, 2, 6), 'float'),
-        []
-    )
+def test_everything_outside(negative_quadrant_points):
+    """Test the BoundingBoxFilter when all points are outside of the bounds.
+
+    Args:
+        negative_quadrant_points (pytest.fixture): 1000 points with negative x
+            and y values.
+    """
+    points = negative_quadrant_points
     # Wrangle points
     wrangler = BoundingBoxFilter(1.0, 1.0, 180.0, 90.0)
     wrangled_points = wrangler.wrangle_points(points)
@@ -67,19 +53,14 @@ def test_everything_outside():
 
 
 # .....................................................................................
-def test_in_and_out():
-    """Test the BoundingBoxFilter when points can be inside or outside of bounds."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField(
-            Point.X_ATTRIBUTE, '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField(
-            Point.Y_ATTRIBUTE, '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
-    )
+def test_in_and_out(global_points):
+    """Test the BoundingBoxFilter when points can be inside or outside of bounds.
+
+    Args:
+        global_points (pytest.fixture): 1000 points distributed across the
+            globe.
+    """
+    points = copy.deepcopy(global_points)
     # Wrangle points
     wrangler_config = {
         'min_x': -40.0,
@@ -110,3 +91,24 @@ def test_in_and_out():
     assert report['modified'] == len(points)
     assert report['filtered'] < len(points)
     assert report['filtered'] == num_filtered
+
+
+# .....................................................................................
+def test_batch_columns_reused(global_points, x_reads):
+    """Test that the BoundingBoxFilter uses the cached columns of a batch.
+
+    Args:
+        global_points (pytest.fixture): 1000 points distributed across the globe.
+        x_reads (pytest.fixture): A list recording reads of point x coordinates.
+    """
+    batch = PointBatch(global_points)
+    _ = batch.x, batch.y
+    num_reads = len(x_reads)
+
+    wrangler = BoundingBoxFilter(-180.0, -90.0, 180.0, 90.0)
+    wrangled_batch = wrangler.wrangle_points(batch)
+
+    assert len(wrangled_batch) == len(global_points)
+    assert np.array_equal(wrangled_batch.x, batch.x)
+    # No point coordinates were read again
+    assert len(x_reads) == num_reads
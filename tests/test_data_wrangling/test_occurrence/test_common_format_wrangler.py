@@ -1,43 +1,22 @@
 """Tests the common_format_wrangler module."""
-from lmpy.data_wrangling.occurrence.common_format_wrangler import CommonFormatWrangler
-
-from lmpy.point import Point
+import numpy as np
 
-from tests.data_simulator import (
-    generate_points,
-    get_random_choice_func,
-    get_random_float_func,
-    SimulatedField,
-)
+from lmpy.data_wrangling.occurrence.common_format_wrangler import CommonFormatWrangler
+from lmpy.point import PointBatch
 
 
 # .....................................................................................
-def test_common_format_instance():
-    """Test the CommonFormatWrangler."""
-    att_map = {
-        'in_name_a': 'out_name_a',
-        'in_name_b': 'out_name_b',
-        'in_name_c': 'out_name_c',
-    }
-
-    points = generate_points(
-        1000,
-        SimulatedField(
-            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField(
-            Point.X_ATTRIBUTE, '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField(
-            Point.Y_ATTRIBUTE, '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        [
-            SimulatedField(
-                fld_name,
-                '',
-                get_random_float_func(1, 100, 3, 5),
-                'float'
-            ) for fld_name in att_map.keys()
-        ]
-    )
+def test_common_format_instance(common_format_attribute_map, common_format_points):
+    """Test the CommonFormatWrangler.
+
+    Args:
+        common_format_attribute_map (pytest.fixture): A mapping of input attribute
+            names to output attribute names.
+        common_format_points (pytest.fixture): 1000 global points with the input
+            attributes of the attribute map.
+    """
+    att_map = common_format_attribute_map
+    points = common_format_points
 
     # Wrangle points
     wrangler = CommonFormatWrangler(att_map)
@@ -60,32 +39,20 @@ def test_common_format_instance():
 
 
 # .....................................................................................
-def test_common_format_from_config():
-    """Test the CommonFormatWrangler."""
-    att_map = {
-        'in_name_a': 'out_name_a',
-        'in_name_b': 'out_name_b',
-        'in_name_c': 'out_name_c',
-    }
-
-    points = generate_points(
-        1000,
-        SimulatedField(
-            Point.SPECIES_ATTRIBUTE, '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField(
-            Point.X_ATTRIBUTE, '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField(
-            Point.Y_ATTRIBUTE, '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        [
-            SimulatedField(
-                fld_name,
-                '',
-                get_random_float_func(1, 100, 3, 5),
-                'float'
-            ) for fld_name in att_map.keys()
-        ]
-    )
+def test_common_format_from_config(
+    common_format_attribute_map,
+    common_format_points
+):
+    """Test the CommonFormatWrangler.
+
+    Args:
+        common_format_attribute_map (pytest.fixture): A mapping of input attribute
+            names to output attribute names.
+        common_format_points (pytest.fixture): 1000 global points with the input
+            attributes of the attribute map.
+    """
+    att_map = common_format_attribute_map
+    points = common_format_points
 
     # Wrangle points
     wrangler = CommonFormatWrangler.from_config({'attribute_map': att_map})
@@ -105,3 +72,30 @@ def test_common_format_from_config():
             assert att not in pt.attributes.keys()
         for att in att_map.values():
             assert pt.get_attribute(att)
+
+
+# .....................................................................................
+def test_common_format_batch_columns(
+    common_format_attribute_map,
+    common_format_points,
+    x_reads,
+):
+    """Test that the CommonFormatWrangler keeps the cached columns of a batch.
+
+    Args:
+        common_format_attribute_map (pytest.fixture): An attribute map for testing.
+        common_format_points (pytest.fixture): Points with the attribute map inputs.
+        x_reads (pytest.fixture): A list recording reads of point x coordinates.
+    """
+    batch = PointBatch(common_format_points)
+    _ = batch.x, batch.y, batch.species_name
+    wrangler = CommonFormatWrangler(common_format_attribute_map)
+    wrangled_batch = wrangler.wrangle_points(batch)
+    num_reads = len(x_reads)
+
+    assert wrangled_batch[0] is not batch[0]
+    assert np.array_equal(wrangled_batch.x, batch.x)
+    assert np.array_equal(wrangled_batch.y, batch.y)
+    assert list(wrangled_batch.species_name) == list(batch.species_name)
+    # The columns were carried over rather than read from the new points
+    assert len(x_reads) == num_reads
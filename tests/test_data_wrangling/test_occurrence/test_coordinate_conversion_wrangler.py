@@ -2,7 +2,8 @@
 import numpy as np
 
 from lmpy.data_wrangling.occurrence.coordinate_conversion_wrangler import (
-    CoordinateConverterWrangler
+    CoordinateConverterWrangler,
+    get_coordinate_transformation,
 )
 
 from tests.data_simulator import (
@@ -53,3 +54,12 @@ def test_coordinate_conversion():
         )
 
     assert len(points) == len(wrangled_points_4326)
+
+
+# .....................................................................................
+def test_transformations_are_shared():
+    """Test that wranglers reuse transformations for the same EPSG codes."""
+    wrangler_1 = CoordinateConverterWrangler(3395, source_epsg=4326)
+    wrangler_2 = CoordinateConverterWrangler('3395', source_epsg=4326)
+    assert wrangler_1._get_transform(4326) is wrangler_2._get_transform('4326')
+    assert wrangler_1._get_transform(4326) is get_coordinate_transformation(4326, 3395)
@@ -1,28 +1,20 @@
 """Test the decimal_precision_wrangler module."""
+import copy
+
 from lmpy.data_wrangling.occurrence.decimal_precision_wrangler import (
     DecimalPrecisionFilter,
 )
 
-from tests.data_simulator import (
-    generate_points,
-    get_random_choice_func,
-    get_random_float_func,
-    SimulatedField,
-)
-
 
 # .....................................................................................
-def test_decimal_precision_filter():
-    """Test DecimalPrecisionFilter and filter out low-precision records."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            'species_name', '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 0.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 0.0, 2, 6), 'float'),
-        []
-    )
+def test_decimal_precision_filter(negative_quadrant_points):
+    """Test DecimalPrecisionFilter and filter out low-precision records.
+
+    Args:
+        negative_quadrant_points (pytest.fixture): 1000 points with negative x
+            and y values.
+    """
+    points = negative_quadrant_points
     # Wrangle points
     wrangler_config = {'decimal_places': 4}
     wrangler = DecimalPrecisionFilter.from_config(wrangler_config)
@@ -40,17 +32,14 @@ def test_decimal_precision_filter():
 
 
 # .....................................................................................
-def test_decimal_precision_filter_assess():
-    """Test DecimalPrecisionFilter and assess all records."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            'species_name', '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 0.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 0.0, 2, 6), 'float'),
-        []
-    )
+def test_decimal_precision_filter_assess(negative_quadrant_points):
+    """Test DecimalPrecisionFilter and assess all records.
+
+    Args:
+        negative_quadrant_points (pytest.fixture): 1000 points with negative x
+            and y values.
+    """
+    points = copy.deepcopy(negative_quadrant_points)
     # Wrangle points
     pass_value = 0
     fail_value = 1
@@ -1,28 +1,21 @@
 """Tests for the disjoint_geometries_wrangler module."""
+import copy
+
 from lmpy.data_wrangling.occurrence.disjoint_geometries_wrangler import (
     DisjointGeometriesFilter,
 )
-
-from tests.data_simulator import (
-    generate_points,
-    get_random_choice_func,
-    get_random_float_func,
-    SimulatedField,
-)
+from lmpy.spatial import SpatialIndex
 
 
 # .....................................................................................
-def test_everything_inside():
-    """Test the DisjointGeometriesFilter when all points within the bounds."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            'species_name', '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
-    )
+def test_everything_inside(global_points):
+    """Test the DisjointGeometriesFilter when all points within the bounds.
+
+    Args:
+        global_points (pytest.fixture): 1000 points distributed across the
+            globe.
+    """
+    points = global_points
     # Wrangle points
     wrangler = DisjointGeometriesFilter(
         [
@@ -41,17 +34,14 @@ def test_everything_inside():
 
 
 # .....................................................................................
-def test_everything_outside():
-    """Test the DisjointGeometriesFilter when all points are outside of the bounds."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            'species_name', '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 0.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 0.0, 2, 6), 'float'),
-        []
-    )
+def test_everything_outside(negative_quadrant_points):
+    """Test the DisjointGeometriesFilter when all points are outside of the bounds.
+
+    Args:
+        negative_quadrant_points (pytest.fixture): 1000 points with negative x
+            and y values.
+    """
+    points = negative_quadrant_points
     # Wrangle points
     wrangler = DisjointGeometriesFilter(['POLYGON ((1 1, 180 1, 180 90, 1 90, 1 1))'])
     wrangled_points = wrangler.wrangle_points(points)
@@ -67,17 +57,14 @@ def test_everything_outside():
 
 
 # .....................................................................................
-def test_in_and_out():
-    """Test the DisjointGeometriesFilter when points inside and outside of bounds."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            'species_name', '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
-    )
+def test_in_and_out(global_points):
+    """Test the DisjointGeometriesFilter when points inside and outside of bounds.
+
+    Args:
+        global_points (pytest.fixture): 1000 points distributed across the
+            globe.
+    """
+    points = copy.deepcopy(global_points)
     # Wrangle points
     wrangler_config = {
         'geometry_wkts': [
@@ -108,3 +95,34 @@ def test_in_and_out():
     assert report['modified'] == len(points)
     assert report['filtered'] < len(points)
     assert report['filtered'] == num_filtered
+
+
+# .....................................................................................
+def test_geometries_added_at_once(monkeypatch):
+    """Test that the geometries are added to the spatial index in one call.
+
+    Args:
+        monkeypatch (pytest.fixture): Fixture for patching class attributes.
+    """
+    added = []
+    add_features = SpatialIndex.add_features
+
+    def record_add_features(self, features):
+        added.append(list(features))
+        add_features(self, features)
+
+    def fail_add_feature(self, identifier, geom, att_dict):
+        raise AssertionError('Geometries should not be added one at a time')
+
+    monkeypatch.setattr(SpatialIndex, 'add_features', record_add_features)
+    monkeypatch.setattr(SpatialIndex, 'add_feature', fail_add_feature)
+    wrangler = DisjointGeometriesFilter(
+        [
+            'POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0))',
+            'POLYGON ((20 20, 30 20, 30 30, 20 30, 20 20))',
+        ]
+    )
+    assert len(added) == 1
+    assert [feature[0] for feature in added[0]] == [0, 1]
+    assert wrangler.geom_index.intersects(5, 5)
+    assert not wrangler.geom_index.intersects(15, 15)
@@ -108,3 +108,47 @@ def test_in_and_out():
     assert report['modified'] == len(points)
     assert report['filtered'] < len(points)
     assert report['filtered'] == num_filtered
+
+
+# .....................................................................................
+def test_threaded_matches_serial():
+    """Test that testing points with multiple threads matches testing in order."""
+    points = generate_points(
+        1000,
+        SimulatedField(
+            'species_name', '', get_random_choice_func(['Species A']), 'str'
+        ),
+        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
+        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
+        []
+    )
+    geometry_wkts = [
+        'POLYGON ((0 0, 180 0, 180 90, 0 90, 0 0))',
+        'POLYGON ((-180 -90, 0 -90, 0 0, -180 0, -180 -90))'
+    ]
+    serial_wrangler = IntersectGeometriesFilter(
+        geometry_wkts, store_attribute='serial', pass_value=0, fail_value=1
+    )
+    threaded_wrangler = IntersectGeometriesFilter(
+        geometry_wkts,
+        max_workers=4,
+        store_attribute='threaded',
+        pass_value=0,
+        fail_value=1,
+    )
+    # Each wrangler has its own copy of the geometries
+    for serial_geom, threaded_geom in zip(
+        serial_wrangler.geometries, threaded_wrangler.geometries
+    ):
+        assert serial_geom is not threaded_geom
+
+    wrangled_points = threaded_wrangler.wrangle_points(
+        serial_wrangler.wrangle_points(points)
+    )
+    assert len(wrangled_points) == len(points)
+    for pt in wrangled_points:
+        assert pt.get_attribute('serial') == pt.get_attribute('threaded')
+    assert (
+        serial_wrangler.get_report()['filtered']
+        == threaded_wrangler.get_report()['filtered']
+    )
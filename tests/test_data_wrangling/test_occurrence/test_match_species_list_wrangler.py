@@ -4,6 +4,7 @@ import numpy as np
 from lmpy.data_wrangling.occurrence.match_species_list_wrangler import (
     MatchSpeciesListWrangler,
 )
+from lmpy.point import Point
 from lmpy.species_list import SpeciesList
 
 from tests.data_simulator import (
@@ -14,14 +15,18 @@ from tests.data_simulator import (
 )
 
 
+RNG = np.random.default_rng()
+
+
 # .....................................................................................
 def test_subset_with_species_list_filter():
     """Tests that subsetting Point lists works correctly from a species list."""
     # All species
     all_species = [f'Species {i}' for i in range(100)]
-    # Shuffle species for selection in matrix
-    np.random.shuffle(all_species)
-    species_list = SpeciesList(all_species[:np.random.randint(51, 75)])
+    # Randomly select species for the species list
+    species_list = SpeciesList(
+        RNG.choice(all_species, size=RNG.integers(51, 75), replace=False).tolist()
+    )
 
     points = generate_points(
         1000,
@@ -50,9 +55,10 @@ def test_subset_with_species_list_filter_store():
     """Tests that subsetting Point lists works correctly from a species list."""
     # All species
     all_species = [f'Species {i}' for i in range(100)]
-    # Shuffle species for selection in matrix
-    np.random.shuffle(all_species)
-    species_list = SpeciesList(all_species[:np.random.randint(51, 75)])
+    # Randomly select species for the species list
+    species_list = SpeciesList(
+        RNG.choice(all_species, size=RNG.integers(51, 75), replace=False).tolist()
+    )
 
     points = generate_points(
         1000,
@@ -85,9 +91,10 @@ def test_subset_with_species_list_filename_filter(generate_temp_filename):
     """
     # All species
     all_species = [f'Species {i}' for i in range(100)]
-    # Shuffle species for selection in matrix
-    np.random.shuffle(all_species)
-    species_list = SpeciesList(all_species[:np.random.randint(51, 75)])
+    # Randomly select species for the species list
+    species_list = SpeciesList(
+        RNG.choice(all_species, size=RNG.integers(51, 75), replace=False).tolist()
+    )
     species_list_filename = generate_temp_filename(suffix='.txt')
     species_list.write(species_list_filename)
 
@@ -122,9 +129,10 @@ def test_subset_with_species_list_filename_filter_store(generate_temp_filename):
     """
     # All species
     all_species = [f'Species {i}' for i in range(100)]
-    # Shuffle species for selection in matrix
-    np.random.shuffle(all_species)
-    species_list = SpeciesList(all_species[:np.random.randint(51, 75)])
+    # Randomly select species for the species list
+    species_list = SpeciesList(
+        RNG.choice(all_species, size=RNG.integers(51, 75), replace=False).tolist()
+    )
     species_list_filename = generate_temp_filename(suffix='.txt')
     species_list.write(species_list_filename)
 
@@ -151,3 +159,20 @@ def test_subset_with_species_list_filename_filter_store(generate_temp_filename):
     assert report['assessed'] == len(points)
     assert report['modified'] == len(wrangled_points)
     assert report['filtered'] > 0
+
+
+# .....................................................................................
+def test_subset_with_species_list_from_list():
+    """Tests that a plain list of species names can be used for matching."""
+    points = [
+        Point('Species 1', 0, 0),
+        Point('Species 2', 0, 0),
+        Point('Species 1', 1, 1),
+        Point('Species 3', 0, 0),
+    ]
+    wrangler = MatchSpeciesListWrangler(['Species 1', 'Species 3'])
+    wrangled_points = wrangler.wrangle_points(points)
+
+    assert isinstance(wrangler.species_list, SpeciesList)
+    assert wrangled_points == [points[0], points[2], points[3]]
+    assert wrangler.get_report()['filtered'] == 1
@@ -1,5 +1,6 @@
 """Test the spatial_index_wrangler module."""
 from lmpy.data_wrangling.occurrence.spatial_index_wrangler import SpatialIndexFilter
+from lmpy.point import Point
 from lmpy.spatial.spatial_index import create_geometry_from_bbox, SpatialIndex
 
 from tests.data_simulator import (
@@ -52,3 +53,25 @@ def test_sptial_index_filter():
         assert -10 <= pt.x <= 10
         assert -10 <= pt.y <= 10
     assert len(wrangled_points) < len(points)
+
+
+# .....................................................................................
+def test_spatial_index_filter_unconstrained_species():
+    """Test that species without valid intersections are not filtered."""
+    sp_index = SpatialIndex()
+    sp_index.add_feature(
+        1, create_geometry_from_bbox(-10, -10, 10, 10), {'att_1': 'val_1'}
+    )
+    intersections_map = {'Species a': [], 'Species b': ['any']}
+
+    points = [
+        Point('Species a', 50.0, 50.0),
+        Point('Species c', 50.0, 50.0),
+        Point('Species b', 50.0, 50.0),
+        Point('Species b', 50.0, 50.0),
+    ]
+    wrangler = SpatialIndexFilter(sp_index, intersections_map, lambda *args: True)
+    wrangled_points = wrangler.wrangle_points(points)
+
+    assert wrangled_points == points[:2]
+    assert wrangler.get_report()['filtered'] == 2
@@ -1,36 +1,38 @@
 """Test the unique_localities_wrangler module."""
-from copy import deepcopy
+from copy import copy, deepcopy
 
 import numpy as np
+import pytest
 
 from lmpy.data_wrangling.occurrence.unique_localities_wrangler import (
     UniqueLocalitiesFilter,
 )
 
-from tests.data_simulator import (
-    generate_points,
-    get_random_choice_func,
-    get_random_float_func,
-    SimulatedField,
-)
+from lmpy.point import Point
 
 
 # .....................................................................................
-def test_unique_localities_filter():
-    """Test the UniqueLocalitiesFilter and remove duplicates."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            'species_name', '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
-    )
-
-    # Make some duplicates
-    for idx in np.random.choice(range(len(points)), size=np.random.randint(10, 100)):
-        points.append(deepcopy(points[idx]))
+def _add_duplicates(points):
+    """Append copies of randomly selected points to the list.
+
+    Args:
+        points (list of Point): A list of points to add duplicates to.
+    """
+    dup_idxs = np.random.choice(len(points), size=np.random.randint(10, 100))
+    points.extend([copy(points[idx]) for idx in dup_idxs.tolist()])
+
+
+# .....................................................................................
+def test_unique_localities_filter(global_points):
+    """Test the UniqueLocalitiesFilter and remove duplicates.
+
+    Args:
+        global_points (pytest.fixture): 1000 points distributed across the
+            globe.
+    """
+    points = list(global_points)
+
+    _add_duplicates(points)
 
     # Wrangle points
     wrangler = UniqueLocalitiesFilter()
@@ -47,21 +49,16 @@ def test_unique_localities_filter():
 
 
 # .....................................................................................
-def test_unique_localities_filter_no_reset():
-    """Test the UniqueLocalitiesFilter and remove duplicates with no reset."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            'species_name', '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
-    )
-
-    # Make some duplicates
-    for idx in np.random.choice(range(len(points)), size=np.random.randint(10, 100)):
-        points.append(deepcopy(points[idx]))
+def test_unique_localities_filter_no_reset(global_points):
+    """Test the UniqueLocalitiesFilter and remove duplicates with no reset.
+
+    Args:
+        global_points (pytest.fixture): 1000 points distributed across the
+            globe.
+    """
+    points = list(global_points)
+
+    _add_duplicates(points)
 
     # Wrangle points
     wrangler = UniqueLocalitiesFilter(do_reset=False)
@@ -84,21 +81,16 @@ def test_unique_localities_filter_no_reset():
 
 
 # .....................................................................................
-def test_unique_localities_assess():
-    """Test the UniqueLocalitiesFilter and keep assessment of records."""
-    points = generate_points(
-        1000,
-        SimulatedField(
-            'species_name', '', get_random_choice_func(['Species A']), 'str'
-        ),
-        SimulatedField('x', '', get_random_float_func(-180.0, 180.0, 2, 6), 'float'),
-        SimulatedField('y', '', get_random_float_func(-90.0, 90.0, 2, 6), 'float'),
-        []
-    )
-
-    # Make some duplicates
-    for idx in np.random.choice(range(len(points)), size=np.random.randint(10, 100)):
-        points.append(deepcopy(points[idx]))
+def test_unique_localities_assess(global_points):
+    """Test the UniqueLocalitiesFilter and keep assessment of records.
+
+    Args:
+        global_points (pytest.fixture): 1000 points distributed across the
+            globe.
+    """
+    points = deepcopy(global_points)
+
+    _add_duplicates(points)
 
     # Wrangle points
     wrangler_config = {
@@ -123,3 +115,51 @@ def test_unique_localities_assess():
             wrangler_config['store_attribute']
         ) == wrangler_config['fail_value']:
             num_filtered += 1
+
+
+# .....................................................................................
+def test_unique_localities_per_species():
+    """Test that the UniqueLocalitiesFilter keeps the first point of each locality."""
+    points = [
+        Point('Species A', 10.0, 20.0),
+        Point('Species A', 10.0, 20.0),
+        Point('Species B', 10.0, 20.0),
+        Point('Species A', 10.0, 21.0),
+        Point('Species B', 10.0, 20.0),
+    ]
+    wrangler = UniqueLocalitiesFilter()
+    wrangled_points = wrangler.wrangle_points(points)
+
+    assert wrangled_points == [points[0], points[2], points[3]]
+    assert wrangler.get_report()['filtered'] == 2
+
+
+# .....................................................................................
+def test_unique_localities_precision():
+    """Test that the UniqueLocalitiesFilter can treat nearby points as duplicates."""
+    points = [
+        Point('Species A', 10.001, 20.001),
+        Point('Species A', 10.002, 19.999),
+        Point('Species B', 10.002, 19.999),
+        Point('Species A', 10.1, 20.0),
+    ]
+    wrangler = UniqueLocalitiesFilter.from_config({'precision': 0.01})
+    wrangled_points = wrangler.wrangle_points(points)
+
+    assert wrangled_points == [points[0], points[2], points[3]]
+
+    # Single points use the same grid cells
+    assert wrangler.wrangle_single_point(points[1]) is None
+    assert wrangler.get_report()['filtered'] == 2
+
+
+# .....................................................................................
+@pytest.mark.parametrize('precision', [0, -0.01, float('inf'), float('nan')])
+def test_unique_localities_invalid_precision(precision):
+    """Test that the UniqueLocalitiesFilter rejects invalid precision values.
+
+    Args:
+        precision (float): An invalid precision value.
+    """
+    with pytest.raises(ValueError):
+        UniqueLocalitiesFilter(precision=precision)
@@ -12,7 +12,8 @@ def test_accepted_name_wrangler():
     """Tests the accepted name wrangler for species list."""
     # Name map
     name_map = {
-        f'Oldname {i}': 'Accepted {}'.format(np.random.randint(50)) for i in range(20)
+        f'Oldname {i}': f'Accepted {j}'
+        for i, j in enumerate(np.random.randint(50, size=20))
     }
     species_list = SpeciesList(list(name_map.keys()))
 
@@ -21,7 +22,7 @@ def test_accepted_name_wrangler():
     wrangled_species_list = wrangler.wrangle_species_list(species_list)
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
 
     for name in wrangled_species_list:
         assert name in accepted_names
@@ -13,7 +13,8 @@ def test_accepted_name_wrangler_tree():
     """Test the accepted_name_wrangler."""
     # Name map
     name_map = {
-        f'Oldname {i}': 'Accepted {}'.format(np.random.randint(50)) for i in range(20)
+        f'Oldname {i}': f'Accepted {j}'
+        for i, j in enumerate(np.random.randint(50, size=20))
     }
     tree = generate_tree(list(name_map.keys()))
 
@@ -22,7 +23,7 @@ def test_accepted_name_wrangler_tree():
     wrangled_tree = wrangler.wrangle_tree(tree)
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
 
     for taxon in wrangled_tree.taxon_namespace:
         assert taxon.label in accepted_names
@@ -38,7 +39,8 @@ def test_accepted_name_wrangler_unmatched_names_tree():
     """Test the Accepted Name Wrangler with unmatched names."""
     # Name map
     name_map = {
-        f'Oldname {i}': 'Accepted {}'.format(np.random.randint(50)) for i in range(10)
+        f'Oldname {i}': f'Accepted {j}'
+        for i, j in enumerate(np.random.randint(50, size=10))
     }
     raw_names = list(name_map.keys())
     raw_names.extend([f'Unmatched {i}' for i in range(10)])
@@ -50,10 +52,10 @@ def test_accepted_name_wrangler_unmatched_names_tree():
     wrangled_tree = wrangler.wrangle_tree(tree)
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
 
     # Test that names are correct
-    accepted_names = list(name_map.values())
+    accepted_names = set(name_map.values())
 
     for taxon in wrangled_tree.taxon_namespace:
         assert taxon.label in accepted_names
@@ -1,49 +1,82 @@
 """Test the match_species_list_wrangler module."""
-from copy import deepcopy
-
 import numpy as np
+import pytest
 
 from lmpy.species_list import SpeciesList
 from lmpy.data_wrangling.tree.match_species_list_wrangler import (
     MatchSpeciesListTreeWrangler,
 )
+from lmpy.tree import TreeWrapper
 
 from tests.data_simulator import generate_tree
 
 
 # .....................................................................................
-def test_match_species_list_wrangler_from_filename(generate_temp_filename):
+@pytest.fixture(scope='module')
+def shared_tree_and_species():
+    """Get a species list, tree species, and tree shared by the tests in this module.
+
+    Returns:
+        tuple: A SpeciesList, a list of tree species, and a TreeWrapper for them.
+    """
+    rng = np.random.default_rng()
+    # All species
+    all_species = [f'Species {i}' for i in range(100)]
+    # Select species for the species list
+    species_list = SpeciesList(
+        rng.choice(all_species, size=rng.integers(51, 75), replace=False).tolist()
+    )
+    # Select species for the tree
+    tree_species = rng.choice(
+        all_species, size=rng.integers(51, 75), replace=False
+    ).tolist()
+
+    # Generate test tree, generate_tree consumes the tip list
+    return species_list, tree_species, generate_tree(list(tree_species))
+
+
+# .....................................................................................
+def _clone_tree(tree):
+    """Get an independent copy of a tree, with its own taxon namespace.
+
+    Args:
+        tree (TreeWrapper): The tree to copy.
+
+    Returns:
+        TreeWrapper: A copy of the tree that can be modified.
+    """
+    return TreeWrapper.get(data=tree.as_string(schema='newick'), schema='newick')
+
+
+# .....................................................................................
+def test_match_species_list_wrangler_from_filename(
+    shared_tree_and_species,
+    generate_temp_filename,
+):
     """Test subsetting a tree from a species list file.
 
     Args:
+        shared_tree_and_species (pytest.fixture): A fixture providing a species list,
+            tree species, and a tree.
         generate_temp_filename (pytest.fixture): A fixture for generating filenames.
     """
-    # All species
-    all_species = [f'Species {i}' for i in range(100)]
-    # Shuffle species for selection in matrix
-    np.random.shuffle(all_species)
-    species_list = SpeciesList(all_species[:np.random.randint(51, 75)])
-    # Shuffle species for selection in tree
-    np.random.shuffle(all_species)
-    tree_species = all_species[:np.random.randint(51, 75)]
+    species_list, tree_species, test_tree = shared_tree_and_species
 
     species_list_filename = generate_temp_filename(suffix='.lmm')
     species_list.write(species_list_filename)
 
-    # Generate test tree
-    test_tree = generate_tree(deepcopy(tree_species))
-
-    # Wrangle
+    # Wrangle a copy, the wrangler modifies the tree in place
     wrangler = MatchSpeciesListTreeWrangler(species_list_filename)
-    wrangled_tree = wrangler.wrangle_tree(deepcopy(test_tree))
+    wrangled_tree = wrangler.wrangle_tree(_clone_tree(test_tree))
 
     # Check that the number of taxa is less than or equal to len(tree_species)
     assert len(wrangled_tree.taxon_namespace) <= len(tree_species)
 
-    # Make sure all taxa are in matrix and tree species
+    # Make sure all taxa are in species list and tree species
+    tree_species_set = set(tree_species)
     for taxon in wrangled_tree.taxon_namespace:
         assert taxon.label in species_list
-        assert taxon.label in tree_species
+        assert taxon.label in tree_species_set
 
     # Check that we purged between zero and len(tree_species) - 1
     report = wrangler.get_report()
@@ -53,31 +86,27 @@ def test_match_species_list_wrangler_from_filename(generate_temp_filename):
 
 
 # .....................................................................................
-def test_match_species_list_wrangler_from_species_list():
-    """Test subsetting a tree from a species list."""
-    # All species
-    all_species = [f'Species {i}' for i in range(100)]
-    # Shuffle species for selection in matrix
-    np.random.shuffle(all_species)
-    species_list = SpeciesList(all_species[:np.random.randint(51, 75)])
-    # Shuffle species for selection in tree
-    np.random.shuffle(all_species)
-    tree_species = all_species[:np.random.randint(51, 75)]
+def test_match_species_list_wrangler_from_species_list(shared_tree_and_species):
+    """Test subsetting a tree from a species list.
 
-    # Generate test tree
-    test_tree = generate_tree(deepcopy(tree_species))
+    Args:
+        shared_tree_and_species (pytest.fixture): A fixture providing a species list,
+            tree species, and a tree.
+    """
+    species_list, tree_species, test_tree = shared_tree_and_species
 
-    # Wrangle
+    # Wrangle a copy, the wrangler modifies the tree in place
     wrangler = MatchSpeciesListTreeWrangler(species_list)
-    wrangled_tree = wrangler.wrangle_tree(deepcopy(test_tree))
+    wrangled_tree = wrangler.wrangle_tree(_clone_tree(test_tree))
 
     # Check that the number of taxa is less than or equal to len(tree_species)
     assert len(wrangled_tree.taxon_namespace) <= len(tree_species)
 
-    # Make sure all taxa are in matrix and tree species
+    # Make sure all taxa are in species list and tree species
+    tree_species_set = set(tree_species)
     for taxon in wrangled_tree.taxon_namespace:
         assert taxon.label in species_list
-        assert taxon.label in tree_species
+        assert taxon.label in tree_species_set
 
     # Check that we purged between zero and len(tree_species) - 1
     report = wrangler.get_report()
@@ -19,50 +19,63 @@ def get_random_matrix(*dim_size):
     Returns:
         Matrix: A random matrix based on the provided parameters.
     """
-    headers = {}
-    i = 0
-    for i in range(len(dim_size)):
-        headers[str(i)] = ['header-{}-{}'.format(i, x) for x in range(dim_size[i])]
+    headers = {
+        str(i): [f'header-{i}-{x}' for x in range(size)]
+        for i, size in enumerate(dim_size)
+    }
     return Matrix(np.random.rand(*dim_size), headers=headers)
 
 
+# .............................................................................
+@pytest.fixture(scope='session')
+def saved_matrix():
+    """Get a random matrix and the bytes it saves to, shared by the load tests.
+
+    Returns:
+        tuple: A 5 by 5 Matrix and the bytes written by saving it.  The matrix should
+            not be modified.
+    """
+    orig_mtx = get_random_matrix(5, 5)
+    with io.BytesIO() as mtx_bytesio:
+        orig_mtx.save(mtx_bytesio)
+        return orig_mtx, mtx_bytesio.getvalue()
+
+
+# .............................................................................
+@pytest.fixture(scope='class')
+def matrix_10x10():
+    """Get a random 10 by 10 matrix shared by the CSV writing tests.
+
+    Returns:
+        Matrix: A random matrix with headers.  It should not be modified.
+    """
+    return get_random_matrix(10, 10)
+
+
 # .............................................................................
 class Test_Matrix:
     """Test the Matrix class."""
 
     # .....................................
-    def test_load(self, generate_temp_filename):
+    def test_load(self, generate_temp_filename, saved_matrix):
         """Test the load class method.
 
         Args:
             generate_temp_filename (pytest.fixture): Fixture for generating temp
                 filenames.
+            saved_matrix (pytest.fixture): Fixture providing a matrix and its saved
+                bytes.
         """
-        orig_mtx = get_random_matrix(5, 5)
-
-        # Create a file like object and save original matrix
-        mtx_bytesio = io.BytesIO()
-        orig_mtx.save(mtx_bytesio)
-        mtx_bytesio.seek(0)
+        orig_mtx, mtx_bytes = saved_matrix
 
-        # Attempt to load matrix
-        loaded_mtx = Matrix.load_flo(mtx_bytesio)
-        mtx_bytesio.close()
+        # Attempt to load matrix from a file like object
+        with io.BytesIO(mtx_bytes) as mtx_bytesio:
+            loaded_mtx = Matrix.load_flo(mtx_bytesio)
 
         # Verify data and headers are the same
         assert np.allclose(loaded_mtx, orig_mtx)
         assert loaded_mtx.get_headers() == orig_mtx.get_headers()
 
-        # Write to temp file
-        tmp_mtx_filename = generate_temp_filename(suffix='.lmm')
-        with open(tmp_mtx_filename, mode='wb') as out_f:
-            orig_mtx.save(out_f)
-        with open(tmp_mtx_filename, mode='rb') as in_f:
-            np_mtx = Matrix.load_flo(in_f)
-
-        # Verify that the data is the same
-        assert np.allclose(np_mtx, orig_mtx)
-
         # Verify load fails with empty file
         with pytest.raises(BadZipfile):
             mtx = Matrix.load_flo(io.BytesIO())
@@ -92,6 +105,39 @@ class Test_Matrix:
         assert np.allclose(loaded_mtx, orig_mtx)
         assert loaded_mtx.get_headers() == orig_mtx.get_headers()
 
+    # .....................................
+    @pytest.mark.parametrize('dim_size', [(5, 5), (500, 500)])
+    def test_load_csv_data(self, dim_size):
+        """Test that the load_csv method reads the data for small and large matrices.
+
+        Args:
+            dim_size (tuple of int): The number of rows and columns of the matrix.
+        """
+        orig_mtx = get_random_matrix(*dim_size)
+        csv_lines = [','.join(orig_mtx.get_column_headers())]
+        for row_header, row in zip(orig_mtx.get_row_headers(), orig_mtx.tolist()):
+            csv_lines.append(','.join([row_header] + [str(v) for v in row]))
+
+        with io.StringIO('\n'.join(csv_lines)) as in_str:
+            loaded_mtx = Matrix.load_csv(in_str, num_header_rows=1, num_header_cols=1)
+
+        assert np.array_equal(loaded_mtx, orig_mtx)
+        assert loaded_mtx.get_row_headers() == [
+            [hdr] for hdr in orig_mtx.get_row_headers()
+        ]
+
+        # Load integer data
+        with io.StringIO('a,1.0,2.0\nb,3.0,4.0') as in_str:
+            int_mtx = Matrix.load_csv(in_str, dtype=int, num_header_cols=1)
+        assert int_mtx.dtype == int
+        assert int_mtx.tolist() == [[1, 2], [3, 4]]
+
+        # Blank lines in the middle or at the end of the data are skipped
+        with io.StringIO('a,b\nr1,1,2\n\nr2,3,4\n\n') as in_str:
+            blank_mtx = Matrix.load_csv(in_str, num_header_rows=1, num_header_cols=1)
+        assert blank_mtx.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+        assert blank_mtx.get_row_headers() == [['r1'], ['r2']]
+
     # .....................................
     def test_load_csv_multi_headers(self):
         """Test the load_csv method."""
@@ -265,7 +311,7 @@ class Test_Matrix:
         assert len(row_headers) == mtx.shape[0]
 
     # .....................................
-    def test_save(self, generate_temp_filename):
+    def test_save(self, generate_temp_filename, saved_matrix):
         """Test the save method.
 
         Save should save a Matrix object to a file that can be loaded later.
@@ -273,8 +319,10 @@ class Test_Matrix:
         Args:
             generate_temp_filename (pytest.fixture): Fixture for generating temp
                 filenames.
+            saved_matrix (pytest.fixture): Fixture providing a matrix and its saved
+                bytes.
         """
-        orig_mtx = get_random_matrix(5, 5)
+        orig_mtx, _ = saved_matrix
 
         # Create a file like object and save original matrix
         mtx_filename = generate_temp_filename(suffix='.lmm')
@@ -299,14 +347,12 @@ class Test_Matrix:
 
         # Test that current column headers do not match new
         old_col_headers = mtx.get_column_headers()
-        assert not all(
-            [new_col_headers[i] == old_col_headers[i] for i in range(n_cols)]
-        )
+        assert new_col_headers != old_col_headers
 
         # Set the column headers and check that they now match
         mtx.set_column_headers(new_col_headers)
         mtx_new_headers = mtx.get_column_headers()
-        assert all([new_col_headers[i] == mtx_new_headers[i] for i in range(n_cols)])
+        assert new_col_headers == mtx_new_headers
 
     # .....................................
     def test_set_headers(self):
@@ -319,19 +365,15 @@ class Test_Matrix:
         # Test that current headers do not match new
         old_col_headers = mtx.get_column_headers()
         old_row_headers = mtx.get_row_headers()
-        assert not all(
-            [new_col_headers[i] == old_col_headers[i] for i in range(n_cols)]
-        )
-        assert not all(
-            [new_row_headers[i] == old_row_headers[i] for i in range(n_rows)]
-        )
+        assert new_col_headers != old_col_headers
+        assert new_row_headers != old_row_headers
 
         # Set the row headers and check that they now match
         mtx.set_headers({'0': new_row_headers, '1': new_col_headers})
         test_col_headers = mtx.get_column_headers()
         test_row_headers = mtx.get_row_headers()
-        assert all([new_col_headers[i] == test_col_headers[i] for i in range(n_cols)])
-        assert all([new_row_headers[i] == test_row_headers[i] for i in range(n_rows)])
+        assert new_col_headers == test_col_headers
+        assert new_row_headers == test_row_headers
 
     # .....................................
     def test_set_headers_with_dict_keys(self, generate_temp_filename):
@@ -361,14 +403,12 @@ class Test_Matrix:
 
         # Test that current row headers do not match new
         old_row_headers = mtx.get_row_headers()
-        assert not all(
-            [new_row_headers[i] == old_row_headers[i] for i in range(n_rows)]
-        )
+        assert new_row_headers != old_row_headers
 
         # Set the row headers and check that they now match
         mtx.set_row_headers(new_row_headers)
         mtx_new_headers = mtx.get_row_headers()
-        assert all([new_row_headers[i] == mtx_new_headers[i] for i in range(n_rows)])
+        assert new_row_headers == mtx_new_headers
 
     # .....................................
     def test_slice(self):
@@ -483,49 +523,73 @@ class Test_Matrix:
         _ = Matrix.load(filename)
 
     # .....................................
-    def test_write_csv_no_slice(self):
-        """Test write_csv with no slicing."""
-        mtx = get_random_matrix(10, 10)
+    def test_write_csv_no_slice(self, matrix_10x10):
+        """Test write_csv with no slicing.
+
+        Args:
+            matrix_10x10 (pytest.fixture): Fixture providing a random 10 by 10 matrix.
+        """
+        mtx = matrix_10x10
 
         with io.StringIO() as out_str:
             mtx.write_csv(out_str)
             out_str.seek(0)
 
-            # Test that csv can be read
-            for line in out_str:
-                assert len(line.split(',')) > 1
+            # Test that csv data can be read back
+            loaded = np.loadtxt(
+                out_str,
+                delimiter=',',
+                skiprows=1,
+                usecols=range(1, 11),
+            )
+            assert loaded.shape == (10, 10)
+            assert np.allclose(loaded, mtx)
 
     # .....................................
-    def test_write_csv_no_slice_list_row_headers(self):
-        """Test write_csv with no slicing and a list of row headers."""
-        mtx = get_random_matrix(10, 10)
-        o_rh = mtx.get_row_headers()
-        new_rh = []
-        for h in o_rh:
-            new_rh.append([h, 'a', 'b'])
-        mtx.set_row_headers(new_rh)
+    def test_write_csv_no_slice_list_row_headers(self, matrix_10x10):
+        """Test write_csv with no slicing and a list of row headers.
+
+        Args:
+            matrix_10x10 (pytest.fixture): Fixture providing a random 10 by 10 matrix.
+        """
+        new_rh = [[h, 'a', 'b'] for h in matrix_10x10.get_row_headers()]
+        # Set headers on a new view so the shared matrix is not modified
+        mtx = Matrix(
+            matrix_10x10,
+            headers={'0': new_rh, '1': matrix_10x10.get_column_headers()}
+        )
 
         with io.StringIO() as out_str:
             mtx.write_csv(out_str)
             out_str.seek(0)
 
-            # Test that csv can be read
-            for line in out_str:
-                assert len(line.split(',')) > 1
+            # Test that csv data can be read back
+            loaded = np.loadtxt(
+                out_str,
+                delimiter=',',
+                skiprows=1,
+                usecols=range(3, 13),
+            )
+            assert loaded.shape == (10, 10)
+            assert np.allclose(loaded, mtx)
 
     # .....................................
-    def test_write_csv_no_slice_no_row_headers(self):
-        """Test write_csv no slicing and no row headers."""
-        o_mtx = get_random_matrix(10, 10)
-        mtx = Matrix(o_mtx)
+    def test_write_csv_no_slice_no_row_headers(self, matrix_10x10):
+        """Test write_csv no slicing and no row headers.
+
+        Args:
+            matrix_10x10 (pytest.fixture): Fixture providing a random 10 by 10 matrix.
+        """
+        mtx = Matrix(matrix_10x10)
 
         with io.StringIO() as out_str:
             mtx.write_csv(out_str)
             out_str.seek(0)
 
-            # Test that csv can be read
-            for line in out_str:
-                assert len(line.split(',')) > 1
+            # Test that csv data can be read back
+            loaded = np.loadtxt(out_str, delimiter=',', usecols=range(10))
+            assert loaded.shape == (10, 10)
+            assert np.allclose(loaded, mtx)
 
     # .....................................
     def test_write_csv_slice(self):
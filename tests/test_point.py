@@ -1,4 +1,5 @@
 """Tests the occurrence_transformation module."""
+import copy
 import zipfile
 
 import numpy as np
@@ -7,6 +8,7 @@ import pytest
 from lmpy import Point
 from lmpy.point import (
     none_getter,
+    PointBatch,
     PointCsvReader,
     PointCsvWriter,
     PointDwcaReader,
@@ -98,6 +100,112 @@ class Test_Point:
         """Test the repr function."""
         assert repr(Point('Species', 0, 0))
 
+    # ..........................
+    def test_slots(self):
+        """Test that points only hold the declared attributes and can be copied."""
+        pt = Point('Species', 1, 2, attributes={'test': 3})
+        with pytest.raises(AttributeError):
+            pt.undeclared = 1
+        pt_copy = copy.deepcopy(pt)
+        assert pt_copy == pt
+        assert pt_copy.get_attribute('test') == 3
+        assert pt_copy.attributes is not pt.attributes
+
+    # ..........................
+    def test_copy(self):
+        """Test shallow and deep copies of points."""
+        pt = Point('Species', 1, 2, attributes={'flags': ['a']})
+        for pt_copy in [copy.copy(pt), copy.deepcopy(pt)]:
+            assert type(pt_copy) is Point
+            assert pt_copy == pt
+            assert pt_copy.attributes == pt.attributes
+            assert pt_copy.attributes is not pt.attributes
+            pt_copy.set_attribute('test', 1)
+            assert pt.get_attribute('test') is None
+        assert copy.copy(pt).attributes['flags'] is pt.attributes['flags']
+        assert copy.deepcopy(pt).attributes['flags'] is not pt.attributes['flags']
+
+
+# ............................................................................
+class Test_PointBatch:
+    """Test PointBatch class."""
+
+    # ..........................
+    def test_columns(self):
+        """Test that columns match the points in the batch."""
+        points = [Point('Species a', 1, 2), Point('Species b', 3, 4)]
+        batch = PointBatch(points)
+        assert len(batch) == 2
+        assert list(batch) == points
+        assert batch[1] is points[1]
+        assert list(batch.species_name) == ['Species a', 'Species b']
+        assert np.array_equal(batch.x, [1.0, 3.0])
+        assert np.array_equal(batch.y, [2.0, 4.0])
+
+    # ..........................
+    def test_get_set_attribute(self):
+        """Test getting and setting attributes for a batch."""
+        batch = PointBatch([Point('Species a', 1, 2), Point('Species b', 3, 4)])
+        assert list(batch.get_attribute('test')) == [None, None]
+        batch.set_attribute('test', np.array([1, 2]))
+        assert batch[0].get_attribute('test') == 1
+        assert isinstance(batch[1].get_attribute('test'), int)
+        batch.species_name = ['Species c', 'Species d']
+        assert batch[0].species_name == 'Species c'
+        assert batch[1].get_attribute(Point.SPECIES_ATTRIBUTE) == 'Species d'
+
+    # ..........................
+    def test_bbox_mask(self):
+        """Test finding the points of a batch within a bounding box."""
+        batch = PointBatch(
+            [
+                Point('Species a', 0, 0),
+                Point('Species a', 10, 5),
+                Point('Species a', 11, 5),
+                Point('Species a', 5, -1),
+            ]
+        )
+        assert list(batch.get_bbox_mask(0, 0, 10, 10)) == [True, True, False, False]
+
+    # ..........................
+    def test_replace_points(self):
+        """Test replacing the points of a batch, reusing cached columns."""
+        batch = PointBatch([Point('Species a', 1, 2), Point('Species b', 3, 4)])
+        _ = batch.x
+        new_points = [batch[0], Point('Species c', 5, 6)]
+        new_batch = batch.replace_points(new_points, np.array([False, True]))
+        assert list(new_batch) == new_points
+        assert np.array_equal(new_batch.x, [1.0, 5.0])
+        assert np.array_equal(new_batch.y, [2.0, 6.0])
+        assert list(new_batch.species_name) == ['Species a', 'Species c']
+        # The original batch columns are unchanged
+        assert np.array_equal(batch.x, [1.0, 3.0])
+
+    # ..........................
+    def test_with_coordinates(self):
+        """Test moving the points of a batch, keeping the cached species names."""
+        batch = PointBatch([Point('Species a', 1, 2), Point('Species b', 3, 4)])
+        _ = batch.species_name
+        new_points = [Point('Species a', 5, 6), Point('Species b', 7, 8)]
+        new_batch = batch.with_coordinates(
+            new_points, np.array([5.0, 7.0]), np.array([6.0, 8.0])
+        )
+        assert list(new_batch) == new_points
+        assert new_batch.species_name is batch.species_name
+        assert np.array_equal(new_batch.x, [5.0, 7.0])
+        assert np.array_equal(new_batch.y, [6.0, 8.0])
+
+    # ..........................
+    def test_subset(self):
+        """Test getting a subset of a batch."""
+        batch = PointBatch([Point('Species a', 1, 2), Point('Species b', 3, 4)])
+        _ = batch.x
+        sub_batch = batch.subset([False, True])
+        assert len(sub_batch) == 1
+        assert sub_batch[0] is batch[1]
+        assert np.array_equal(sub_batch.x, [3.0])
+        assert list(sub_batch.species_name) == ['Species b']
+
 
 # ............................................................................
 class Test_PointCsvReader:
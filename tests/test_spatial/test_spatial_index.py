@@ -1,6 +1,8 @@
 """Tests for the spatial_index module."""
 from lmpy.spatial.spatial_index import (
     create_geometry_from_bbox,
+    hilbert_index,
+    load_wkt_geometry,
     quadtree_index,
     SpatialIndex,
 )
@@ -21,6 +23,22 @@ class Test_create_geometry_from_bbox:
         _ = create_geometry_from_bbox(100, -20, 30, 40)
 
 
+# .............................................................................
+class Test_load_wkt_geometry:
+    """Test the load_wkt_geometry function."""
+
+    # ..........................
+    def test_returns_copies(self):
+        """Test that each call returns a geometry that can be modified safely."""
+        geom_1 = load_wkt_geometry('POINT (1 2)')
+        geom_2 = load_wkt_geometry('POINT (1 2)')
+        assert geom_1 is not geom_2
+        geom_1.SetPoint(0, 5, 6)
+        assert (geom_2.GetX(), geom_2.GetY()) == (1, 2)
+        geom_3 = load_wkt_geometry('POINT (1 2)')
+        assert (geom_3.GetX(), geom_3.GetY()) == (1, 2)
+
+
 # .............................................................................
 class Test_quadtree_index:
     """Test the quadtree_index function directly."""
@@ -163,6 +181,123 @@ class Test_SpatialIndex:
         assert hits_3['3']['att_1'] == 'val_3'
         sp_index.close()
 
+    # ..........................
+    def test_intersects(self):
+        """Test checking if a point intersects any feature of an index."""
+        sp_index = SpatialIndex()
+        sp_index.add_feature(
+            1, create_geometry_from_bbox(-10, -10, 10, 10), {'att_1': 'val_1'}
+        )
+        sp_index.add_feature(
+            2, 'POLYGON ((20 0, 40 0, 30 10, 20 0))', {'att_1': 'val_2'}
+        )
+        assert sp_index.intersects(0, 0)
+        assert sp_index.intersects(30, 2)
+        assert not sp_index.intersects(21, 9)
+        assert not sp_index.intersects(50, 50)
+        sp_index.close()
+
+    # ..........................
+    def test_add_features(self):
+        """Test adding many features to an index at once."""
+        sp_index = SpatialIndex()
+        sp_index.add_features(
+            [
+                (1, create_geometry_from_bbox(-10, -10, 10, 10), {'att_1': 'val_1'}),
+                (2, create_geometry_from_bbox(-20, -20, 20, 20), {'att_1': 'val_2'}),
+                (3, 'POLYGON ((20 0, 40 0, 30 10, 20 0))', {'att_1': 'val_3'}),
+            ]
+        )
+        hits = sp_index.search(0, 0)
+        assert len(hits) == 2
+        assert hits['1']['att_1'] == 'val_1'
+        assert hits['2']['att_1'] == 'val_2'
+        hits = sp_index.search(30, 2)
+        assert len(hits) == 1
+        assert hits['3']['att_1'] == 'val_3'
+        assert not sp_index.search(50, 50)
+        sp_index.close()
+
+    # ..........................
+    def test_add_features_to_existing(self, generate_temp_filename):
+        """Test adding many features to an index that already has features.
+
+        Args:
+            generate_temp_filename (pytest.fixture): Fixture to generate filenames.
+        """
+        sp_index = SpatialIndex(generate_temp_filename())
+        sp_index.add_feature(
+            1, create_geometry_from_bbox(-10, -10, 10, 10), {'att_1': 'val_1'}
+        )
+        sp_index.add_features(
+            [
+                (2, create_geometry_from_bbox(-20, -20, 20, 20), {'att_1': 'val_2'}),
+                (3, create_geometry_from_bbox(-30, -30, 30, 30), {'att_1': 'val_3'}),
+            ]
+        )
+        assert len(sp_index.search(0, 0)) == 3
+        assert len(sp_index.search(15, 15)) == 2
+        assert len(sp_index.search(-25, -25)) == 1
+        sp_index.close()
+
+    # ..........................
+    def test_add_feature_loads_in_hilbert_order(
+        self,
+        generate_temp_filename,
+        monkeypatch,
+    ):
+        """Test that features added one at a time are loaded in Hilbert order.
+
+        Args:
+            generate_temp_filename (pytest.fixture): Fixture to generate filenames.
+            monkeypatch (pytest.fixture): Fixture for patching class attributes.
+        """
+        inserted = []
+        insert_entry = SpatialIndex._insert_entry
+
+        def record_insert_entry(self, identifier, bbox, idx_geom):
+            inserted.append(identifier)
+            insert_entry(self, identifier, bbox, idx_geom)
+
+        monkeypatch.setattr(SpatialIndex, '_insert_entry', record_insert_entry)
+        sp_index = SpatialIndex(generate_temp_filename())
+        # Lower right, upper right, lower left, upper left
+        for identifier, bbox in enumerate(
+            [(10, 0, 20, 10), (10, 10, 20, 20), (0, 0, 10, 10), (0, 10, 10, 20)]
+        ):
+            sp_index.add_feature(
+                identifier, create_geometry_from_bbox(*bbox), {'att_1': identifier}
+            )
+        assert inserted == []
+        hits = sp_index.search(5, 15)
+        assert list(hits.keys()) == ['3']
+        # The Hilbert curve visits lower left, upper left, upper right, lower right
+        assert inserted == [2, 3, 1, 0]
+        sp_index.close()
+
+    # ..........................
+    def test_add_feature_bulk_loads_new_index(self, monkeypatch):
+        """Test that features added one at a time bulk load a new in-memory index.
+
+        Args:
+            monkeypatch (pytest.fixture): Fixture for patching class attributes.
+        """
+        def fail_insert_entry(self, identifier, bbox, idx_geom):
+            raise AssertionError('Entries should be bulk loaded')
+
+        monkeypatch.setattr(SpatialIndex, '_insert_entry', fail_insert_entry)
+        sp_index = SpatialIndex()
+        sp_index.add_feature(
+            1, create_geometry_from_bbox(-10, -10, 10, 10), {'att_1': 'val_1'}
+        )
+        sp_index.add_feature(
+            2, 'POLYGON ((20 0, 40 0, 30 10, 20 0))', {'att_1': 'val_2'}
+        )
+        assert sp_index.intersects(0, 0)
+        assert sp_index.intersects(30, 2)
+        assert not sp_index.intersects(50, 50)
+        sp_index.close()
+
     # ..........................
     def test_edges(self, generate_temp_filename):
         """Test edge cases.
@@ -184,3 +319,30 @@ class Test_SpatialIndex:
         sp_index = SpatialIndex(temp_name)
         _ = sp_index.search(-30, 0)
         sp_index.close()
+
+
+# .............................................................................
+class Test_hilbert_index:
+    """Test the hilbert_index function."""
+
+    # ..........................
+    def test_first_order(self):
+        """Test the cell order of a first order curve."""
+        assert [
+            hilbert_index(x, y, order=1) for x, y in [(0, 0), (0, 1), (1, 1), (1, 0)]
+        ] == [0, 1, 2, 3]
+
+    # ..........................
+    def test_continuous(self):
+        """Test that consecutive curve positions are neighboring cells."""
+        order = 4
+        side = 1 << order
+        cells = sorted(
+            ((x, y) for x in range(side) for y in range(side)),
+            key=lambda cell: hilbert_index(*cell, order=order)
+        )
+        assert [hilbert_index(*cell, order=order) for cell in cells] == list(
+            range(side * side)
+        )
+        for (x_1, y_1), (x_2, y_2) in zip(cells[:-1], cells[1:]):
+            assert abs(x_1 - x_2) + abs(y_1 - y_2) == 1
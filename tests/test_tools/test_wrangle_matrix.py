@@ -1,5 +1,4 @@
 """Test the wrangle matrix tool."""
-from copy import deepcopy
 import json
 
 import numpy as np
@@ -39,7 +38,7 @@ def test_wrangle_matrix(monkeypatch, generate_temp_filename):
     report_filename = generate_temp_filename(suffix='.json')
 
     # Generate and write tree
-    tree = generate_tree(deepcopy(tree_species))
+    tree = generate_tree(list(tree_species))
     tree.write(path=tree_filename, schema='newick')
 
     # Generate and write matrix
@@ -133,7 +132,7 @@ def test_wrangle_matrix_config_file(monkeypatch, generate_temp_filename):
     report_filename = generate_temp_filename(suffix='.json')
 
     # Generate and write tree
-    tree = generate_tree(deepcopy(tree_species))
+    tree = generate_tree(list(tree_species))
     tree.write(path=tree_filename, schema='newick')
 
     # Generate and write matrix
@@ -1,5 +1,4 @@
 """Test the wrangle tree tool."""
-from copy import deepcopy
 import json
 
 import numpy as np
@@ -42,7 +41,7 @@ def test_wrangle_tree(monkeypatch, generate_temp_filename):
     report_filename = generate_temp_filename(suffix='.json')
 
     # Generate and write tree
-    in_tree = generate_tree(deepcopy(tree_species))
+    in_tree = generate_tree(list(tree_species))
     in_tree.write(path=in_tree_filename, schema=in_tree_format)
 
     # Generate and write matrix
@@ -131,7 +130,7 @@ def test_wrangle_tree_script(script_runner, generate_temp_filename):
     report_filename = generate_temp_filename(suffix='.json')
 
     # Generate and write tree
-    in_tree = generate_tree(deepcopy(tree_species))
+    in_tree = generate_tree(list(tree_species))
     in_tree.write(path=in_tree_filename, schema=in_tree_format)
 
     # Generate and write matrix
@@ -218,7 +217,7 @@ def test_wrangle_tree_config_file(monkeypatch, generate_temp_filename):
     report_filename = generate_temp_filename(suffix='.json')
 
     # Generate and write tree
-    in_tree = generate_tree(deepcopy(tree_species))
+    in_tree = generate_tree(list(tree_species))
     in_tree.write(path=in_tree_filename, schema=in_tree_format)
 
     # Generate and write matrix
@@ -316,7 +315,7 @@ def test_wrangle_tree_config_file_script(script_runner, generate_temp_filename):
     report_filename = generate_temp_filename(suffix='.json')
 
     # Generate and write tree
-    in_tree = generate_tree(deepcopy(tree_species))
+    in_tree = generate_tree(list(tree_species))
     in_tree.write(path=in_tree_filename, schema=in_tree_format)
 
     # Generate and write matrix